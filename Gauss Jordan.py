@@ -1,157 +1,229 @@
 # -*- coding: utf-8 -*- # Para asegurar compatibilidad con acentos
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-import re
-import numpy as np
+from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
 
-#--------------------------------------------------------------------------
-# Función para realizar la Eliminación de Gauss-Jordan
-#--------------------------------------------------------------------------
-def eliminacion_gauss_jordan(matriz):
-    """
-    Convierte la matriz aumentada a su forma escalonada reducida por filas (RREF)
-    utilizando el método de eliminación de Gauss-Jordan.
+from gauss_jordan import (CacheEcuaciones, OperacionCancelada, SistemaDisperso, SistemaIncremental, analizar_rref,
+                          eliminacion_gauss_jordan, eliminacion_gauss_jordan_dispersa, guardar_resultado,
+                          usar_motor_disperso)
 
-    Args:
-        matriz (list or np.array): La matriz aumentada del sistema de ecuaciones.
+FRACCION_ANALISIS = 0.2       # Parte de la barra de progreso que corresponde al análisis de las ecuaciones
+INTERVALO_REVISION_MS = 50    # Cada cuánto revisa la GUI los mensajes del hilo de trabajo
 
-    Returns:
-        np.array or None: La matriz en forma escalonada reducida (RREF) o None si ocurre un error.
-    """
+#--------------------------------------------------------------------------
+# Errores de parseo
+#--------------------------------------------------------------------------
+def mostrar_error_parseo(ec, error):
+    """Muestra el diálogo de error correspondiente a una ecuación que no se pudo analizar."""
+    if isinstance(error, ValueError):
+        messagebox.showerror("Error de Formato", f"Error en la ecuación: '{ec}'\nDetalle: {error}")
+    else:
+        messagebox.showerror("Error Inesperado", f"Error procesando ecuación: '{ec}'\nDetalle: {error}")
+
+def texto_soluciones(matriz_rref, nombres_variables):
+    """Texto de la interpretación de la RREF, o el motivo por el que no se puede interpretar."""
     try:
-        matriz = np.array(matriz, dtype=float)
-        num_filas, num_cols = matriz.shape
-        fila_actual = 0
-        columna_actual = 0
-
-        while fila_actual < num_filas and columna_actual < num_cols - 1:
-            # Pivoteo Parcial
-            fila_pivote = fila_actual
-            for i in range(fila_actual + 1, num_filas):
-                if abs(matriz[i][columna_actual]) > abs(matriz[fila_pivote][columna_actual]):
-                    fila_pivote = i
-
-            if abs(matriz[fila_pivote][columna_actual]) < 1e-9:
-                columna_actual += 1
-                continue
+        return analizar_rref(matriz_rref, nombres_variables).texto()
+    except ValueError as e:
+        return str(e)
 
-            if fila_pivote != fila_actual:
-                matriz[[fila_actual, fila_pivote]] = matriz[[fila_pivote, fila_actual]]
+#--------------------------------------------------------------------------
+# Resolución en segundo plano (el hilo no toca widgets: sólo escribe en la cola)
+#--------------------------------------------------------------------------
+def resolver_en_segundo_plano(ecuaciones, cola, cancelado, cache):
+    """
+    Analiza, elimina e interpreta `ecuaciones` en un hilo de trabajo.
+
+    Envía a `cola` tuplas ("progreso", fraccion) mientras avanza y termina con
+    una de: ("resultado", matriz_rref, variables, texto), ("error_parseo",
+    ecuacion, error), ("sin_variables", inconsistente), ("error_calculo", error)
+    o ("cancelado",). Si se activa el evento `cancelado`, el trabajo se
+    interrumpe en la siguiente ecuación o columna. Las ecuaciones se analizan a
+    través de `cache` (una CacheEcuaciones), así que las que ya se analizaron al
+    agregarlas no se vuelven a analizar.
+    """
+    ultimo_porcentaje = [-1]
 
-            # Normalización
-            pivote = matriz[fila_actual][columna_actual]
-            if abs(pivote) > 1e-9:
-                 matriz[fila_actual] = matriz[fila_actual] / pivote
-            else:
-                 columna_actual += 1
-                 continue
+    def informar(fraccion):
+        # Un mensaje por punto porcentual como máximo, para no inundar la cola
+        porcentaje = int(fraccion * 100)
+        if porcentaje != ultimo_porcentaje[0]:
+            ultimo_porcentaje[0] = porcentaje
+            cola.put(("progreso", fraccion))
 
-            # Eliminación Gauss-Jordan (Ceros arriba y abajo)
-            for i in range(num_filas):
-                if i != fila_actual:
-                    factor = matriz[i][columna_actual]
-                    matriz[i] = matriz[i] - factor * matriz[fila_actual]
+    def progreso_eliminacion(hechas, total):
+        if cancelado.is_set():
+            raise OperacionCancelada()
+        informar(FRACCION_ANALISIS + (1.0 - FRACCION_ANALISIS) * hechas / max(total, 1))
 
-            fila_actual += 1
-            columna_actual += 1
+    try:
+        variables = {}
+        filas_coeficientes = []
+        lados_derechos = []
+        for k, ecuacion_str in enumerate(ecuaciones):
+            if cancelado.is_set():
+                raise OperacionCancelada()
+            try:
+                coeficientes, lado_derecho = cache.coeficientes_ecuacion(ecuacion_str, variables)
+            except Exception as e:
+                cola.put(("error_parseo", ecuacion_str, e))
+                return
+            filas_coeficientes.append({c: v for c, v in coeficientes.items() if v != 0.0})
+            lados_derechos.append(lado_derecho)
+            informar(FRACCION_ANALISIS * (k + 1) / len(ecuaciones))
+
+        if not variables:
+            # Chequear si alguna fila es inconsistente (ej: 5=3 -> lado derecho -2.0)
+            cola.put(("sin_variables", any(abs(ld) > 1e-9 for ld in lados_derechos)))
+            return
 
-        matriz = np.round(matriz, 9)
-        matriz[np.abs(matriz) < 1e-9] = 0.0
-        return matriz
+        sistema = SistemaDisperso(filas_coeficientes, lados_derechos, len(variables))
+        try:
+            if usar_motor_disperso(sistema.num_variables, sistema.densidad()):
+                reducido, _ = eliminacion_gauss_jordan_dispersa(sistema, progreso=progreso_eliminacion)
+                matriz_rref = reducido.a_densa()
+            else:
+                matriz_rref = eliminacion_gauss_jordan(sistema.a_densa(), progreso=progreso_eliminacion, sobrescribir=True)
+        except OperacionCancelada:
+            raise
+        except Exception as e:
+            cola.put(("error_calculo", e))
+            return
 
-    except Exception as e:
-        messagebox.showerror("Error en Cálculo", f"Ocurrió un error durante la eliminación Gauss-Jordan: {e}")
-        return None
+        nombres = sorted(variables, key=variables.get)
+        cola.put(("resultado", matriz_rref, variables, texto_soluciones(matriz_rref, nombres)))
+    except OperacionCancelada:
+        cola.put(("cancelado",))
 
 #--------------------------------------------------------------------------
-# Función para convertir una ecuación a matriz aumentada
+# Vista de matriz con desplazamiento virtual
 #--------------------------------------------------------------------------
-def matriz_aum(ec, variables_dict):
+def ancho_columna_matriz(matriz):
     """
-    Convierte una cadena de texto representando una ecuación lineal
-    en una fila de la matriz aumentada y actualiza el diccionario de variables.
+    Ancho común de las celdas ('{:.3f}' más dos espacios) sin formatear cada celda.
+
+    La longitud del texto crece con el valor entre los positivos y con el valor
+    absoluto entre los negativos, así que la celda más larga es el máximo o el mínimo.
     """
-    try:
-        ec = ec.strip().replace(" ", "")
-        if '=' not in ec: raise ValueError("La ecuación debe contener un signo '='.")
-        partes = ec.split('=')
-        if len(partes) != 2: raise ValueError("La ecuación debe tener solo un signo '='.")
-        izq, der_str = partes
-
-        try: der = float(der_str)
-        except ValueError: raise ValueError(f"El lado derecho ('{der_str}') debe ser un número.")
-
-        if izq.startswith('-'): izq = "-" + izq[1:].replace('-', '+-')
-        else: izq = izq.replace('-', '+-')
-        if izq.startswith('+'): izq = izq[1:]
-
-        # Regex mejorada para capturar: [signo opcional][numero opcional][variable] O [signo obligatorio][numero]
-        terminos_regex = r'([+-]?)(\d+\.?\d*|\.\d+)?([a-zA-Z_]\w*)' # Captura coef explícito o implícito 1
-        constantes_regex = r'([+-])(\d+\.?\d*|\.\d+)(?![a-zA-Z_.\w])' # Captura constantes con signo
-        constante_inicial_regex = r'^(\d+\.?\d*|\.\d+)(?![a-zA-Z_.\w])' # Captura constante inicial sin signo
-
-        coeficientes_locales = {}
-        constante_izq = 0.0
-        procesado_hasta = 0
-
-        # 1. Constante inicial sin signo
-        match_inicio = re.match(constante_inicial_regex, izq)
-        if match_inicio:
-            constante_izq += float(match_inicio.group(1))
-            procesado_hasta = match_inicio.end()
-
-        # 2. Términos con variables y coeficientes
-        for match in re.finditer(terminos_regex, izq[procesado_hasta:]):
-            signo, num_str, var = match.groups()
-            if not var: continue # No es una variable válida
-
-            coeficiente = 1.0
-            if num_str: coeficiente = float(num_str)
-            if signo == '-': coeficiente *= -1.0
-
-            if var not in variables_dict: variables_dict[var] = len(variables_dict)
-            var_index = variables_dict[var]
-            coeficientes_locales[var_index] = coeficientes_locales.get(var_index, 0.0) + coeficiente
-            # Marcar como procesado para no contarlo como constante después
-            izq = izq[:procesado_hasta + match.start()] + ' ' * (match.end() - match.start()) + izq[procesado_hasta + match.end():]
-
-
-        # 3. Constantes restantes con signo explícito
-        # Usar la versión original de izq para encontrar constantes que no eran parte de términos con variables
-        izq_temp = izq[procesado_hasta:] # Analizar solo lo que no era constante inicial
-        for match in re.finditer(constantes_regex, izq_temp):
-             # Asegurarse de que este match no esté dentro de una parte ya procesada (marcada con espacios)
-             if izq[procesado_hasta + match.start(): procesado_hasta + match.end()].strip():
-                 signo, num_str = match.groups()
-                 valor = float(num_str)
-                 constante_izq += valor if signo == '+' else -valor
-                 # Marcar como procesado
-                 izq = izq[:procesado_hasta + match.start()] + ' ' * (match.end() - match.start()) + izq[procesado_hasta + match.end():]
-
-
-        # Verificar si quedó algo no procesado que no sea solo +/- o espacios
-        resto = izq.replace('+', '').replace('-', '').replace('.', '').strip()
-        if resto:
-             raise ValueError(f"Formato inválido. Parte no reconocida: '{resto}'")
-
-
-        # Construir fila
-        lado_derecho_final = der - constante_izq
-        num_total_variables = len(variables_dict)
-        fila = [0.0] * (num_total_variables + 1)
-
-        for var_index, coef in coeficientes_locales.items():
-            if var_index < num_total_variables: fila[var_index] = coef
-
-        fila[-1] = lado_derecho_final
-        return fila, variables_dict
-
-    except ValueError as ve:
-         messagebox.showerror("Error de Formato", f"Error en la ecuación: '{ec}'\nDetalle: {ve}")
-         return None, variables_dict
-    except Exception as e:
-        messagebox.showerror("Error Inesperado", f"Error procesando ecuación: '{ec}'\nDetalle: {e}")
-        return None, variables_dict
+    return max(len(f"{float(v):.3f}") for v in (matriz.max(), matriz.min())) + 2
+
+def formatear_ventana(matriz, fila_inicio, num_filas, columna_inicio, num_columnas, ancho):
+    """Texto de una ventana de la matriz, con el mismo formato que la vista completa."""
+    total_columnas = matriz.shape[1]
+    columnas = range(columna_inicio, min(columna_inicio + num_columnas, total_columnas))
+    lineas = []
+    for fila in matriz[fila_inicio:fila_inicio + num_filas]:
+        partes = []
+        for j in columnas:
+            # Añadir barra antes de la última columna si hay más de una columna
+            if j == total_columnas - 1 and total_columnas > 1:
+                partes.append("|")
+            partes.append(f"{fila[j]:.3f}".rjust(ancho))
+        lineas.append(" ".join(partes) + "\n")
+    return "".join(lineas)
+
+class VistaMatriz(ttk.Frame):
+    """
+    Muestra una matriz formateando sólo las filas y columnas visibles.
+
+    Las barras de desplazamiento mueven una ventana sobre la matriz y cada
+    movimiento vuelve a formatear sólo esa ventana, así que el costo de
+    dibujar no depende del tamaño de la matriz.
+    """
+    def __init__(self, master, **opciones_texto):
+        super().__init__(master)
+        self.texto = tk.Text(self, wrap=tk.NONE, **opciones_texto)
+        self.barra_vertical = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar_filas)
+        self.barra_horizontal = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._desplazar_columnas)
+        self.texto.grid(row=0, column=0, sticky="nsew")
+        self.barra_vertical.grid(row=0, column=1, sticky="ns")
+        self.barra_horizontal.grid(row=1, column=0, sticky="ew")
+        self.grid_columnconfigure(0, weight=1)
+        self.texto.config(state=tk.DISABLED)
+
+        self.matriz = None
+        self.mensaje = ""
+        self.ancho = 0
+        self.fila_inicio = 0
+        self.columna_inicio = 0
+        self._ancho_caracter = max(1, tkfont.Font(font=self.texto.cget("font")).measure("0"))
+
+        self.texto.bind("<Configure>", lambda event: self._dibujar())
+        self.texto.bind("<MouseWheel>", self._rueda)
+        self.texto.bind("<Shift-MouseWheel>", lambda event: self._rueda(event, horizontal=True))
+        self.texto.bind("<Button-4>", self._rueda)
+        self.texto.bind("<Button-5>", self._rueda)
+
+    def mostrar(self, matriz):
+        self.fila_inicio = self.columna_inicio = 0
+        if matriz is None or matriz.size == 0:
+            self.matriz, self.mensaje = None, "Matriz vacía o inválida."
+        else:
+            self.matriz, self.mensaje = matriz, ""
+            self.ancho = ancho_columna_matriz(matriz)
+        self._dibujar()
+
+    def limpiar(self):
+        self.matriz, self.mensaje = None, ""
+        self._dibujar()
+
+    def _filas_visibles(self):
+        return max(1, int(self.texto.cget("height")))
+
+    def _columnas_visibles(self):
+        ancho_pixeles = self.texto.winfo_width()
+        if ancho_pixeles > 1:
+            caracteres = ancho_pixeles // self._ancho_caracter
+        else: # Aún no se dibujó el widget
+            caracteres = int(self.texto.cget("width"))
+        return max(1, (caracteres - 2) // (self.ancho + 1)) # 2 caracteres para la barra '|'
+
+    def _dibujar(self):
+        self.texto.config(state=tk.NORMAL)
+        self.texto.delete("1.0", tk.END)
+        if self.matriz is None:
+            self.texto.insert(tk.END, self.mensaje)
+            self.barra_vertical.set(0.0, 1.0)
+            self.barra_horizontal.set(0.0, 1.0)
+        else:
+            num_filas, num_cols = self.matriz.shape
+            filas_visibles, columnas_visibles = self._filas_visibles(), self._columnas_visibles()
+            self.fila_inicio = max(0, min(self.fila_inicio, num_filas - filas_visibles))
+            self.columna_inicio = max(0, min(self.columna_inicio, num_cols - columnas_visibles))
+            self.texto.insert(tk.END, formatear_ventana(self.matriz, self.fila_inicio, filas_visibles,
+                                                        self.columna_inicio, columnas_visibles, self.ancho))
+            self.barra_vertical.set(self.fila_inicio / num_filas, min(1.0, (self.fila_inicio + filas_visibles) / num_filas))
+            self.barra_horizontal.set(self.columna_inicio / num_cols, min(1.0, (self.columna_inicio + columnas_visibles) / num_cols))
+        self.texto.config(state=tk.DISABLED)
+
+    @staticmethod
+    def _nueva_posicion(inicio, total, visibles, args):
+        """Traduce un comando de ttk.Scrollbar ('moveto' o 'scroll') a la nueva primera fila o columna."""
+        if args[0] == "moveto":
+            inicio = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            inicio += int(args[1]) * (visibles if args[2] == "pages" else 1)
+        return max(0, min(inicio, total - visibles))
+
+    def _desplazar_filas(self, *args):
+        if self.matriz is not None:
+            self.fila_inicio = self._nueva_posicion(self.fila_inicio, self.matriz.shape[0], self._filas_visibles(), args)
+            self._dibujar()
+
+    def _desplazar_columnas(self, *args):
+        if self.matriz is not None:
+            self.columna_inicio = self._nueva_posicion(self.columna_inicio, self.matriz.shape[1], self._columnas_visibles(), args)
+            self._dibujar()
+
+    def _rueda(self, event, horizontal=False):
+        paso = -1 if event.num == 4 or getattr(event, "delta", 0) > 0 else 1
+        if horizontal:
+            self._desplazar_columnas("scroll", paso, "units")
+        else:
+            self._desplazar_filas("scroll", paso, "units")
+        return "break"
 
 #--------------------------------------------------------------------------
 # Interfaz Gráfica (GUI)
@@ -176,6 +248,10 @@ class SistemaEcuacionesGUI:
         # --- Variables de instancia ---
         self.ecuaciones_ingresadas = []
         self.variables_encontradas = {}
+        self.cache_ecuaciones = CacheEcuaciones() # Cada ecuación se analiza una vez, al agregarla
+        self.sistema_incremental = SistemaIncremental(self.cache_ecuaciones) # RREF mantenida al agregar cada ecuación
+        self.trabajo = None # (cola, evento de cancelación) de la resolución en curso
+        self.resultado_mostrado = None # (matriz RREF, nombres de variables) de la solución en pantalla, para exportarla
 
         # --- Widgets ---
         self.ecuacion_label = ttk.Label(master, text="Ingrese la ecuación (ej: 2x + 3y = 5):")
@@ -192,14 +268,21 @@ class SistemaEcuacionesGUI:
         self.ecuaciones_listbox = tk.Listbox(master, width=70, height=7, bg="#3B4252", fg="#ECEFF4", selectbackground="#81A1C1", selectforeground="#2E3440", highlightthickness=1, highlightbackground="#4C566A", highlightcolor="#5E81AC", relief="flat", font=('Consolas', 10))
         self.ecuaciones_listbox.grid(row=3, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
-        self.resolver_button = ttk.Button(master, text="Resolver Sistema (Gauss-Jordan)", command=self.resolver_sistema)
-        self.resolver_button.grid(row=4, column=0, columnspan=2, pady=10)
+        self.acciones_frame = ttk.Frame(master)
+        self.acciones_frame.grid(row=4, column=0, columnspan=2, pady=10)
+        self.resolver_button = ttk.Button(self.acciones_frame, text="Resolver Sistema (Gauss-Jordan)", command=self.resolver_sistema)
+        self.resolver_button.pack(side=tk.LEFT, padx=5)
+        self.cancelar_button = ttk.Button(self.acciones_frame, text="Cancelar", command=self.cancelar_resolucion, state=tk.DISABLED)
+        self.cancelar_button.pack(side=tk.LEFT, padx=5)
+        self.progreso_bar = ttk.Progressbar(self.acciones_frame, length=200, maximum=1.0, mode="determinate")
+        self.progreso_bar.pack(side=tk.LEFT, padx=5)
+        self.exportar_button = ttk.Button(self.acciones_frame, text="Exportar Resultado", command=self.exportar_resultado)
+        self.exportar_button.pack(side=tk.LEFT, padx=5)
 
         self.matriz_resuelta_label = ttk.Label(master, text="Matriz:")
         self.matriz_resuelta_label.grid(row=5, column=0, padx=10, pady=(10, 2), sticky="w")
-        self.matriz_text = tk.Text(master, width=70, height=7, bg="#3B4252", fg="#ECEFF4", insertbackground="#ECEFF4", relief="flat", font=('Consolas', 10), highlightthickness=1, highlightbackground="#4C566A", highlightcolor="#5E81AC", wrap=tk.NONE)
-        self.matriz_text.grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
-        self.matriz_text.config(state=tk.DISABLED)
+        self.vista_matriz = VistaMatriz(master, width=70, height=7, bg="#3B4252", fg="#ECEFF4", insertbackground="#ECEFF4", relief="flat", font=('Consolas', 10), highlightthickness=1, highlightbackground="#4C566A", highlightcolor="#5E81AC")
+        self.vista_matriz.grid(row=6, column=0, columnspan=2, padx=10, pady=5, sticky="ew")
 
         self.soluciones_label = ttk.Label(master, text="Interpretación de la Solución:")
         self.soluciones_label.grid(row=7, column=0, padx=10, pady=(10, 2), sticky="w")
@@ -226,28 +309,34 @@ class SistemaEcuacionesGUI:
             messagebox.showwarning("Formato Inválido", "La ecuación debe contener exactamente un signo '='.")
             return
 
-        # Intento preliminar de parseo para validación temprana
-        temp_vars = self.variables_encontradas.copy() # No modificar el diccionario real aún
-        fila_test, _ = matriz_aum(ecuacion, temp_vars)
-        if fila_test is None:
-             # El error ya se mostró en matriz_aum
-             return
+        # Reducir sólo la nueva fila contra la RREF actual (si falla, el sistema no cambia)
+        try:
+            self.sistema_incremental.agregar_ecuacion(ecuacion)
+        except Exception as e:
+            mostrar_error_parseo(ecuacion, e)
+            return
 
+        self.cancelar_resolucion() # Su resultado ya no correspondería al sistema
         self.ecuaciones_ingresadas.append(ecuacion)
         self.ecuaciones_listbox.insert(tk.END, ecuacion)
         self.ecuacion_entry.delete(0, tk.END)
-        self.limpiar_resultados()
+
+        # Resultados en vivo a partir de la RREF incremental
+        matriz_rref = self.sistema_incremental.rref()
+        self.vista_matriz.mostrar(matriz_rref)
+        self.interpretar_y_mostrar_soluciones(matriz_rref, self.sistema_incremental.nombres_variables())
 
     def limpiar_resultados(self):
-        for text_widget in [self.matriz_text, self.soluciones_text]:
-            text_widget.config(state=tk.NORMAL)
-            text_widget.delete("1.0", tk.END)
-            text_widget.config(state=tk.DISABLED)
+        self.resultado_mostrado = None
+        self.vista_matriz.limpiar()
+        self.mostrar_soluciones("")
 
     def limpiar_todo(self):
+        self.cancelar_resolucion()
         self.ecuacion_entry.delete(0, tk.END)
         self.ecuaciones_ingresadas.clear()
         self.variables_encontradas.clear()
+        self.sistema_incremental = SistemaIncremental(self.cache_ecuaciones)
         self.ecuaciones_listbox.delete(0, tk.END)
         self.limpiar_resultados()
 
@@ -256,239 +345,98 @@ class SistemaEcuacionesGUI:
             messagebox.showinfo("Sin Ecuaciones", "No se han ingresado ecuaciones para resolver.")
             return
 
-        self.variables_encontradas = {}
-        matriz_aumentada_filas = []
-        error_parseo = False
-
-        for ecuacion_str in self.ecuaciones_ingresadas:
-            fila, self.variables_encontradas = matriz_aum(ecuacion_str, self.variables_encontradas)
-            if fila is None:
-                error_parseo = True
-                break
-            matriz_aumentada_filas.append(fila)
-
-        if error_parseo:
-             self.limpiar_resultados(); return
-
-        num_vars_final = len(self.variables_encontradas)
-        if num_vars_final == 0 and matriz_aumentada_filas:
-            # Chequear si alguna fila es inconsistente (ej: 5=3 -> fila=[-2.0])
-            if any(abs(f[0]) > 1e-9 for f in matriz_aumentada_filas):
-                 messagebox.showerror("Error", "Sistema inconsistente detectado (constantes desiguales).")
-            else: # Todas son identidades (ej: 5=5 -> fila=[0.0])
-                 messagebox.showinfo("Info", "Las ecuaciones son identidades (ej: 5=5) o no contienen variables.")
-            self.limpiar_resultados(); return
-        elif not matriz_aumentada_filas:
-             messagebox.showerror("Error", "No se pudo construir la matriz."); return
-
-        matriz_completa = []
-        for fila in matriz_aumentada_filas:
-             fila_coef = fila[:-1]; fila_res = fila[-1]
-             fila_ajustada = fila_coef + [0.0] * (num_vars_final - len(fila_coef)) + [fila_res]
-             # Asegurar longitud correcta incluso si num_vars_final=0
-             if num_vars_final == 0: fila_ajustada=[fila_res]
-
-             # Corregir longitud si la fila original tenía más "variables" que las finales encontradas
-             # (esto no debería pasar con la lógica actual de matriz_aum, pero por seguridad)
-             matriz_completa.append(fila_ajustada[:num_vars_final+1])
-
-
-        if not matriz_completa:
-             messagebox.showerror("Error", "No se pudo construir la matriz final."); return
-
-        matriz_np = np.array(matriz_completa, dtype=float)
-        matriz_resuelta_rref = eliminacion_gauss_jordan(matriz_np)
-
-        if matriz_resuelta_rref is not None:
-            self.mostrar_matriz_en_text(self.matriz_text, matriz_resuelta_rref)
-            nombres_variables_ordenados = sorted(self.variables_encontradas.keys(), key=lambda v: self.variables_encontradas[v])
-            # Pasar la matriz RREF a la función de interpretación
-            self.interpretar_y_mostrar_soluciones(matriz_resuelta_rref, nombres_variables_ordenados)
-        else:
-            self.limpiar_resultados()
-
-
-    def mostrar_matriz_en_text(self, text_widget, matriz):
-        text_widget.config(state=tk.NORMAL)
-        text_widget.delete("1.0", tk.END)
-        if matriz is None or matriz.size == 0:
-            text_widget.insert(tk.END, "Matriz vacía o inválida.")
-            text_widget.config(state=tk.DISABLED)
+        # El análisis y la eliminación corren en un hilo; la GUI sólo revisa la cola con after()
+        self.cancelar_resolucion()
+        cola, cancelado = queue.Queue(), threading.Event()
+        self.trabajo = (cola, cancelado)
+        hilo = threading.Thread(target=resolver_en_segundo_plano, daemon=True,
+                                args=(list(self.ecuaciones_ingresadas), cola, cancelado, self.cache_ecuaciones))
+        self.resolver_button.config(state=tk.DISABLED)
+        self.cancelar_button.config(state=tk.NORMAL)
+        self.progreso_bar["value"] = 0.0
+        hilo.start()
+        self.master.after(INTERVALO_REVISION_MS, self._revisar_trabajo, self.trabajo)
+
+    def cancelar_resolucion(self):
+        """Pide al hilo en curso que se detenga; sus mensajes pendientes se ignoran."""
+        if self.trabajo is not None:
+            self.trabajo[1].set()
+            self.trabajo = None
+            self._restaurar_controles()
+
+    def _restaurar_controles(self):
+        self.resolver_button.config(state=tk.NORMAL)
+        self.cancelar_button.config(state=tk.DISABLED)
+        self.progreso_bar["value"] = 0.0
+
+    def _revisar_trabajo(self, trabajo):
+        if trabajo is not self.trabajo:
+            return # Cancelado o reemplazado por otra resolución
+        cola = trabajo[0]
+        while True:
+            try:
+                mensaje = cola.get_nowait()
+            except queue.Empty:
+                self.master.after(INTERVALO_REVISION_MS, self._revisar_trabajo, trabajo)
+                return
+            if mensaje[0] == "progreso":
+                self.progreso_bar["value"] = mensaje[1]
+                continue
+            self.trabajo = None
+            self._restaurar_controles()
+            self._mostrar_fin_trabajo(mensaje)
             return
 
-        num_filas, num_cols = matriz.shape
-        if num_cols == 0: # Manejar matriz sin columnas
-             text_widget.insert(tk.END, "[Matriz sin columnas]\n" * num_filas)
-             text_widget.config(state=tk.DISABLED)
-             return
-
-        max_len = 0
-        for fila in matriz:
-            for num in fila:
-                 s = f"{num:.3f}"; max_len = max(max_len, len(s))
-        col_width = max_len + 2
-
-        matriz_str = ""
-        for i in range(num_filas):
-            fila_str_list = []
-            for j in range(num_cols):
-                num_str = f"{matriz[i, j]:.3f}"
-                # Añadir barra antes de la última columna si hay más de una columna
-                if j == num_cols - 1 and num_cols > 1:
-                    fila_str_list.append("|")
-                fila_str_list.append(num_str.rjust(col_width))
-            matriz_str += " ".join(fila_str_list) + "\n"
-
-        text_widget.insert(tk.END, matriz_str)
-        text_widget.config(state=tk.DISABLED)
-
-
-    # --- COMIENZO DE LA SECCIÓN CORREGIDA ---
+    def _mostrar_fin_trabajo(self, mensaje):
+        tipo = mensaje[0]
+        if tipo == "resultado":
+            _, matriz_resuelta_rref, self.variables_encontradas, texto = mensaje
+            self.resultado_mostrado = (matriz_resuelta_rref, sorted(self.variables_encontradas, key=self.variables_encontradas.get))
+            self.vista_matriz.mostrar(matriz_resuelta_rref)
+            self.mostrar_soluciones(texto)
+        elif tipo == "error_parseo":
+            mostrar_error_parseo(mensaje[1], mensaje[2])
+            self.limpiar_resultados()
+        elif tipo == "sin_variables":
+            if mensaje[1]:
+                messagebox.showerror("Error", "Sistema inconsistente detectado (constantes desiguales).")
+            else: # Todas son identidades (ej: 5=5 -> lado derecho 0.0)
+                messagebox.showinfo("Info", "Las ecuaciones son identidades (ej: 5=5) o no contienen variables.")
+            self.limpiar_resultados()
+        elif tipo == "error_calculo":
+            messagebox.showerror("Error en Cálculo", f"Ocurrió un error durante la eliminación Gauss-Jordan: {mensaje[1]}")
+            self.limpiar_resultados()
+
     def interpretar_y_mostrar_soluciones(self, matriz_rref, nombres_variables):
         """Interpreta la matriz en RREF y muestra las soluciones."""
-        self.soluciones_text.config(state=tk.NORMAL)
-        self.soluciones_text.delete("1.0", tk.END)
+        self.resultado_mostrado = (matriz_rref, list(nombres_variables))
+        self.mostrar_soluciones(texto_soluciones(matriz_rref, nombres_variables))
 
-        if matriz_rref is None or matriz_rref.size == 0:
-             self.soluciones_text.insert(tk.END, "No se puede determinar la solución (matriz RREF inválida).") # CORREGIDO
-             self.soluciones_text.config(state=tk.DISABLED)
-             return
-
-        num_filas, num_cols = matriz_rref.shape
-        num_variables = len(nombres_variables)
-
-        if num_cols == 0:
-             self.soluciones_text.insert(tk.END, "Matriz RREF vacía.") # CORREGIDO
-             self.soluciones_text.config(state=tk.DISABLED)
-             return
-        # Si hay variables, debe haber al menos num_variables + 1 columnas
-        if num_variables > 0 and num_cols <= num_variables:
-            self.soluciones_text.insert(tk.END, f"Error: Dimensiones inconsistentes en RREF (Variables: {num_variables}, Columnas: {num_cols}).") # CORREGIDO
-            self.soluciones_text.config(state=tk.DISABLED)
+    def exportar_resultado(self):
+        """Guarda la RREF y la solución en pantalla en un NPZ, con precisión completa."""
+        if self.resultado_mostrado is None:
+            messagebox.showinfo("Sin Resultado", "No hay ningún resultado para exportar.")
             return
-        # Si no hay variables (num_variables=0), debe haber 1 columna (resultado)
-        if num_variables == 0 and num_cols != 1:
-             self.soluciones_text.insert(tk.END, f"Error: Dimensiones inconsistentes en RREF (Sin variables, Columnas: {num_cols}).") # CORREGIDO
-             self.soluciones_text.config(state=tk.DISABLED)
-             return
-
-
-        # --- Chequeo de Inconsistencia (Fila [0 0 ... 0 | k] con k != 0) ---
-        inconsistente = False
-        for i in range(num_filas):
-            # Coeficientes son todas las columnas excepto la última (si existe)
-            coeficientes_fila = matriz_rref[i, :num_variables]
-            # Resultado es la última columna
-            resultado_fila = matriz_rref[i, -1]
-            # Comprobar si TODOS los coeficientes son ~0
-            if np.all(np.abs(coeficientes_fila) < 1e-9):
-                # Si además el resultado NO es ~0, es inconsistente
-                if abs(resultado_fila) > 1e-9:
-                    self.soluciones_text.insert(tk.END, "El sistema es INCONSISTENTE (no tiene solución).\n") # CORREGIDO
-                    self.soluciones_text.insert(tk.END, f"(Se encontró una fila tipo [ 0 ... 0 | {resultado_fila:.3f} ≠ 0 ])\n") # CORREGIDO
-                    inconsistente = True
-                    break # No hay más que analizar
-
-        if inconsistente:
-            self.soluciones_text.config(state=tk.DISABLED)
+        ruta = filedialog.asksaveasfilename(title="Exportar resultado", defaultextension=".npz",
+                                            filetypes=[("Resultado NumPy (NPZ)", "*.npz")])
+        if not ruta:
             return
-
-        # Si no hay variables y llegamos aquí, el sistema es consistente (e.g. 0=0)
-        if num_variables == 0:
-             self.soluciones_text.insert(tk.END, "El sistema es consistente (ej: 0 = 0) y no tiene variables.") # CORREGIDO
-             self.soluciones_text.config(state=tk.DISABLED)
-             return
-
-
-        # --- Identificación de Pivotes y Rango ---
-        pivote_cols = []
-        for r in range(num_filas):
-             primer_no_cero_col = -1
-             # Buscar primer no-cero en la parte de coeficientes
-             for c in range(num_variables):
-                 if abs(matriz_rref[r, c]) > 1e-9:
-                      primer_no_cero_col = c
-                      break
-             # Si se encontró un primer no-cero y es ~1 y es el único en su columna -> es pivote
-             if primer_no_cero_col != -1 and abs(matriz_rref[r, primer_no_cero_col] - 1.0) < 1e-9:
-                 if abs(np.sum(np.abs(matriz_rref[:, primer_no_cero_col])) - 1.0) < 1e-9:
-                     # Asegurar que no añadamos la misma columna de pivote dos veces
-                     if primer_no_cero_col not in pivote_cols:
-                          pivote_cols.append(primer_no_cero_col)
-
-        rango = len(pivote_cols) # Rango es el número de pivotes
-
-        # --- Determinar Tipo de Solución ---
-        if rango < num_variables:
-            # --- Infinitas Soluciones ---
-            self.soluciones_text.insert(tk.END, "El sistema tiene INFINITAS SOLUCIONES.\n") # CORREGIDO
-            variables_libres_indices = [idx for idx in range(num_variables) if idx not in pivote_cols]
-            variables_libres_nombres = [nombres_variables[idx] for idx in variables_libres_indices]
-
-            if variables_libres_nombres:
-                 self.soluciones_text.insert(tk.END, f"Variables libres: {', '.join(variables_libres_nombres)}\n\n") # CORREGIDO
-            else:
-                 self.soluciones_text.insert(tk.END, "(Sistema dependiente, sin variables libres explícitas)\n\n") # CORREGIDO
-
-            # Expresar variables básicas (con pivote) en términos de las libres
-            for var_idx_basica in pivote_cols:
-                nombre_var_basica = nombres_variables[var_idx_basica]
-                fila_pivote_actual = -1
-                for r in range(num_filas):
-                     if abs(matriz_rref[r, var_idx_basica] - 1.0) < 1e-9:
-                          fila_pivote_actual = r; break
-
-                if fila_pivote_actual != -1:
-                    resultado = matriz_rref[fila_pivote_actual, -1]
-                    expresion = f"{nombre_var_basica} = {resultado:.3f}"
-                    for libre_idx in variables_libres_indices:
-                        coef = matriz_rref[fila_pivote_actual, libre_idx]
-                        if abs(coef) > 1e-9:
-                            expresion += f" {-coef:+.3f}{nombres_variables[libre_idx]}"
-                    self.soluciones_text.insert(tk.END, expresion + "\n") # CORREGIDO
-                else:
-                    self.soluciones_text.insert(tk.END, f"Error interno: No se encontró fila de pivote para {nombre_var_basica}\n") # CORREGIDO
-
-        elif rango == num_variables:
-             # --- Solución Única ---
-             self.soluciones_text.insert(tk.END, "El sistema tiene SOLUCIÓN ÚNICA:\n") # CORREGIDO
-             for var_idx in range(num_variables):
-                  fila_pivote_actual = -1
-                  for r in range(num_filas):
-                       if abs(matriz_rref[r, var_idx] - 1.0) < 1e-9:
-                            fila_pivote_actual = r; break
-                  if fila_pivote_actual != -1:
-                      nombre_variable = nombres_variables[var_idx]
-                      valor_variable = matriz_rref[fila_pivote_actual, -1]
-                      self.soluciones_text.insert(tk.END, f"{nombre_variable} = {valor_variable:.3f}\n") # CORREGIDO
-                  else:
-                       # Puede pasar si hay filas de ceros, pero debería haber un pivote para cada variable si rango=num_vars
-                       # O si la RREF no es perfecta.
-                       # Buscar si la variable tiene solución en alguna fila aunque no sea pivote perfecto
-                       solucion_encontrada = False
-                       for r in range(num_filas):
-                           # Si esta fila define principalmente esta variable (coef es ~1) y otros coef son ~0
-                           if abs(matriz_rref[r, var_idx]) > 1e-9: # Coef no cero para nuestra variable
-                               # ¿Es el único coeficiente significativo en la fila?
-                               otros_coef_significativos = False
-                               for c in range(num_variables):
-                                   if c != var_idx and abs(matriz_rref[r, c]) > 1e-9:
-                                       otros_coef_significativos = True; break
-                               if not otros_coef_significativos:
-                                    # Podemos despejarla desde aquí
-                                    valor_variable = matriz_rref[r, -1] / matriz_rref[r, var_idx]
-                                    self.soluciones_text.insert(tk.END, f"{nombres_variables[var_idx]} ≈ {valor_variable:.3f} (calculado)\n") # CORREGIDO
-                                    solucion_encontrada = True; break
-                       if not solucion_encontrada:
-                           self.soluciones_text.insert(tk.END, f"Advertencia: No se pudo determinar un valor claro para '{nombres_variables[var_idx]}'\n") # CORREGIDO
-
-
+        matriz_rref, nombres = self.resultado_mostrado
+        try:
+            guardar_resultado(ruta, analizar_rref(matriz_rref, nombres), matriz_rref)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error al Exportar", f"No se pudo guardar el resultado: {e}")
+
+    def mostrar_soluciones(self, texto):
+        """Reemplaza el texto de soluciones con una sola inserción."""
+        self.soluciones_text.config(state=tk.NORMAL)
+        self.soluciones_text.delete("1.0", tk.END)
+        self.soluciones_text.insert(tk.END, texto)
         self.soluciones_text.config(state=tk.DISABLED)
-    # --- FIN DE LA SECCIÓN CORREGIDA ---
 
 
 # --- Ejecución Principal ---
 if __name__ == "__main__":
     root = tk.Tk()
     app = SistemaEcuacionesGUI(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
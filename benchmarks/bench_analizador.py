@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark del analizador de ecuaciones: analizador original con expresiones
+regulares y reescritura de la cadena frente al analizador de una sola pasada
+y a la carga en bloque con matriz_desde_ecuaciones. Después mide la caché de
+ecuaciones (CacheEcuaciones) con sistemas que repiten ecuaciones de un conjunto
+común, como en los trabajos por lotes.
+
+Uso:
+    python benchmarks/bench_analizador.py [--terminos 10 100 1000 10000] [--ecuaciones 2000]
+                                          [--distintas 500] [--sistemas 2000]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def analizador_referencia(ec, variables_dict):
+    """Analizador original (cuadrático en la longitud de la ecuación), usado como línea base."""
+    ec = ec.strip().replace(" ", "")
+    izq, der_str = ec.split('=')
+    der = float(der_str)
+    if izq.startswith('-'): izq = "-" + izq[1:].replace('-', '+-')
+    else: izq = izq.replace('-', '+-')
+    if izq.startswith('+'): izq = izq[1:]
+    terminos_regex = r'([+-]?)(\d+\.?\d*|\.\d+)?([a-zA-Z_]\w*)'
+    constantes_regex = r'([+-])(\d+\.?\d*|\.\d+)(?![a-zA-Z_.\w])'
+    coeficientes_locales = {}
+    constante_izq = 0.0
+    for match in re.finditer(terminos_regex, izq):
+        signo, num_str, var = match.groups()
+        coeficiente = float(num_str) if num_str else 1.0
+        if signo == '-': coeficiente *= -1.0
+        if var not in variables_dict: variables_dict[var] = len(variables_dict)
+        var_index = variables_dict[var]
+        coeficientes_locales[var_index] = coeficientes_locales.get(var_index, 0.0) + coeficiente
+        izq = izq[:match.start()] + ' ' * (match.end() - match.start()) + izq[match.end():]
+    for match in re.finditer(constantes_regex, izq):
+        if izq[match.start():match.end()].strip():
+            signo, num_str = match.groups()
+            constante_izq += float(num_str) if signo == '+' else -float(num_str)
+            izq = izq[:match.start()] + ' ' * (match.end() - match.start()) + izq[match.end():]
+    return coeficientes_locales, der - constante_izq
+
+def generar_ecuaciones(rng, cantidad, terminos, num_variables):
+    ecuaciones = []
+    for _ in range(cantidad):
+        indices = rng.integers(0, num_variables, size=terminos)
+        coeficientes = rng.integers(1, 100, size=terminos)
+        signos = rng.choice(["+", "-"], size=terminos)
+        cuerpo = " ".join(f"{s} {c}x{i}" for s, c, i in zip(signos, coeficientes, indices))
+        ecuaciones.append(f"{cuerpo} + 7 = {rng.integers(-50, 50)}")
+    return ecuaciones
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del analizador de ecuaciones.")
+    parser.add_argument("--terminos", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--ecuaciones", type=int, default=2000)
+    parser.add_argument("--variables", type=int, default=5000)
+    parser.add_argument("--distintas", type=int, default=500, help="Ecuaciones distintas del conjunto común.")
+    parser.add_argument("--sistemas", type=int, default=2000, help="Sistemas que se arman con ese conjunto.")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'términos':>9} {'ecuaciones':>11} {'referencia (s)':>15} {'una pasada (s)':>15} {'en bloque (s)':>14} {'aceleración':>12}")
+    for terminos in args.terminos:
+        cantidad = max(1, args.ecuaciones * 10 // terminos)
+        ecuaciones = generar_ecuaciones(rng, cantidad, terminos, args.variables)
+
+        t_ref = medir(lambda: [analizador_referencia(ec, {}) for ec in ecuaciones])
+        variables = {}
+        t_pasada = medir(lambda: [gj.coeficientes_ecuacion(ec, variables) for ec in ecuaciones])
+        t_bloque = medir(lambda: gj.matriz_desde_ecuaciones(ecuaciones))
+
+        print(f"{terminos:>9} {cantidad:>11} {t_ref:>15.4f} {t_pasada:>15.4f} {t_bloque:>14.4f} {t_ref / t_pasada:>12.1f}")
+
+    # Sistemas de 10 ecuaciones tomadas de un conjunto común (con los espacios variando)
+    print(f"\n{args.sistemas} sistemas de 10 ecuaciones tomadas de {args.distintas} distintas")
+    print(f"{'términos':>9} {'sin caché (s)':>14} {'con caché (s)':>14} {'aceleración':>12} {'aciertos':>9}")
+    for terminos in args.terminos:
+        if terminos > 1000:
+            continue
+        comunes = generar_ecuaciones(rng, args.distintas, terminos, 50)
+        sistemas = [[comunes[k].replace(" ", "  ") if k % 2 else comunes[k] for k in rng.integers(0, len(comunes), 10)]
+                    for _ in range(args.sistemas)]
+        t_sin = medir(lambda: [gj.matriz_desde_ecuaciones(s) for s in sistemas])
+        cache = gj.CacheEcuaciones()
+        t_con = medir(lambda: [gj.matriz_desde_ecuaciones(s, cache=cache) for s in sistemas])
+        tasa = cache.estadisticas()["tasa_aciertos"]
+        print(f"{terminos:>9} {t_sin:>14.4f} {t_con:>14.4f} {t_sin / t_con:>12.1f} {tasa:>9.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de carga de sistemas: analizar el sistema como ecuaciones de texto
+frente a cargarlo de NPZ comprimido, de NPZ sin comprimir mapeado en memoria y
+de Matrix Market. Informa el tamaño de cada archivo, el tiempo de carga hasta
+tener la matriz aumentada lista para eliminar y la diferencia con el texto
+(los formatos binarios conservan los 17 dígitos; el texto, los que se escriban).
+Al final mide guardar y cargar el resultado (RREF incluida) en NPZ.
+
+Uso:
+    python benchmarks/bench_archivos.py [--tamanos 200 1000 2000] [--densidad 1.0] [--repeticiones 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+MB = 2**20
+
+def mejor_tiempo(funcion, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+def generar(rng, n, densidad):
+    coeficientes = rng.uniform(-100, 100, (n, n)) * (rng.random((n, n)) < densidad)
+    coeficientes[np.arange(n), np.arange(n)] += 1000.0
+    return coeficientes, rng.uniform(-100, 100, n)
+
+def escribir_texto(ruta, coeficientes, lados_derechos):
+    nombres = [f"x{j + 1}" for j in range(coeficientes.shape[1])]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for fila, lado_derecho in zip(coeficientes, lados_derechos):
+            terminos = " ".join(f"{v:+.6f}{nombres[j]}" for j, v in zip(np.flatnonzero(fila), fila[fila != 0]))
+            archivo.write(f"{terminos} = {lado_derecho:.6f}\n")
+
+def cargar_texto(ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        ecuaciones = archivo.read().splitlines()
+    return gj.matriz_desde_ecuaciones(ecuaciones)[0]
+
+def main():
+    parser = argparse.ArgumentParser(description="Carga de sistemas desde texto, NPZ y Matrix Market.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[200, 1000, 2000])
+    parser.add_argument("--densidad", type=float, default=1.0, help="Fracción de coeficientes no nulos.")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+    with tempfile.TemporaryDirectory() as directorio:
+        print(f"{'n':>6} {'formato':<16} {'archivo':>10} {'carga':>10} {'vs texto':>9} {'error máx':>10}")
+        for n in args.tamanos:
+            coeficientes, lados_derechos = generar(rng, n, args.densidad)
+            referencia = gj.matriz_aumentada(coeficientes, lados_derechos)
+            rutas = {nombre: os.path.join(directorio, f"{n}.{nombre}") for nombre in ("txt", "comp.npz", "npz", "mtx")}
+            escribir_texto(rutas["txt"], coeficientes, lados_derechos)
+            gj.guardar_sistema_npz(rutas["comp.npz"], coeficientes, lados_derechos, comprimir=True)
+            gj.guardar_sistema_npz(rutas["npz"], coeficientes, lados_derechos, comprimir=False)
+            filas = [{int(j): float(fila[j]) for j in np.flatnonzero(fila)} for fila in coeficientes]
+            gj.guardar_matrix_market(rutas["mtx"], gj.SistemaDisperso(filas, lados_derechos, n))
+
+            formatos = [
+                ("texto", "txt", lambda: cargar_texto(rutas["txt"])),
+                ("npz comprimido", "comp.npz",
+                 lambda: gj.matriz_aumentada(*gj.cargar_sistema_npz(rutas["comp.npz"])[:2])),
+                ("npz mmap", "npz", lambda: gj.matriz_aumentada(*gj.cargar_sistema_npz(rutas["npz"])[:2])),
+                ("matrix market", "mtx", lambda: gj.cargar_matrix_market(rutas["mtx"])[0].a_densa()),
+            ]
+            tiempo_texto = None
+            for nombre, clave, cargar in formatos:
+                tiempo, matriz = mejor_tiempo(cargar, args.repeticiones)
+                tiempo_texto = tiempo_texto or tiempo
+                error = np.abs(matriz - referencia).max()
+                print(f"{n:>6} {nombre:<16} {os.path.getsize(rutas[clave]) / MB:>7.2f} MB {tiempo * 1e3:>7.1f} ms "
+                      f"{tiempo_texto / tiempo:>8.1f}× {error:>10.1e}")
+
+        # Resultado completo (RREF incluida) guardado y cargado en NPZ
+        n = args.tamanos[-1]
+        coeficientes, lados_derechos = generar(rng, n, args.densidad)
+        rref = gj.eliminacion_gauss_jordan(gj.matriz_aumentada(coeficientes, lados_derechos), sobrescribir=True)
+        resultado = gj.analizar_rref(rref, [f"x{j + 1}" for j in range(n)])
+        ruta = os.path.join(directorio, "resultado.npz")
+        guardar, _ = mejor_tiempo(lambda: gj.guardar_resultado(ruta, resultado, rref), args.repeticiones)
+        cargar, (cargado, rref_cargada) = mejor_tiempo(lambda: gj.cargar_resultado(ruta), args.repeticiones)
+        iguales = np.array_equal(cargado.solucion, resultado.solucion) and np.array_equal(rref_cargada, rref)
+        print(f"\nresultado {n}×{n + 1}: {os.path.getsize(ruta) / MB:.2f} MB, guardar {guardar * 1e3:.1f} ms, "
+              f"cargar {cargar * 1e3:.2f} ms ({type(rref_cargada).__name__}), idéntico: {iguales}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de memoria de eliminacion_gauss_jordan: memoria extra reservada por
+cada resolución según se trabaje sobre una copia, sobre un búfer `salida` del
+llamador o in situ con `sobrescribir=True`.
+
+Con tracemalloc (NumPy le informa sus reservas de datos) se mide el pico de
+memoria por encima de la que ya estaba viva antes de la llamada. Para los
+modos sin copia el pico debe ser sólo el de los búferes de trabajo: O(n) más
+un tramo de como mucho 1/8 de las filas, siempre por debajo de una copia. El
+modo por paneles reserva temporales del orden de la matriz aunque trabaje in situ. También se
+resuelven muchos sistemas seguidos sobre el mismo búfer y se comprueba que la
+memoria viva no crece.
+
+Uso:
+    python benchmarks/bench_asignaciones.py [--tamanos 50 200 1000] [--bloque 64] [--seguidas 200]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def pico_extra(funcion):
+    """Bytes del pico de tracemalloc por encima de la memoria viva al empezar."""
+    tracemalloc.reset_peak()
+    antes = tracemalloc.get_traced_memory()[0]
+    funcion()
+    return tracemalloc.get_traced_memory()[1] - antes
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria extra por resolución de eliminacion_gauss_jordan.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--bloque", type=int, default=64, help="Ancho del panel para el modo por bloques.")
+    parser.add_argument("--seguidas", type=int, default=200, help="Resoluciones seguidas sobre el mismo búfer.")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+    tracemalloc.start()
+    print(f"{'n':>6} {'matriz':>10} {'copia':>18} {'salida':>18} {'sobrescribir':>18} {'paneles in situ':>18}")
+    for n in args.tamanos:
+        original = rng.uniform(-1, 1, (n, n + 1))
+        salida = np.empty_like(original)
+        trabajo = original.copy()
+        modos = [
+            lambda: gj.eliminacion_gauss_jordan(original),
+            lambda: gj.eliminacion_gauss_jordan(original, salida=salida),
+            lambda: gj.eliminacion_gauss_jordan(trabajo, sobrescribir=True),
+            lambda: gj.eliminacion_gauss_jordan(trabajo, tam_bloque=args.bloque, sobrescribir=True),
+        ]
+        celdas = []
+        for modo in modos:
+            np.copyto(trabajo, original)
+            extra = pico_extra(modo)
+            celdas.append(f"{extra / 1024:,.0f} KiB ({extra / original.nbytes:.0%})")
+        print(f"{n:>6} {original.nbytes / 1024:>6,.0f} KiB " + " ".join(f"{c:>18}" for c in celdas))
+
+    # Muchas resoluciones sobre el mismo búfer: la memoria viva no debe crecer
+    n = args.tamanos[0]
+    original = rng.uniform(-1, 1, (n, n + 1))
+    bufer = np.empty_like(original)
+    gj.eliminacion_gauss_jordan(original, salida=bufer)
+    viva_inicial = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    for _ in range(args.seguidas):
+        gj.eliminacion_gauss_jordan(original, salida=bufer)
+    viva, pico = tracemalloc.get_traced_memory()
+    print(f"\n{args.seguidas} resoluciones {n}×{n + 1} con salida=: memoria viva {viva - viva_inicial:+,} bytes, "
+          f"pico {(pico - viva_inicial) / 1024:,.0f} KiB sobre la inicial")
+    tracemalloc.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de eliminacion_gauss_jordan: recorrido fila a fila original frente
+al núcleo vectorizado (rango 1) y al modo por paneles.
+
+Uso:
+    python benchmarks/bench_eliminacion.py [--tamanos 50 200 1000 2000] [--bloque 64] [--sin-referencia]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def eliminacion_referencia(matriz):
+    """Implementación original con bucles de Python, usada como línea base."""
+    matriz = np.array(matriz, dtype=float)
+    num_filas, num_cols = matriz.shape
+    fila_actual = 0
+    columna_actual = 0
+    while fila_actual < num_filas and columna_actual < num_cols - 1:
+        fila_pivote = fila_actual
+        for i in range(fila_actual + 1, num_filas):
+            if abs(matriz[i][columna_actual]) > abs(matriz[fila_pivote][columna_actual]):
+                fila_pivote = i
+        if abs(matriz[fila_pivote][columna_actual]) < 1e-9:
+            columna_actual += 1
+            continue
+        if fila_pivote != fila_actual:
+            matriz[[fila_actual, fila_pivote]] = matriz[[fila_pivote, fila_actual]]
+        matriz[fila_actual] = matriz[fila_actual] / matriz[fila_actual][columna_actual]
+        for i in range(num_filas):
+            if i != fila_actual:
+                factor = matriz[i][columna_actual]
+                matriz[i] = matriz[i] - factor * matriz[fila_actual]
+        fila_actual += 1
+        columna_actual += 1
+    matriz = np.round(matriz, 9)
+    matriz[np.abs(matriz) < 1e-9] = 0.0
+    return matriz
+
+def medir(funcion, matriz, repeticiones):
+    """Devuelve el mejor tiempo (s) de `repeticiones` ejecuciones y el último resultado."""
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(matriz)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la eliminación Gauss-Jordan.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[50, 200, 1000, 2000])
+    parser.add_argument("--bloque", type=int, default=64, help="Ancho del panel para el modo por bloques.")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--sin-referencia", action="store_true", help="No medir la versión con bucles (lenta en n grandes).")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'n':>6} {'referencia (s)':>15} {'vectorizado (s)':>16} {'paneles (s)':>12} {'acel. vec':>10} {'acel. pan':>10}")
+    for n in args.tamanos:
+        matriz = rng.standard_normal((n, n + 1))
+
+        t_vec, rref_vec = medir(gj.eliminacion_gauss_jordan, matriz, args.repeticiones)
+        t_pan, rref_pan = medir(lambda m: gj.eliminacion_gauss_jordan(m, tam_bloque=args.bloque), matriz, args.repeticiones)
+        if not np.allclose(rref_vec, rref_pan, atol=1e-7):
+            print(f"Advertencia: la RREF por paneles difiere de la vectorizada en n={n}")
+
+        if args.sin_referencia:
+            t_ref = float("nan")
+        else:
+            # La referencia es O(n^2) llamadas de Python: una sola repetición basta
+            t_ref, rref_ref = medir(eliminacion_referencia, matriz, 1)
+            if not np.array_equal(rref_ref, rref_vec):
+                print(f"Advertencia: la RREF vectorizada difiere de la referencia en n={n}")
+
+        print(f"{n:>6} {t_ref:>15.4f} {t_vec:>16.4f} {t_pan:>12.4f} {t_ref / t_vec:>10.1f} {t_ref / t_pan:>10.1f}")
+
+if __name__ == "__main__":
+    main()
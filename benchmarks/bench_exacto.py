@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark del modo exacto: Gauss-Jordan directo con `Fraction` frente a la
+eliminación sin fracciones (Bareiss) de eliminacion_gauss_jordan_exacta.
+
+También muestra el rango que reporta el modo flotante en sistemas enteros
+singulares mal condicionados, donde el redondeo lo hace fallar.
+
+Uso:
+    python benchmarks/bench_exacto.py [--tamanos 50 100 200 300] [--max-referencia 200]
+"""
+import argparse
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def eliminacion_fraccion_referencia(matriz):
+    """Gauss-Jordan directo sobre `Fraction` (cada operación reduce por el MCD), usado como línea base."""
+    filas = [[Fraction(int(v)) for v in fila] for fila in matriz]
+    num_filas, num_cols = len(filas), len(filas[0])
+    fila_actual = 0
+    for columna in range(num_cols - 1):
+        if fila_actual >= num_filas:
+            break
+        fila_pivote = next((i for i in range(fila_actual, num_filas) if filas[i][columna] != 0), None)
+        if fila_pivote is None:
+            continue
+        filas[fila_actual], filas[fila_pivote] = filas[fila_pivote], filas[fila_actual]
+        pivote = filas[fila_actual][columna]
+        filas[fila_actual] = [v / pivote for v in filas[fila_actual]]
+        for i in range(num_filas):
+            factor = filas[i][columna]
+            if i != fila_actual and factor != 0:
+                filas[i] = [a - factor * b for a, b in zip(filas[i], filas[fila_actual])]
+        fila_actual += 1
+    return filas
+
+def medir(funcion, matriz):
+    inicio = time.perf_counter()
+    resultado = funcion(matriz)
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del modo exacto (Bareiss).")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[50, 100, 200, 300])
+    parser.add_argument("--max-referencia", type=int, default=200,
+                        help="Mayor n en que se mide la versión con Fraction (crece muy rápido).")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'n':>5} {'Fraction (s)':>13} {'Bareiss (s)':>12} {'aceleración':>12}")
+    for n in args.tamanos:
+        matriz = rng.integers(-9, 10, size=(n, n + 1))
+
+        t_exacto, (rref, _) = medir(gj.eliminacion_gauss_jordan_exacta, matriz)
+        if n <= args.max_referencia:
+            t_ref, rref_ref = medir(eliminacion_fraccion_referencia, matriz)
+            if [list(fila) for fila in rref] != rref_ref:
+                print(f"Advertencia: la RREF exacta difiere de la referencia en n={n}")
+        else:
+            t_ref = float("nan")
+
+        print(f"{n:>5} {t_ref:>13.3f} {t_exacto:>12.3f} {t_ref / t_exacto:>12.1f}")
+
+    # Sistemas singulares A = U·V con U de n×(n-1): rango exacto n-1
+    print()
+    print(f"{'n':>5} {'rango flotante':>15} {'rango exacto':>13}")
+    for n in (10, 20, 40):
+        u = rng.integers(-10**4, 10**4, size=(n, n - 1)).astype(object)
+        v = rng.integers(-10**4, 10**4, size=(n - 1, n + 1)).astype(object)
+        matriz = u @ v
+        nombres = [f"x{i}" for i in range(n)]
+        flotante = gj.interpretar_rref(gj.eliminacion_gauss_jordan(matriz.astype(float)), nombres)
+        _, columnas_pivote = gj.eliminacion_gauss_jordan_exacta(matriz)
+        print(f"{n:>5} {str(flotante['rango']):>15} {len(columnas_pivote):>13}")
+
+if __name__ == "__main__":
+    main()
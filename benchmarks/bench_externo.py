@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la eliminación fuera de memoria: reduce una matriz aumentada
+n×(n+1) guardada en disco con una memoria de trabajo menor que la matriz e
+informa el tiempo, el volumen de E/S y la memoria residente.
+
+La matriz se genera por tramos directamente en el archivo, así que el proceso
+nunca la tiene completa en memoria. Con --limite-as se fija además un límite
+duro de espacio de direcciones (RLIMIT_AS, sólo Unix) antes de eliminar: si la
+implementación cargara la matriz completa, fallaría con MemoryError.
+
+Uso:
+    python benchmarks/bench_externo.py [--n 4000] [--memoria-mb 16] [--bloque 0] [--limite-as 0]
+                                       [--directorio DIR] [--verificar]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from gauss_jordan.eliminacion import eliminacion_gauss_jordan
+from gauss_jordan.externo import _rss_actual, crear_matriz_externa, eliminacion_gauss_jordan_externa
+
+MB = 2**20
+
+def generar(ruta, n, semilla, filas_por_tramo=256):
+    """Escribe una matriz aleatoria n×(n+1) bien condicionada (diagonal dominante) por tramos de filas."""
+    rng = np.random.default_rng(semilla)
+    matriz = crear_matriz_externa(ruta, (n, n + 1))
+    for inicio in range(0, n, filas_por_tramo):
+        fin = min(inicio + filas_por_tramo, n)
+        tramo = rng.uniform(-1, 1, (fin - inicio, n + 1))
+        tramo[np.arange(fin - inicio), np.arange(inicio, fin)] += n
+        matriz[inicio:fin] = tramo
+    matriz.flush()
+    del matriz
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la eliminación fuera de memoria.")
+    parser.add_argument("--n", type=int, default=4000, help="Incógnitas (la matriz ocupa 8·n·(n+1) bytes).")
+    parser.add_argument("--memoria-mb", type=float, default=16, help="Memoria de trabajo (memoria_max) en MB.")
+    parser.add_argument("--bloque", type=int, default=0, help="Ancho de panel máximo (0 = automático).")
+    parser.add_argument("--limite-as", type=float, default=0,
+                        help="Límite de espacio de direcciones en MB sobre el ya usado (0 = sin límite).")
+    parser.add_argument("--directorio", default=None, help="Directorio del archivo temporal.")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Compara con la eliminación en memoria (necesita la matriz completa en RAM).")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    n = args.n
+    tam_matriz = 8 * n * (n + 1)
+    with tempfile.TemporaryDirectory(dir=args.directorio) as directorio:
+        ruta = os.path.join(directorio, "matriz.f64")
+        inicio = time.perf_counter()
+        generar(ruta, n, args.semilla)
+        print(f"matriz {n}×{n + 1}: {tam_matriz / MB:.1f} MB en disco (generada en {time.perf_counter() - inicio:.2f} s)")
+
+        if args.limite_as > 0:
+            import resource
+            np.ones((256, 256)) @ np.ones((256, 256)) # BLAS reserva sus búferes la primera vez; que sea antes del límite
+            with open("/proc/self/statm") as statm:
+                usado = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+            limite = usado + int(args.limite_as * MB)
+            resource.setrlimit(resource.RLIMIT_AS, (limite, resource.getrlimit(resource.RLIMIT_AS)[1]))
+            print(f"RLIMIT_AS: {limite / MB:.0f} MB ({args.limite_as:.0f} MB sobre los {usado / MB:.0f} MB ya reservados)")
+
+        rss_inicial = _rss_actual()
+        inicio = time.perf_counter()
+        estadisticas = eliminacion_gauss_jordan_externa(ruta, forma=(n, n + 1), memoria_max=int(args.memoria_mb * MB),
+                                                        tam_bloque=args.bloque or None)
+        duracion = time.perf_counter() - inicio
+
+        es = estadisticas["bytes_leidos"] + estadisticas["bytes_escritos"]
+        print(f"tiempo: {duracion:.2f} s, paneles: {estadisticas['paneles']} de {estadisticas['tam_bloque']} columnas, "
+              f"tramos de {estadisticas['filas_por_tramo']} filas")
+        print(f"E/S: {estadisticas['bytes_leidos'] / MB:,.0f} MB leídos + {estadisticas['bytes_escritos'] / MB:,.0f} MB "
+              f"escritos = {es / tam_matriz:.1f}× la matriz ({es / MB / duracion:,.0f} MB/s)")
+        print(f"memoria de trabajo estimada: {estadisticas['memoria_trabajo_bytes'] / MB:.1f} MB "
+              f"(límite {args.memoria_mb:.1f} MB)")
+        if rss_inicial is not None and estadisticas["pico_rss_bytes"] is not None:
+            crecimiento = estadisticas["pico_rss_bytes"] - rss_inicial
+            print(f"RSS: {rss_inicial / MB:.1f} MB al empezar, pico {estadisticas['pico_rss_bytes'] / MB:.1f} MB "
+                  f"(+{crecimiento / MB:.1f} MB, {crecimiento / tam_matriz:.1%} de la matriz)")
+
+        if args.verificar:
+            original = np.empty((n, n + 1))
+            generar(os.path.join(directorio, "original.f64"), n, args.semilla)
+            original[:] = np.memmap(os.path.join(directorio, "original.f64"), dtype=np.float64, mode="r", shape=(n, n + 1))
+            referencia = eliminacion_gauss_jordan(original, tam_bloque=estadisticas["tam_bloque"])
+            resultado = np.memmap(ruta, dtype=np.float64, mode="r", shape=(n, n + 1))
+            print(f"diferencia máxima con la eliminación en memoria: {np.abs(resultado - referencia).max():.3e}")
+
+if __name__ == "__main__":
+    main()
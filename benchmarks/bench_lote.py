@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de resolver_sistemas_lote frente a resolver los sistemas uno a uno
+con eliminacion_gauss_jordan.
+
+Uso:
+    python benchmarks/bench_lote.py [--lote 100000] [--incognitas 3 10 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la resolución en lote.")
+    parser.add_argument("--lote", type=int, default=100000)
+    parser.add_argument("--incognitas", type=int, nargs="+", default=[3, 10, 20])
+    parser.add_argument("--muestra-individual", type=int, default=2000,
+                        help="Sistemas resueltos uno a uno para estimar el costo individual.")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+
+    print(f"{'n':>4} {'lote':>8} {'uno a uno (s)':>14} {'lote (s)':>10} {'aceleración':>12}")
+    for n in args.incognitas:
+        matrices = rng.integers(-5, 6, size=(args.lote, n, n + 1)).astype(float)
+        # Un tercio de los sistemas son singulares para ejercitar el camino sin pivote
+        matrices[::3, -1, :-1] = matrices[::3, 0, :-1]
+
+        muestra = min(args.muestra_individual, args.lote)
+        inicio = time.perf_counter()
+        for k in range(muestra):
+            gj.eliminacion_gauss_jordan(matrices[k])
+        t_individual = (time.perf_counter() - inicio) * args.lote / muestra
+
+        inicio = time.perf_counter()
+        gj.resolver_sistemas_lote(matrices)
+        t_lote = time.perf_counter() - inicio
+
+        print(f"{n:>4} {args.lote:>8} {t_individual:>14.3f} {t_lote:>10.3f} {t_individual / t_lote:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de escalado de EjecutorParalelo: tiempo de resolver (eliminar e
+interpretar) un trabajo de muchos sistemas independientes con 1 a N procesos.
+
+Uso:
+    python benchmarks/bench_paralelo.py [--sistemas 20000] [--incognitas 10] [--max-trabajadores 32] [--tramo 0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escalado del ejecutor paralelo.")
+    parser.add_argument("--sistemas", type=int, default=20000)
+    parser.add_argument("--incognitas", type=int, default=10)
+    parser.add_argument("--max-trabajadores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--tramo", type=int, default=0, help="Sistemas por tarea (0 = automático).")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+    n = args.incognitas
+    matrices = list(rng.integers(-5, 6, size=(args.sistemas, n, n + 1)).astype(float))
+
+    # Línea base: bucle en un solo proceso, sin memoria compartida
+    nombres = [f"x{i + 1}" for i in range(n)]
+    inicio = time.perf_counter()
+    for matriz in matrices:
+        gj.interpretar_rref(gj.eliminacion_gauss_jordan(matriz), nombres)
+    t_serie = time.perf_counter() - inicio
+    print(f"bucle en serie: {t_serie:.3f} s ({args.sistemas / t_serie:,.0f} sistemas/s)")
+    if args.max_trabajadores > (os.cpu_count() or 1):
+        print(f"Aviso: se piden {args.max_trabajadores} procesos con {os.cpu_count()} núcleos disponibles.")
+
+    trabajadores = [1]
+    while trabajadores[-1] * 2 <= args.max_trabajadores:
+        trabajadores.append(trabajadores[-1] * 2)
+    if trabajadores[-1] != args.max_trabajadores:
+        trabajadores.append(args.max_trabajadores)
+
+    print(f"{'procesos':>9} {'tiempo (s)':>11} {'sistemas/s':>12} {'aceleración':>12} {'eficiencia':>11}")
+    referencia = None
+    for k in trabajadores:
+        with gj.EjecutorParalelo(trabajadores=k, tam_tramo=args.tramo or None) as ejecutor:
+            ejecutor.resolver(matrices[:k]) # Arranca los procesos fuera de la medición
+            inicio = time.perf_counter()
+            ejecutor.resolver(matrices)
+            duracion = time.perf_counter() - inicio
+        referencia = referencia or duracion
+        aceleracion = referencia / duracion
+        print(f"{k:>9} {duracion:>11.3f} {args.sistemas / duracion:>12,.0f} {aceleracion:>12.2f} {aceleracion / k:>11.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la resolución en precisión mixta (factorización float32 y
+refinamiento float64) frente a la eliminación float64 de siempre, sin bloques
+y por paneles, en sistemas cuadrados bien condicionados de 200 a 4000
+incógnitas. Informa la ruta tomada, los pasos de refinamiento, el error
+relativo frente a np.linalg.solve (LAPACK, float64) y la memoria de la copia
+de trabajo de cada ruta.
+
+Después barre el número de condición en un tamaño fijo para mostrar hasta
+dónde converge el refinamiento y cuándo se recurre a float64.
+
+Antes de medir comprueba que un sistema con un pivote float64 justo por debajo
+de 1e-9 (inconsistente para `eliminacion_gauss_jordan`) no se resuelve por la
+ruta mixta como si tuviera solución única.
+
+La eliminación float64 sin bloques es O(n³) con actualizaciones de rango 1 y
+tarda minutos en n = 4000; --max-sin-bloques la limita a los tamaños menores.
+
+Uso:
+    python benchmarks/bench_precision_mixta.py [--tamanos 200 500 1000 2000 4000] [--bloque 64]
+                                              [--max-sin-bloques 2000] [--condiciones 1e2 1e4 1e6 1e7 1e8 1e10]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+MB = 2**20
+
+def medir(funcion, repeticiones):
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+def error_relativo(rref, referencia):
+    return np.abs(rref[:, -1] - referencia).max() / np.abs(referencia).max()
+
+def matriz_con_condicion(rng, n, condicion):
+    """A = U·diag(σ)·Vᵀ con valores singulares espaciados logarítmicamente entre 1 y 1/condicion."""
+    u, _ = np.linalg.qr(rng.normal(size=(n, n)))
+    v, _ = np.linalg.qr(rng.normal(size=(n, n)))
+    return (u * np.logspace(0, -np.log10(condicion), n)) @ v.T
+
+def comprobar_pivote_limite():
+    """Pivote float64 9.5e-10 < 1e-9: la ruta mixta debe recurrir a float64 y dar la misma RREF."""
+    s, d = 0.02, 9.5e-10
+    matriz = np.array([[s, s, s], [s, s + d, 2 * s]])
+    rref, informe = gj.eliminacion_gauss_jordan_mixta(matriz)
+    assert informe["ruta"] == gj.RUTA_FLOAT64, f"se esperaba la ruta float64 y se tomó {informe}"
+    assert np.array_equal(rref, gj.eliminacion_gauss_jordan(matriz))
+    print(f"pivote en el límite: ruta {informe['ruta']} ({informe['motivo']})\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="Precisión mixta frente a eliminación float64.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[200, 500, 1000, 2000, 4000])
+    parser.add_argument("--bloque", type=int, default=64, help="Ancho de panel de la eliminación float64 por paneles.")
+    parser.add_argument("--max-sin-bloques", type=int, default=2000,
+                        help="Mayor n en el que se mide la eliminación float64 sin bloques.")
+    parser.add_argument("--condiciones", type=float, nargs="+", default=[1e2, 1e4, 1e6, 1e7, 1e8, 1e10])
+    parser.add_argument("--n-condicion", type=int, default=500, help="Tamaño del barrido de condición.")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    comprobar_pivote_limite()
+    rng = np.random.default_rng(args.semilla)
+    print(f"{'n':>6} {'ruta':<8} {'ref.':>5} {'mixta':>9} {'f64 paneles':>12} {'f64 sin bloques':>16} "
+          f"{'× paneles':>10} {'× sin bloques':>14} {'error mixta':>12} {'error f64':>10} {'trabajo f32/f64':>16}")
+    for n in args.tamanos:
+        matriz = rng.uniform(-1, 1, (n, n + 1))
+        matriz[np.arange(n), np.arange(n)] += np.sqrt(n) # Bien condicionada
+        referencia = np.linalg.solve(matriz[:, :-1], matriz[:, -1])
+        repeticiones = 3 if n <= 1000 else 1
+
+        t_mixta, (rref_mixta, informe) = medir(lambda: gj.eliminacion_gauss_jordan_mixta(matriz), repeticiones)
+        t_paneles, rref_paneles = medir(lambda: gj.eliminacion_gauss_jordan(matriz, tam_bloque=args.bloque),
+                                        repeticiones)
+        if n <= args.max_sin_bloques:
+            t_simple, _ = medir(lambda: gj.eliminacion_gauss_jordan(matriz), repeticiones)
+            sin_bloques = f"{t_simple:>14.3f} s"
+            aceleracion_simple = f"{t_simple / t_mixta:>13.1f}×"
+        else:
+            sin_bloques, aceleracion_simple = f"{'-':>16}", f"{'-':>14}"
+        print(f"{n:>6} {informe['ruta']:<8} {informe['refinamientos']:>5} {t_mixta:>7.3f} s {t_paneles:>10.3f} s "
+              f"{sin_bloques} {t_paneles / t_mixta:>9.1f}× {aceleracion_simple} "
+              f"{error_relativo(rref_mixta, referencia):>12.1e} "
+              f"{error_relativo(rref_paneles, referencia):>10.1e} "
+              f"{4 * n * n / MB:>7.1f}/{8 * n * (n + 1) / MB:.1f} MB")
+    print("(los errores incluyen el redondeo a 9 decimales de la RREF)")
+
+    n = args.n_condicion
+    print(f"\nbarrido de condición, n = {n}:")
+    print(f"{'condición':>10} {'ruta':<8} {'ref.':>5} {'tiempo':>9} {'error':>10}  motivo")
+    for condicion in args.condiciones:
+        coeficientes = matriz_con_condicion(rng, n, condicion)
+        lado_derecho = coeficientes @ rng.uniform(-1, 1, n)
+        matriz = np.column_stack([coeficientes, lado_derecho])
+        referencia = np.linalg.solve(coeficientes, lado_derecho)
+        tiempo, (rref, informe) = medir(lambda: gj.eliminacion_gauss_jordan_mixta(matriz), 1)
+        error = error_relativo(rref, referencia) if informe["ruta"] == gj.RUTA_MIXTA else float("nan")
+        print(f"{condicion:>10.0e} {informe['ruta']:<8} {informe['refinamientos']:>5} {tiempo:>7.3f} s "
+              f"{error:>10.1e}  {informe['motivo'] or ''}")
+
+if __name__ == "__main__":
+    main()
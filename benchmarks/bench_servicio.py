@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Prueba de carga del servicio local (gauss_jordan.servicio), toda en localhost.
+
+Por cada ventana de microlote de --ventanas arranca el servicio en otro proceso
+(puerto TCP libre o socket Unix), abre --clientes conexiones persistentes y
+envía --solicitudes sistemas pequeños de pocas formas distintas, la mitad
+como ecuaciones de texto y la mitad como matrices. Informa el rendimiento, los
+percentiles de latencia medidos por el cliente, los códigos de respuesta y las
+estadísticas del servicio (tamaño medio de lote, percentiles del servidor).
+Antes comprueba el límite de tamaño (413) y, con --verificar, compara cada
+respuesta con resolver_ecuaciones en este proceso.
+
+Con --max-pendientes menor que --clientes se ve la contrapresión: el servicio
+responde 503 a las solicitudes que superan el límite.
+
+Uso:
+    python benchmarks/bench_servicio.py [--ventanas 0 2] [--clientes 64] [--solicitudes 5000]
+                                        [--max-pendientes 1024] [--unix] [--verificar]
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, RAIZ)
+from gauss_jordan.resolucion import resolver_ecuaciones
+
+FORMAS = [(2, 2), (3, 3), (4, 4), (6, 6), (8, 8), (4, 6)] # (ecuaciones, variables)
+
+def generar_solicitudes(rng, cantidad):
+    """Cuerpos JSON de /resolver y las ecuaciones equivalentes (para verificar)."""
+    solicitudes = []
+    for k in range(cantidad):
+        filas, variables = FORMAS[rng.integers(len(FORMAS))]
+        coeficientes = rng.integers(-9, 10, (filas, variables))
+        lados_derechos = rng.integers(-20, 21, filas)
+        nombres = [f"x{j + 1}" for j in range(variables)]
+        ecuaciones = [" ".join(f"{c:+d}{nombre}" for c, nombre in zip(fila, nombres)) + f" = {b}"
+                      for fila, b in zip(coeficientes, lados_derechos)]
+        if k % 2:
+            datos = {"coeficientes": coeficientes.tolist(), "lados_derechos": lados_derechos.tolist(),
+                     "variables": nombres}
+        else:
+            datos = {"ecuaciones": ecuaciones}
+        solicitudes.append((json.dumps(datos).encode("utf-8"), ecuaciones))
+    return solicitudes
+
+def peticion(metodo, ruta, cuerpo=b""):
+    return (f"{metodo} {ruta} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(cuerpo)}\r\n\r\n").encode("latin-1") + cuerpo
+
+async def leer_respuesta(lector):
+    """Devuelve (código, JSON) de una respuesta HTTP con Content-Length."""
+    estado = await lector.readline()
+    codigo = int(estado.split()[1])
+    longitud = 0
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        if nombre.strip().lower() == "content-length":
+            longitud = int(valor)
+    return codigo, json.loads(await lector.readexactly(longitud))
+
+async def conectar(direccion):
+    if direccion.startswith("http://"):
+        host, puerto = direccion[len("http://"):].rsplit(":", 1)
+        return await asyncio.open_connection(host, int(puerto))
+    return await asyncio.open_unix_connection(direccion)
+
+async def consultar(direccion, metodo, ruta, cuerpo=b""):
+    lector, escritor = await conectar(direccion)
+    escritor.write(peticion(metodo, ruta, cuerpo))
+    respuesta = await leer_respuesta(lector)
+    escritor.close()
+    return respuesta
+
+async def cliente(direccion, cola, latencias, codigos, respuestas):
+    lector, escritor = await conectar(direccion)
+    try:
+        while cola:
+            indice, cuerpo = cola.pop()
+            inicio = time.perf_counter()
+            escritor.write(peticion("POST", "/resolver", cuerpo))
+            codigo, datos = await leer_respuesta(lector)
+            latencias.append(time.perf_counter() - inicio)
+            codigos[codigo] = codigos.get(codigo, 0) + 1
+            respuestas[indice] = (codigo, datos)
+    finally:
+        escritor.close()
+
+async def carga(direccion, solicitudes, clientes):
+    cola = [(i, cuerpo) for i, (cuerpo, _) in enumerate(solicitudes)][::-1]
+    latencias, codigos, respuestas = [], {}, {}
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(direccion, cola, latencias, codigos, respuestas) for _ in range(clientes)))
+    duracion = time.perf_counter() - inicio
+    estadisticas = (await consultar(direccion, "GET", "/estadisticas"))[1]
+    return duracion, np.array(latencias) * 1e3, codigos, respuestas, estadisticas
+
+def arrancar(ventana_ms, args, ruta_unix):
+    orden = [sys.executable, "-m", "gauss_jordan.servicio", "--ventana-ms", str(ventana_ms),
+             "--max-pendientes", str(args.max_pendientes), "--max-bytes", str(args.max_bytes)]
+    orden += ["--unix", ruta_unix] if ruta_unix else ["--puerto", "0"]
+    proceso = subprocess.Popen(orden, cwd=RAIZ, stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()
+    if not linea.startswith("Escuchando en "):
+        proceso.kill()
+        raise RuntimeError(f"El servicio no arrancó: {linea!r}")
+    return proceso, linea.split("Escuchando en ", 1)[1].strip()
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio local de resolución.")
+    parser.add_argument("--ventanas", type=float, nargs="+", default=[0, 2], help="Ventanas de microlote en ms.")
+    parser.add_argument("--clientes", type=int, default=64, help="Conexiones concurrentes.")
+    parser.add_argument("--solicitudes", type=int, default=5000)
+    parser.add_argument("--max-pendientes", type=int, default=1024)
+    parser.add_argument("--max-bytes", type=int, default=1 << 20)
+    parser.add_argument("--unix", action="store_true", help="Usa un socket Unix en lugar de TCP.")
+    parser.add_argument("--verificar", action="store_true", help="Compara las respuestas con resolver_ecuaciones.")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    solicitudes = generar_solicitudes(np.random.default_rng(args.semilla), args.solicitudes)
+    with tempfile.TemporaryDirectory() as directorio:
+        for ventana in args.ventanas:
+            proceso, direccion = arrancar(ventana, args, os.path.join(directorio, "gj.sock") if args.unix else None)
+            try:
+                codigo, _ = asyncio.run(consultar(direccion, "POST", "/resolver", b" " * (args.max_bytes + 1)))
+                assert codigo == 413, f"se esperaba 413 para un cuerpo demasiado grande y llegó {codigo}"
+                duracion, latencias, codigos, respuestas, estadisticas = asyncio.run(
+                    carga(direccion, solicitudes, args.clientes))
+            finally:
+                proceso.terminate()
+                proceso.wait()
+
+            p50, p90, p99 = np.percentile(latencias, [50, 90, 99])
+            servidor = estadisticas["latencia_ms"]
+            print(f"ventana {ventana:g} ms ({direccion}): {len(latencias) / duracion:,.0f} solicitudes/s, "
+                  f"códigos {dict(sorted(codigos.items()))}")
+            print(f"  cliente  p50 {p50:.2f} ms, p90 {p90:.2f} ms, p99 {p99:.2f} ms, máx {latencias.max():.2f} ms")
+            print(f"  servidor p50 {servidor['p50']:.2f} ms, p99 {servidor['p99']:.2f} ms; "
+                  f"{estadisticas['lotes']} lotes (medio {estadisticas['lote_medio']}, máximo {estadisticas['lote_maximo']}), "
+                  f"rechazadas por saturación {estadisticas['rechazadas_saturacion']}")
+
+            if args.verificar:
+                distintas = 0
+                for indice, (codigo, datos) in respuestas.items():
+                    if codigo == 200 and datos != resolver_ecuaciones(solicitudes[indice][1]):
+                        distintas += 1
+                print(f"  verificación: {distintas} respuestas distintas de resolver_ecuaciones")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks reproducible con control de regresiones.
+
+Genera cargas con semilla fija (densa, dispersa, de rango deficiente,
+inconsistente y de ecuaciones de texto largas) y mide por separado las tres
+etapas del camino de `resolver_ecuaciones`: análisis del texto, eliminación e
+interpretación (incluido el texto que muestra la GUI). También registra el pico
+de memoria de cada etapa con tracemalloc, en una pasada aparte para no
+distorsionar los tiempos. No necesita pantalla.
+
+Los resultados se guardan en JSON (--guardar) y se comparan con una línea base
+(--comparar): el proceso termina con código 1 si alguna etapa empeora más del
+porcentaje indicado en --tolerancia.
+
+Las cargas densas cuestan O(n³) en la eliminación y O(n²) en texto, así que
+por omisión sólo se generan hasta --max-densa incógnitas; las dispersas y las
+de texto largo recorren todos los tamaños.
+
+Uso:
+    python benchmarks/bench_suite.py [--tamanos 10 100 1000 5000] [--cargas densa dispersa ...]
+                                     [--guardar base.json] [--comparar base.json] [--tolerancia 20]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+
+ETAPAS = ("analisis", "eliminacion", "interpretacion")
+
+#--------------------------------------------------------------------------
+# Generación de cargas
+#--------------------------------------------------------------------------
+def formatear_ecuacion(indices, coeficientes, lado_derecho):
+    """Escribe sum(coeficiente * x_indice) = lado_derecho como texto."""
+    terminos = "".join(f" {'-' if c < 0 else '+'} {abs(c)}x{i}" for i, c in zip(indices, coeficientes))
+    return f"{terminos.lstrip(' +')} = {lado_derecho}"
+
+def _ecuaciones_densas(matriz):
+    indices = np.arange(matriz.shape[1] - 1)
+    return [formatear_ecuacion(indices, fila[:-1].tolist(), fila[-1]) for fila in matriz]
+
+def carga_densa(rng, n):
+    """n ecuaciones con las n incógnitas, coeficientes enteros no nulos: solución única (casi seguro)."""
+    matriz = rng.integers(1, 100, size=(n, n + 1)) * rng.choice([-1, 1], size=(n, n + 1))
+    return _ecuaciones_densas(matriz), gj.SOLUCION_UNICA
+
+def _matriz_dependiente(rng, n):
+    """Matriz entera n×(n+1) cuyo último décimo de filas es suma de dos filas anteriores."""
+    dependientes = max(1, n // 10)
+    matriz = rng.integers(-50, 51, size=(n, n + 1))
+    for k in range(n - dependientes, n):
+        a, b = rng.choice(n - dependientes, size=2, replace=False) if n - dependientes > 1 else (0, 0)
+        matriz[k] = matriz[a] + matriz[b]
+    return matriz, dependientes
+
+def carga_deficiente(rng, n):
+    """Sistema consistente de rango menor que n: infinitas soluciones."""
+    matriz, _ = _matriz_dependiente(rng, n)
+    return _ecuaciones_densas(matriz), gj.SOLUCIONES_INFINITAS
+
+def carga_inconsistente(rng, n):
+    """Como la de rango deficiente, pero con el lado derecho de una fila dependiente alterado."""
+    matriz, _ = _matriz_dependiente(rng, n)
+    matriz[-1, -1] += 1
+    return _ecuaciones_densas(matriz), gj.SISTEMA_INCONSISTENTE
+
+def carga_dispersa(rng, n, por_fila=5):
+    """Diagonal dominante más unas pocas entradas por fila: solución única."""
+    ecuaciones = []
+    for i in range(n):
+        otros = rng.choice(n, size=min(por_fila - 1, n), replace=False)
+        otros = otros[otros != i]
+        coeficientes = rng.integers(-9, 10, size=otros.size)
+        indices = np.concatenate([[i], otros])
+        coeficientes = np.concatenate([[10 * por_fila], coeficientes])
+        ecuaciones.append(formatear_ecuacion(indices, coeficientes.tolist(), int(rng.integers(-100, 101))))
+    return ecuaciones, gj.SOLUCION_UNICA
+
+def carga_texto_largo(rng, n, terminos=200):
+    """
+    Ecuaciones largas como las escribiría un usuario: decimales, variables
+    repetidas, constantes en el lado izquierdo y espacios irregulares.
+    """
+    ecuaciones = []
+    for i in range(n):
+        indices = np.concatenate([[i], rng.integers(0, n, size=terminos - 1)])
+        partes = []
+        for k, j in enumerate(indices):
+            signo = "-" if k and rng.random() < 0.4 else "+"
+            coeficiente = 2.0 * terminos if k == 0 else round(float(rng.uniform(0.1, 1.0)), 3)
+            espacio = " " * int(rng.integers(0, 3))
+            partes.append(f"{signo}{espacio}{coeficiente}{espacio}x{j}")
+            if k % 25 == 24:
+                partes.append(f"+ {int(rng.integers(1, 10))}")
+        ecuaciones.append(" ".join(partes).lstrip("+ ") + f" = {int(rng.integers(-100, 101))}")
+    return ecuaciones, gj.SOLUCION_UNICA
+
+CARGAS = {
+    "densa": carga_densa,
+    "dispersa": carga_dispersa,
+    "deficiente": carga_deficiente,
+    "inconsistente": carga_inconsistente,
+    "texto_largo": carga_texto_largo,
+}
+CARGAS_DENSAS = {"densa", "deficiente", "inconsistente"}
+
+#--------------------------------------------------------------------------
+# Medición por etapas
+#--------------------------------------------------------------------------
+def ejecutar_etapas(ecuaciones, marcar):
+    """
+    Recorre el camino de `resolver_ecuaciones` llamando a `marcar(etapa)` al
+    terminar cada etapa. Devuelve (motor, clasificacion).
+    """
+    variables = {}
+    sistema = gj.SistemaDisperso.desde_ecuaciones(ecuaciones, variables)
+    nombres = sorted(variables, key=variables.get)
+    marcar("analisis")
+
+    if gj.usar_motor_disperso(sistema.num_variables, sistema.densidad()):
+        reducido, columnas_pivote = gj.eliminacion_gauss_jordan_dispersa(sistema)
+        marcar("eliminacion")
+        clasificacion = gj.interpretar_sistema_disperso(reducido, columnas_pivote)[0]
+        marcar("interpretacion")
+        return "dispersa", clasificacion
+
+    matriz_rref = gj.eliminacion_gauss_jordan(sistema.a_densa())
+    marcar("eliminacion")
+    resultado = gj.analizar_rref(matriz_rref, nombres)
+    resultado.texto()
+    marcar("interpretacion")
+    return "densa", resultado.clasificacion
+
+def medir_tiempos(ecuaciones, repeticiones):
+    """Mejor tiempo (s) de cada etapa en `repeticiones` ejecuciones."""
+    mejores = dict.fromkeys(ETAPAS, float("inf"))
+    for _ in range(repeticiones):
+        marcas = {}
+        inicio = [time.perf_counter()]
+
+        def marcar(etapa):
+            ahora = time.perf_counter()
+            marcas[etapa] = ahora - inicio[0]
+            inicio[0] = ahora
+
+        motor, clasificacion = ejecutar_etapas(ecuaciones, marcar)
+        for etapa in ETAPAS:
+            mejores[etapa] = min(mejores[etapa], marcas[etapa])
+    return mejores, motor, clasificacion
+
+def medir_memoria(ecuaciones):
+    """Pico de memoria (bytes) asignado por cada etapa, según tracemalloc."""
+    picos = {}
+
+    def marcar(etapa):
+        picos[etapa] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        ejecutar_etapas(ecuaciones, marcar)
+    finally:
+        tracemalloc.stop()
+    return picos
+
+#--------------------------------------------------------------------------
+# Línea base y regresiones
+#--------------------------------------------------------------------------
+def comparar(actual, base, tolerancia, minimo_s):
+    """
+    Compara cada etapa con la línea base y devuelve la lista de regresiones.
+
+    Los tiempos por debajo de `minimo_s` en ambas corridas se ignoran: en ese
+    rango el ruido del reloj supera cualquier tolerancia razonable.
+    """
+    regresiones = []
+    print(f"\n{'caso':<22} {'etapa':<15} {'base':>12} {'actual':>12} {'cambio':>9}")
+    for caso, medidas in actual["casos"].items():
+        referencia = base.get("casos", {}).get(caso)
+        if referencia is None:
+            continue
+        for clave, unidad in (("tiempo_s", "s"), ("memoria_pico_bytes", "B")):
+            for etapa in ETAPAS:
+                valor_base = referencia.get(clave, {}).get(etapa)
+                valor = medidas.get(clave, {}).get(etapa)
+                if valor_base is None or valor is None:
+                    continue
+                if unidad == "s" and max(valor, valor_base) < minimo_s:
+                    continue
+                cambio = 100.0 * (valor - valor_base) / valor_base if valor_base else 0.0
+                marca = " <-- REGRESIÓN" if cambio > tolerancia else ""
+                formato = "{:>12.4f}" if unidad == "s" else "{:>12,.0f}"
+                print(f"{caso:<22} {etapa + ' (' + unidad + ')':<15} {formato.format(valor_base)} "
+                      f"{formato.format(valor)} {cambio:>8.1f}%{marca}")
+                if marca:
+                    regresiones.append((caso, clave, etapa, cambio))
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks con control de regresiones.")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--cargas", nargs="+", choices=sorted(CARGAS), default=list(CARGAS))
+    parser.add_argument("--max-densa", type=int, default=2000,
+                        help="Mayor número de incógnitas para las cargas densas (O(n³)).")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--sin-memoria", action="store_true", help="No medir el pico de memoria.")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--guardar", help="Escribe los resultados en este archivo JSON.")
+    parser.add_argument("--comparar", help="Línea base JSON con la que comparar.")
+    parser.add_argument("--tolerancia", type=float, default=20.0,
+                        help="Porcentaje de empeoramiento permitido por etapa antes de fallar.")
+    parser.add_argument("--minimo-s", type=float, default=0.02,
+                        help="Tiempos menores que esto (en ambas corridas) no se comparan.")
+    args = parser.parse_args()
+
+    resultados = {
+        "semilla": args.semilla,
+        "entorno": {"python": platform.python_version(), "numpy": np.__version__,
+                    "plataforma": platform.platform(), "procesador": platform.processor()},
+        "casos": {},
+    }
+
+    print(f"{'caso':<22} {'motor':<9} {'análisis (s)':>13} {'eliminación (s)':>16} {'interpretación (s)':>19} {'pico (MiB)':>11}")
+    for nombre in args.cargas:
+        for n in args.tamanos:
+            if nombre in CARGAS_DENSAS and n > args.max_densa:
+                continue
+            # La semilla depende sólo de la carga y el tamaño, no de qué otras cargas se pidieron
+            rng = np.random.default_rng([args.semilla, list(CARGAS).index(nombre), n])
+            ecuaciones, esperada = CARGAS[nombre](rng, n)
+
+            tiempos, motor, clasificacion = medir_tiempos(ecuaciones, args.repeticiones)
+            caso = {"incognitas": n, "ecuaciones": len(ecuaciones), "motor": motor,
+                    "clasificacion": clasificacion, "tiempo_s": tiempos}
+            if not args.sin_memoria:
+                caso["memoria_pico_bytes"] = medir_memoria(ecuaciones)
+            clave = f"{nombre}/{n}"
+            resultados["casos"][clave] = caso
+
+            pico = max(caso.get("memoria_pico_bytes", {0: 0}).values()) / 2**20
+            print(f"{clave:<22} {motor:<9} {tiempos['analisis']:>13.4f} {tiempos['eliminacion']:>16.4f} "
+                  f"{tiempos['interpretacion']:>19.4f} {pico:>11.1f}")
+            if clasificacion != esperada:
+                print(f"Advertencia: {clave} se clasificó como '{clasificacion}' en lugar de '{esperada}'")
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.guardar}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(resultados, base, args.tolerancia, args.minimo_s)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresiones por encima del {args.tolerancia:.0f}%.")
+            return 1
+        print(f"\nSin regresiones por encima del {args.tolerancia:.0f}%.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Núcleo numérico del solucionador de sistemas lineales por Gauss-Jordan.
+
+No depende de tkinter: se puede importar en servidores sin pantalla. La GUI
+('Gauss Jordan.py') y el modo por lotes (`python -m gauss_jordan`) usan este paquete.
+"""
+import time as _time
+
+_INICIO_IMPORTACION = _time.perf_counter()
+
+from .analizador import ErrorEcuacion, analizar_ecuacion, coeficientes_ecuacion, matriz_desde_ecuaciones
+from .archivos import (cargar_matrix_market, cargar_npz, cargar_resultado, cargar_sistema_npz, guardar_matrix_market,
+                       guardar_resultado, guardar_sistema_npz, matriz_aumentada)
+from .cache_ecuaciones import CacheEcuaciones
+from .disperso import (MIN_VARIABLES_DISPERSO, UMBRAL_DENSIDAD_DISPERSA, SistemaDisperso,
+                       eliminacion_gauss_jordan_dispersa, interpretar_sistema_disperso, usar_motor_disperso)
+from .eliminacion import OperacionCancelada, eliminacion_gauss_jordan
+from .exacto import a_racional, eliminacion_gauss_jordan_exacta, interpretar_rref_exacta
+from .externo import crear_matriz_externa, eliminacion_gauss_jordan_externa
+from .factorizacion import CacheFactorizaciones, FactorizacionLU
+from .incremental import SistemaIncremental
+from .instrumentacion import Instrumentacion, instrumentacion_activa, instrumentar
+from .interpretacion import (SIN_VARIABLES, SISTEMA_INCONSISTENTE, SOLUCION_UNICA, SOLUCIONES_INFINITAS,
+                             ResultadoSistema, analizar_rref, interpretar_rref, resultado_a_json)
+from .lote import clasificar_sistemas_lote, eliminacion_gauss_jordan_lote, resolver_sistemas_lote
+from .paralelo import EjecutorParalelo, resolver_en_paralelo
+from .precision_mixta import RUTA_FLOAT64, RUTA_MIXTA, eliminacion_gauss_jordan_mixta
+from .resolucion import resolver_ecuaciones, resolver_matriz, resolver_sistema
+
+TIEMPO_IMPORTACION = _time.perf_counter() - _INICIO_IMPORTACION # Segundos que tomó importar el núcleo
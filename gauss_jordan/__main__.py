@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Permite ejecutar el modo por lotes con `python -m gauss_jordan`."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Analizador de ecuaciones lineales en una sola pasada."""
+import re
+import sys
+
+import numpy as np
+
+#--------------------------------------------------------------------------
+# Analizador de ecuaciones (una sola pasada)
+#--------------------------------------------------------------------------
+# Un término es: signos opcionales, coeficiente opcional y variable opcional (al menos uno de los dos últimos)
+_PATRON_TERMINO = re.compile(r'([+-]*)(\d+\.?\d*|\.\d+)?([a-zA-Z_]\w*)?')
+_PATRON_TOKEN = re.compile(r'[+-]*[^+-]*') # Texto del término que falló, para el mensaje de error
+_PATRON_ESPACIOS = re.compile(r'\s+')
+
+class ErrorEcuacion(ValueError):
+    """Error de formato en una ecuación, con el término que falló y su posición."""
+    def __init__(self, mensaje, ecuacion, token=None, posicion=None):
+        super().__init__(mensaje)
+        self.mensaje = mensaje
+        self.ecuacion = ecuacion
+        self.token = token
+        self.posicion = posicion
+        self.indice = None # Índice de la ecuación cuando falla un análisis en bloque
+
+    def __str__(self):
+        if self.indice is not None:
+            return f"Ecuación {self.indice + 1}: {self.mensaje}"
+        return self.mensaje
+
+def analizar_ecuacion(ec, variables_dict):
+    """
+    Analiza una ecuación lineal en una sola pasada de izquierda a derecha.
+
+    Los espacios se ignoran. Cada término del lado izquierdo se reconoce con un
+    único patrón precompilado anclado en la posición actual, por lo que el costo
+    es lineal en la longitud de la ecuación. Los nombres de variable nuevos se
+    internan y se agregan a `variables_dict`.
+
+    Args:
+        ec (str): Ecuación, por ejemplo "2x + 3y - 1 = 5".
+        variables_dict (dict): Nombre de variable -> índice de columna; se actualiza.
+
+    Returns:
+        tuple: (pares, lado_derecho) con la lista de pares (índice, coeficiente) en
+        el orden en que aparecen y las constantes del lado izquierdo ya pasadas a la derecha.
+
+    Raises:
+        ErrorEcuacion: Con el término que no se pudo reconocer y su posición.
+    """
+    texto = _PATRON_ESPACIOS.sub('', ec)
+    izq, signo_igual, der_str = texto.partition('=')
+    if not signo_igual:
+        raise ErrorEcuacion("La ecuación debe contener un signo '='.", ec)
+    if '=' in der_str:
+        posicion = len(izq) + 1 + der_str.index('=')
+        raise ErrorEcuacion(f"La ecuación debe tener solo un signo '=' (segundo '=' en la posición {posicion + 1}).", ec, '=', posicion)
+
+    try: der = float(der_str)
+    except ValueError:
+        raise ErrorEcuacion(f"El lado derecho ('{der_str}') debe ser un número.", ec, der_str, len(izq) + 1)
+
+    pares = []
+    constante_izq = 0.0
+    posicion = 0
+    longitud = len(izq)
+    buscar_termino = _PATRON_TERMINO.match
+
+    while posicion < longitud:
+        termino = buscar_termino(izq, posicion)
+        signos, num_str, var = termino.groups()
+        # Todo término salvo el primero debe empezar con un signo
+        if (num_str is None and var is None) or (not signos and posicion > 0):
+            token = _PATRON_TOKEN.match(izq, posicion).group() or izq[posicion]
+            raise ErrorEcuacion(f"Término no reconocido '{token}' en la posición {posicion + 1} de '{texto}'.",
+                                ec, token, posicion)
+
+        coeficiente = float(num_str) if num_str else 1.0
+        if signos.count('-') % 2: coeficiente = -coeficiente
+
+        if var is None:
+            constante_izq += coeficiente
+        else:
+            indice = variables_dict.get(var)
+            if indice is None:
+                indice = variables_dict[sys.intern(var)] = len(variables_dict)
+            pares.append((indice, coeficiente))
+        posicion = termino.end()
+
+    return pares, der - constante_izq
+
+def coeficientes_ecuacion(ec, variables_dict):
+    """
+    Analiza una ecuación lineal y devuelve sus coeficientes como diccionario
+    disperso {índice de variable: coeficiente}, actualizando `variables_dict`.
+
+    Returns:
+        tuple: (coeficientes, lado_derecho) con las constantes del lado izquierdo ya pasadas a la derecha.
+
+    Raises:
+        ErrorEcuacion: Si la ecuación no tiene un formato válido.
+    """
+    pares, lado_derecho = analizar_ecuacion(ec, variables_dict)
+    coeficientes = {}
+    for indice, coeficiente in pares:
+        coeficientes[indice] = coeficientes.get(indice, 0.0) + coeficiente
+    return coeficientes, lado_derecho
+
+def matriz_desde_ecuaciones(ecuaciones, variables_dict=None, salida=None, cache=None):
+    """
+    Analiza muchas ecuaciones y llena la matriz aumentada en una sola llamada.
+
+    Los pares (fila, columna, coeficiente) se acumulan en listas planas y se
+    vuelcan con una única operación de NumPy sobre una matriz reservada una vez.
+
+    Args:
+        ecuaciones (iterable of str): Ecuaciones a analizar.
+        variables_dict (dict, optional): Índices de variables ya conocidos; se actualiza.
+        salida (np.array, optional): Matriz preasignada con al menos tantas filas como
+            ecuaciones y columnas como variables + 1; el lado derecho va en la última columna.
+        cache (CacheEcuaciones, optional): Caché de ecuaciones ya analizadas.
+
+    Returns:
+        tuple: (matriz, variables_dict).
+
+    Raises:
+        ErrorEcuacion: Con el índice de la ecuación que falló.
+    """
+    if variables_dict is None:
+        variables_dict = {}
+    filas = []
+    columnas = []
+    valores = []
+    lados_derechos = []
+    analizar = analizar_ecuacion if cache is None else cache.analizar_ecuacion
+
+    for i, ec in enumerate(ecuaciones):
+        try:
+            pares, lado_derecho = analizar(ec, variables_dict)
+        except ErrorEcuacion as e:
+            e.indice = i
+            raise
+        if pares:
+            indices, coeficientes = zip(*pares)
+            filas.extend([i] * len(pares))
+            columnas.extend(indices)
+            valores.extend(coeficientes)
+        lados_derechos.append(lado_derecho)
+
+    num_filas = len(lados_derechos)
+    num_variables = len(variables_dict)
+    if salida is None:
+        salida = np.zeros((num_filas, num_variables + 1))
+    else:
+        if salida.shape[0] < num_filas or salida.shape[1] < num_variables + 1:
+            raise ValueError(f"La matriz de salida {salida.shape} no alcanza para {num_filas} ecuaciones y {num_variables} variables.")
+        salida = salida[:num_filas]
+        salida[...] = 0.0
+
+    # Índices lineales + bincount suman los términos repetidos de una misma ecuación
+    ancho = salida.shape[1]
+    posiciones = np.array(filas, dtype=np.intp) * ancho + np.array(columnas, dtype=np.intp)
+    acumulado = np.bincount(posiciones, weights=valores, minlength=num_filas * ancho)
+    salida += acumulado.reshape(num_filas, ancho)
+    salida[:, -1] = lados_derechos
+    return salida, variables_dict
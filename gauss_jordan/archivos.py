@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+Importación y exportación binaria de sistemas y resultados.
+
+- Sistemas densos en NPZ: "coeficientes" (m×n), "lados_derechos" (m) y
+  "variables" (nombres como cadenas, sin pickle).
+- Sistemas dispersos en Matrix Market (formato de coordenadas).
+- Resultados en NPZ: RREF, clasificación, rango, columnas pivote y libres,
+  solución particular y base del espacio nulo.
+
+Los NPZ sin comprimir se mapean en memoria al cargarlos: cada arreglo se lee
+directamente del archivo con `np.memmap`, sin copiarlo ni analizar texto.
+"""
+import struct
+import tokenize
+import zipfile
+import zlib
+
+import numpy as np
+
+from .disperso import SistemaDisperso
+from .interpretacion import SISTEMA_INCONSISTENTE, ResultadoSistema
+
+#--------------------------------------------------------------------------
+# NPZ con mapeo en memoria
+#--------------------------------------------------------------------------
+_CABECERA_LOCAL_ZIP = struct.Struct("<IHHHHHIIIHH") # Cabecera local de un miembro ZIP (30 bytes)
+_FIRMA_CABECERA_LOCAL = 0x04034b50
+# Lo que lanzan zipfile y np.lib.format con un miembro truncado o dañado (la cabecera .npy se analiza como código)
+_ERRORES_MIEMBRO = (ValueError, EOFError, SyntaxError, tokenize.TokenError, zipfile.BadZipFile, zlib.error)
+
+def _mapear_miembro(archivo, ruta, info):
+    """`np.memmap` de un .npy guardado sin comprimir dentro del ZIP, o None si no se puede mapear."""
+    archivo.seek(info.header_offset)
+    campos = _CABECERA_LOCAL_ZIP.unpack(archivo.read(_CABECERA_LOCAL_ZIP.size))
+    if campos[0] != _FIRMA_CABECERA_LOCAL:
+        return None
+    archivo.seek(info.header_offset + _CABECERA_LOCAL_ZIP.size + campos[9] + campos[10])
+    version = np.lib.format.read_magic(archivo)
+    if version == (1, 0):
+        forma, fortran, tipo = np.lib.format.read_array_header_1_0(archivo)
+    elif version == (2, 0):
+        forma, fortran, tipo = np.lib.format.read_array_header_2_0(archivo)
+    else:
+        return None
+    if tipo.hasobject:
+        return None
+    if 0 in forma:
+        return np.empty(forma, dtype=tipo)
+    return np.memmap(ruta, dtype=tipo, mode="r", offset=archivo.tell(), shape=forma, order="F" if fortran else "C")
+
+def cargar_npz(ruta, mmap=True):
+    """
+    Carga todos los arreglos de un NPZ sin permitir pickle.
+
+    Args:
+        ruta (str): Archivo .npz.
+        mmap (bool): Mapea en memoria (sólo lectura) los miembros guardados sin
+            comprimir; los comprimidos siempre se descomprimen en memoria.
+
+    Returns:
+        dict: Nombre del arreglo -> np.array (o np.memmap).
+
+    Raises:
+        ValueError: Si el archivo no es un NPZ o algún arreglo está truncado o dañado.
+    """
+    try:
+        with zipfile.ZipFile(ruta) as zf:
+            infos = [info for info in zf.infolist() if info.filename.endswith(".npy")]
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"'{ruta}' no es un archivo NPZ válido: {e}") from e
+    arreglos = {}
+    try:
+        if mmap:
+            with open(ruta, "rb") as archivo:
+                for info in infos:
+                    if info.compress_type == zipfile.ZIP_STORED:
+                        arreglo = _mapear_miembro(archivo, ruta, info)
+                        if arreglo is not None:
+                            arreglos[info.filename[:-4]] = arreglo
+        if len(arreglos) < len(infos):
+            with np.load(ruta, allow_pickle=False) as datos:
+                for nombre in datos.files:
+                    if nombre not in arreglos:
+                        arreglos[nombre] = datos[nombre]
+    except _ERRORES_MIEMBRO as e:
+        raise ValueError(f"'{ruta}' tiene un arreglo truncado o dañado: {e}") from e
+    return arreglos
+
+def _campos_requeridos(arreglos, ruta, *nombres):
+    faltan = [nombre for nombre in nombres if nombre not in arreglos]
+    if faltan:
+        raise ValueError(f"El archivo '{ruta}' no tiene los arreglos {', '.join(faltan)}.")
+
+#--------------------------------------------------------------------------
+# Sistemas densos (NPZ)
+#--------------------------------------------------------------------------
+def nombres_predeterminados(num_variables):
+    return [f"x{i + 1}" for i in range(num_variables)]
+
+def guardar_sistema_npz(ruta, coeficientes, lados_derechos, nombres_variables=None, comprimir=True):
+    """
+    Guarda un sistema denso A·x = b en NPZ.
+
+    Con `comprimir=False` el archivo ocupa más pero `cargar_sistema_npz` lo
+    mapea en memoria en lugar de leerlo. NumPy agrega ".npz" si la ruta no
+    tiene extensión.
+
+    Raises:
+        ValueError: Si las dimensiones o la cantidad de nombres no concuerdan.
+    """
+    coeficientes = np.asarray(coeficientes, dtype=float)
+    lados_derechos = np.asarray(lados_derechos, dtype=float)
+    if coeficientes.ndim != 2 or lados_derechos.shape != (coeficientes.shape[0],):
+        raise ValueError(f"Dimensiones inconsistentes (coeficientes: {coeficientes.shape}, "
+                         f"lados derechos: {lados_derechos.shape}).")
+    nombres = nombres_predeterminados(coeficientes.shape[1]) if nombres_variables is None else list(nombres_variables)
+    if len(nombres) != coeficientes.shape[1]:
+        raise ValueError(f"Hay {len(nombres)} nombres para {coeficientes.shape[1]} variables.")
+    guardar = np.savez_compressed if comprimir else np.savez
+    guardar(ruta, coeficientes=coeficientes, lados_derechos=lados_derechos, variables=np.array(nombres, dtype=str))
+
+def cargar_sistema_npz(ruta, mmap=True):
+    """
+    Carga un sistema guardado con `guardar_sistema_npz`.
+
+    Returns:
+        tuple: (coeficientes, lados_derechos, nombres_variables). Los arreglos
+        son de sólo lectura si se mapearon en memoria.
+
+    Raises:
+        ValueError: Si faltan arreglos o las dimensiones no concuerdan.
+    """
+    arreglos = cargar_npz(ruta, mmap)
+    _campos_requeridos(arreglos, ruta, "coeficientes", "lados_derechos")
+    coeficientes, lados_derechos = arreglos["coeficientes"], arreglos["lados_derechos"]
+    if coeficientes.ndim != 2 or lados_derechos.shape != (coeficientes.shape[0],):
+        raise ValueError(f"Dimensiones inconsistentes en '{ruta}' (coeficientes: {coeficientes.shape}, "
+                         f"lados derechos: {lados_derechos.shape}).")
+    if "variables" in arreglos:
+        nombres = [str(nombre) for nombre in arreglos["variables"]]
+        if len(nombres) != coeficientes.shape[1]:
+            raise ValueError(f"'{ruta}' tiene {len(nombres)} nombres para {coeficientes.shape[1]} variables.")
+    else:
+        nombres = nombres_predeterminados(coeficientes.shape[1])
+    return coeficientes, lados_derechos, nombres
+
+def matriz_aumentada(coeficientes, lados_derechos, salida=None):
+    """
+    Copia [A | b] en `salida` (o en una matriz nueva), lista para eliminar con sobrescribir=True.
+
+    Es la única copia necesaria para resolver un sistema mapeado en memoria.
+    """
+    num_filas, num_variables = np.shape(coeficientes)
+    if salida is None:
+        salida = np.empty((num_filas, num_variables + 1))
+    salida[:, :-1] = coeficientes
+    salida[:, -1] = lados_derechos
+    return salida
+
+#--------------------------------------------------------------------------
+# Sistemas dispersos (Matrix Market)
+#--------------------------------------------------------------------------
+def guardar_matrix_market(ruta, sistema, nombres_variables=None):
+    """
+    Guarda un SistemaDisperso como matriz aumentada [A | b] en formato de coordenadas.
+
+    Sólo se escriben las entradas no nulas, con 17 cifras significativas (los
+    valores se recuperan exactos). Los nombres de las variables van en un comentario.
+    """
+    num_filas, num_variables = len(sistema.filas), sistema.num_variables
+    nombres = nombres_predeterminados(num_variables) if nombres_variables is None else list(nombres_variables)
+    if len(nombres) != num_variables:
+        raise ValueError(f"Hay {len(nombres)} nombres para {num_variables} variables.")
+    filas, columnas, valores = [], [], []
+    for i, (fila, lado_derecho) in enumerate(zip(sistema.filas, sistema.lados_derechos)):
+        for c, v in fila.items():
+            filas.append(i)
+            columnas.append(c)
+            valores.append(v)
+        if lado_derecho != 0.0:
+            filas.append(i)
+            columnas.append(num_variables)
+            valores.append(lado_derecho)
+
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("%%MatrixMarket matrix coordinate real general\n")
+        archivo.write("% gauss_jordan: matriz aumentada [A | b]; la última columna es el lado derecho\n")
+        archivo.write(f"% variables: {' '.join(nombres)}\n")
+        archivo.write(f"{num_filas} {num_variables + 1} {len(valores)}\n")
+        if valores:
+            datos = np.column_stack([np.array(filas) + 1, np.array(columnas) + 1, np.array(valores, dtype=float)])
+            np.savetxt(archivo, datos, fmt=["%d", "%d", "%.17g"])
+
+def _leer_matrix_market(ruta):
+    """Devuelve ((filas, columnas), i, j, valores, comentarios) con índices desde 0, expandiendo simetrías."""
+    with open(ruta, encoding="utf-8") as archivo:
+        cabecera = archivo.readline().split()
+        if len(cabecera) != 5 or cabecera[0].lower() != "%%matrixmarket" or cabecera[1].lower() != "matrix":
+            raise ValueError(f"'{ruta}' no es un archivo Matrix Market.")
+        formato, campo, simetria = (palabra.lower() for palabra in cabecera[2:])
+        if campo not in ("real", "integer", "pattern") or simetria not in ("general", "symmetric", "skew-symmetric"):
+            raise ValueError(f"Matrix Market no soportado en '{ruta}': {campo} {simetria}.")
+        comentarios = []
+        linea = archivo.readline()
+        while linea.startswith("%") or not linea.strip():
+            if not linea:
+                raise ValueError(f"'{ruta}' no tiene la línea de dimensiones.")
+            comentarios.append(linea[1:].strip())
+            linea = archivo.readline()
+        dimensiones = [int(v) for v in linea.split()]
+        datos = np.array(list(map(float, archivo.read().split())))
+
+    if formato == "array":
+        num_filas, num_cols = dimensiones
+        if simetria != "general" or datos.size != num_filas * num_cols:
+            raise ValueError(f"Matrix Market en formato array inválido o no soportado en '{ruta}'.")
+        i, j = np.divmod(np.arange(num_filas * num_cols), num_filas)[::-1] # Orden por columnas
+        return (num_filas, num_cols), i, j, datos, comentarios
+    if formato != "coordinate" or len(dimensiones) != 3:
+        raise ValueError(f"Formato Matrix Market no soportado en '{ruta}': {formato}.")
+
+    num_filas, num_cols, no_nulos = dimensiones
+    ancho = 2 if campo == "pattern" else 3
+    if datos.size != no_nulos * ancho:
+        raise ValueError(f"'{ruta}' declara {no_nulos} entradas y tiene {datos.size // ancho}.")
+    datos = datos.reshape(no_nulos, ancho)
+    i, j = datos[:, 0].astype(np.intp) - 1, datos[:, 1].astype(np.intp) - 1
+    valores = np.ones(no_nulos) if campo == "pattern" else datos[:, 2]
+    if simetria != "general":
+        fuera = i != j
+        signo = -1.0 if simetria == "skew-symmetric" else 1.0
+        i, j, valores = (np.concatenate([i, j[fuera]]), np.concatenate([j, i[fuera]]),
+                         np.concatenate([valores, signo * valores[fuera]]))
+    if no_nulos and (i.min() < 0 or j.min() < 0 or i.max() >= num_filas or j.max() >= num_cols):
+        raise ValueError(f"'{ruta}' tiene índices fuera de las dimensiones {num_filas}×{num_cols}.")
+    return (num_filas, num_cols), i, j, valores, comentarios
+
+def cargar_matrix_market(ruta, ruta_lados_derechos=None):
+    """
+    Carga un sistema disperso desde Matrix Market.
+
+    Sin `ruta_lados_derechos` el archivo es la matriz aumentada [A | b] (el
+    formato de `guardar_matrix_market`); con ella, el archivo es A y b se lee
+    del segundo archivo (un vector m×1 en formato array o de coordenadas).
+    Las entradas repetidas se suman y las nulas se descartan.
+
+    Returns:
+        tuple: (SistemaDisperso, nombres_variables).
+
+    Raises:
+        ValueError: Si el archivo no es válido o las dimensiones no concuerdan.
+    """
+    (num_filas, num_cols), i, j, valores, comentarios = _leer_matrix_market(ruta)
+    if ruta_lados_derechos is None:
+        if num_cols < 1:
+            raise ValueError(f"La matriz aumentada de '{ruta}' no tiene columna de lado derecho.")
+        num_variables = num_cols - 1
+        lados_derechos = np.zeros(num_filas)
+        en_lado_derecho = j == num_variables
+        np.add.at(lados_derechos, i[en_lado_derecho], valores[en_lado_derecho])
+        i, j, valores = i[~en_lado_derecho], j[~en_lado_derecho], valores[~en_lado_derecho]
+    else:
+        num_variables = num_cols
+        (filas_b, cols_b), i_b, _, valores_b, _ = _leer_matrix_market(ruta_lados_derechos)
+        if filas_b != num_filas or cols_b != 1:
+            raise ValueError(f"El lado derecho {filas_b}×{cols_b} no concuerda con {num_filas} ecuaciones.")
+        lados_derechos = np.zeros(num_filas)
+        np.add.at(lados_derechos, i_b, valores_b)
+
+    # Índices lineales ordenados: las repetidas quedan juntas y se suman con reduceat
+    posiciones = i * num_variables + j
+    orden = np.argsort(posiciones, kind="stable")
+    posiciones, valores = posiciones[orden], valores[orden]
+    if posiciones.size:
+        inicios = np.flatnonzero(np.r_[True, posiciones[1:] != posiciones[:-1]])
+        posiciones, valores = posiciones[inicios], np.add.reduceat(valores, inicios)
+    no_nulos = valores != 0.0
+    i, j = np.divmod(posiciones[no_nulos], max(num_variables, 1))
+    cortes = np.searchsorted(i, np.arange(1, num_filas))
+    filas = [dict(zip(columnas.tolist(), coeficientes.tolist()))
+             for columnas, coeficientes in zip(np.split(j, cortes), np.split(valores[no_nulos], cortes))]
+
+    nombres = nombres_predeterminados(num_variables)
+    for comentario in comentarios:
+        if comentario.startswith("variables:"):
+            declarados = comentario[len("variables:"):].split()
+            if len(declarados) == num_variables:
+                nombres = declarados
+    return SistemaDisperso(filas, lados_derechos.tolist(), num_variables), nombres
+
+#--------------------------------------------------------------------------
+# Resultados (NPZ)
+#--------------------------------------------------------------------------
+def guardar_resultado(ruta, resultado, matriz_rref=None, comprimir=False):
+    """
+    Guarda un ResultadoSistema (y opcionalmente su RREF) en NPZ, con precisión completa.
+
+    Por defecto no se comprime, para que `cargar_resultado` mapee los arreglos.
+    """
+    num_variables = len(resultado.nombres_variables)
+    arreglos = {
+        "clasificacion": np.array(resultado.clasificacion),
+        "variables": np.array(resultado.nombres_variables, dtype=str),
+        "rango": np.array(-1 if resultado.rango is None else resultado.rango, dtype=np.int64),
+        "columnas_pivote": np.asarray(resultado.columnas_pivote, dtype=np.int64),
+        "columnas_libres": np.asarray(resultado.columnas_libres, dtype=np.int64),
+        "solucion": np.zeros(0) if resultado.solucion is None else np.asarray(resultado.solucion, dtype=float),
+        "base_nula": (np.zeros((num_variables, 0)) if resultado.base_nula is None
+                      else np.asarray(resultado.base_nula, dtype=float)),
+        "valor_inconsistente": np.array(np.nan if resultado.valor_inconsistente is None
+                                        else resultado.valor_inconsistente, dtype=float),
+    }
+    if matriz_rref is not None:
+        arreglos["rref"] = np.asarray(matriz_rref, dtype=float)
+    (np.savez_compressed if comprimir else np.savez)(ruta, **arreglos)
+
+def cargar_resultado(ruta, mmap=True):
+    """
+    Carga un resultado guardado con `guardar_resultado`.
+
+    Returns:
+        tuple: (ResultadoSistema, matriz_rref o None).
+
+    Raises:
+        ValueError: Si faltan arreglos.
+    """
+    arreglos = cargar_npz(ruta, mmap)
+    _campos_requeridos(arreglos, ruta, "clasificacion", "variables", "rango", "columnas_pivote",
+                       "columnas_libres", "solucion", "base_nula", "valor_inconsistente")
+    clasificacion = str(arreglos["clasificacion"])
+    nombres = [str(nombre) for nombre in arreglos["variables"]]
+    if clasificacion == SISTEMA_INCONSISTENTE:
+        resultado = ResultadoSistema(clasificacion, nombres,
+                                     valor_inconsistente=float(arreglos["valor_inconsistente"]))
+    else:
+        resultado = ResultadoSistema(clasificacion, nombres, int(arreglos["rango"]),
+                                     arreglos["columnas_pivote"], arreglos["columnas_libres"],
+                                     arreglos["solucion"], arreglos["base_nula"])
+    return resultado, arreglos.get("rref")
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Caché de ecuaciones analizadas, reutilizable entre sistemas y opcionalmente persistente."""
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from .analizador import _PATRON_ESPACIOS, analizar_ecuacion
+
+#--------------------------------------------------------------------------
+# Caché LRU de ecuaciones analizadas
+#--------------------------------------------------------------------------
+def _analizar_por_nombre(ec):
+    """(nombres, coeficientes, lado_derecho) con los términos repetidos ya sumados, en orden de aparición."""
+    locales = {}
+    pares, lado_derecho = analizar_ecuacion(ec, locales)
+    coeficientes = [0.0] * len(locales)
+    for indice, coeficiente in pares:
+        coeficientes[indice] += coeficiente
+    return tuple(locales), tuple(coeficientes), lado_derecho
+
+class CacheEcuaciones:
+    """
+    Caché LRU de ecuaciones analizadas, indexada por el texto sin espacios.
+
+    Cada entrada guarda los coeficientes por nombre de variable (en el orden en
+    que aparecen) y no por índice de columna, así que sirve en cualquier
+    sistema: al reutilizarla sólo se traducen los nombres a los índices de
+    `variables_dict`, sin volver a analizar el texto. El resultado es idéntico
+    al de `analizar_ecuacion`/`coeficientes_ecuacion`, incluido el orden en que
+    se agregan las variables nuevas. Las ecuaciones con error no se guardan.
+
+    Se puede compartir entre hilos. Con `ruta`, las entradas se cargan al crear
+    la caché (si el archivo existe) y `guardar()` las escribe en JSON.
+    """
+    VERSION_ARCHIVO = 1
+
+    def __init__(self, max_entradas=10000, ruta=None):
+        self.max_entradas = max_entradas
+        self.ruta = ruta
+        self._entradas = OrderedDict()
+        self._candado = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        if ruta is not None and os.path.exists(ruta):
+            self.cargar(ruta)
+
+    @staticmethod
+    def clave(ec):
+        """Texto normalizado de la ecuación (sin espacios), igual al que ve el analizador."""
+        return _PATRON_ESPACIOS.sub('', ec)
+
+    def obtener(self, ec):
+        """
+        Devuelve (nombres, coeficientes, lado_derecho) de `ec`, analizándola sólo si no está en caché.
+
+        Raises:
+            ErrorEcuacion: Si la ecuación no tiene un formato válido.
+        """
+        clave = self.clave(ec)
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self.aciertos += 1
+                self._entradas.move_to_end(clave)
+                return entrada
+            self.fallos += 1
+
+        entrada = _analizar_por_nombre(ec)
+        with self._candado:
+            self._guardar_entrada(clave, entrada)
+        return entrada
+
+    def _guardar_entrada(self, clave, entrada):
+        self._entradas[clave] = entrada
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+            self.desalojos += 1
+
+    def analizar_ecuacion(self, ec, variables_dict):
+        """Como `analizar_ecuacion`, pero con un par por variable (los términos repetidos ya sumados)."""
+        nombres, coeficientes, lado_derecho = self.obtener(ec)
+        pares = []
+        for nombre, coeficiente in zip(nombres, coeficientes):
+            indice = variables_dict.get(nombre)
+            if indice is None:
+                indice = variables_dict[nombre] = len(variables_dict)
+            pares.append((indice, coeficiente))
+        return pares, lado_derecho
+
+    def coeficientes_ecuacion(self, ec, variables_dict):
+        """Como `coeficientes_ecuacion`: ({índice de variable: coeficiente}, lado_derecho)."""
+        pares, lado_derecho = self.analizar_ecuacion(ec, variables_dict)
+        return dict(pares), lado_derecho
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "entradas": len(self._entradas),
+            "max_entradas": self.max_entradas,
+            "tasa_aciertos": self.aciertos / consultas if consultas else None,
+        }
+
+    def limpiar(self):
+        with self._candado:
+            self._entradas.clear()
+
+    #----------------------------------------------------------------------
+    # Persistencia en disco
+    #----------------------------------------------------------------------
+    def guardar(self, ruta=None):
+        """
+        Escribe las entradas en JSON (de la menos a la más usada) de forma atómica.
+
+        Raises:
+            ValueError: Si no se indicó ninguna ruta.
+        """
+        ruta = ruta or self.ruta
+        if ruta is None:
+            raise ValueError("No se indicó el archivo de la caché.")
+        with self._candado:
+            entradas = [[clave, list(nombres), list(coeficientes), lado_derecho]
+                        for clave, (nombres, coeficientes, lado_derecho) in self._entradas.items()]
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump({"version": self.VERSION_ARCHIVO, "entradas": entradas}, archivo, ensure_ascii=False)
+        os.replace(temporal, ruta)
+
+    def cargar(self, ruta=None):
+        """
+        Agrega las entradas de un archivo escrito por `guardar`; un archivo de otra versión se ignora.
+
+        Returns:
+            int: Número de entradas cargadas.
+
+        Raises:
+            ValueError: Si no se indicó ninguna ruta o el archivo no tiene el formato esperado.
+        """
+        ruta = ruta or self.ruta
+        if ruta is None:
+            raise ValueError("No se indicó el archivo de la caché.")
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        if not isinstance(datos, dict) or datos.get("version") != self.VERSION_ARCHIVO:
+            return 0
+        try:
+            entradas = []
+            for clave, nombres, coeficientes, lado_derecho in datos["entradas"]:
+                nombres = tuple(sys.intern(str(nombre)) for nombre in nombres)
+                coeficientes = tuple(map(float, coeficientes))
+                if len(nombres) != len(coeficientes):
+                    raise ValueError(f"la entrada '{clave}' tiene {len(nombres)} nombres y {len(coeficientes)} coeficientes")
+                entradas.append((str(clave), (nombres, coeficientes, float(lado_derecho))))
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Archivo de caché inválido '{ruta}': {e}") from e
+        with self._candado:
+            for clave, entrada in entradas:
+                self._guardar_entrada(clave, entrada)
+        return len(entradas)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Modo por lotes sin interfaz gráfica.
+
+Lee sistemas de archivos o de la entrada estándar (un sistema por bloque de
+líneas, separados por líneas en blanco) y escribe un resultado JSON por línea.
+La entrada se procesa en flujo: cada sistema se resuelve y se escribe en cuanto
+termina su bloque, sin cargar el archivo completo.
+
+Uso:
+    python -m gauss_jordan [archivos ...] [-o salida.jsonl] [--exacto] [--estadisticas] [--instrumentar]
+                           [--cache 10000] [--archivo-cache cache.json] [--precision-mixta]
+
+Con --exacto los valores racionales se escriben como cadenas "p/q". Con
+--instrumentar cada línea agrega "instrumentacion" con los contadores de
+pivotes, los flops estimados y los tiempos por fase del sistema. Las ecuaciones
+repetidas entre sistemas se analizan una sola vez (caché LRU de --cache
+entradas); con --archivo-cache la caché se carga al empezar y se guarda al
+terminar, para reutilizarla entre ejecuciones.
+
+Los archivos .npz (de `guardar_sistema_npz`) y .mtx (Matrix Market, matriz
+aumentada [A | b]) se resuelven como un único sistema cada uno, sin analizar
+ecuaciones de texto; los .npz sin comprimir se mapean en memoria. Si uno no
+existe o está truncado o dañado, su línea es {"sistema": k, "error": ...} y el
+lote sigue con el archivo siguiente, igual que con un error de análisis.
+
+Con --precision-mixta los sistemas densos se factorizan en float32 y se
+refinan en float64 (ver `eliminacion_gauss_jordan_mixta`); cada línea agrega
+"precision" con la ruta tomada y los pasos de refinamiento.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+from contextlib import nullcontext
+
+from . import TIEMPO_IMPORTACION
+from .archivos import cargar_matrix_market, cargar_sistema_npz
+from .cache_ecuaciones import CacheEcuaciones
+from .instrumentacion import instrumentar
+from .interpretacion import resultado_a_json
+from .resolucion import resolver_ecuaciones, resolver_matriz, resolver_sistema
+
+# Errores que se escriben como la línea {"error": ...} del sistema en lugar de detener el lote:
+# entradas inválidas y archivos .npz/.mtx inexistentes, ilegibles o truncados
+ERRORES_POR_SISTEMA = (ValueError, OSError, EOFError, zipfile.BadZipFile)
+
+def leer_sistemas(lineas):
+    """Agrupa un iterable de líneas en listas de ecuaciones separadas por líneas en blanco."""
+    bloque = []
+    for linea in lineas:
+        linea = linea.strip()
+        if linea:
+            bloque.append(linea)
+        elif bloque:
+            yield bloque
+            bloque = []
+    if bloque:
+        yield bloque
+
+def _escribir_resultado(salida, numero, resolver, instrumentado):
+    """Ejecuta `resolver()` (instrumentado si se pidió) y escribe su línea JSON; devuelve True si falló."""
+    with instrumentar() if instrumentado else nullcontext() as instrumentacion:
+        try:
+            resultado = resolver()
+            fallo = False
+        except ERRORES_POR_SISTEMA as e:
+            resultado = {"error": str(e) or type(e).__name__}
+            fallo = True
+    resultado = {"sistema": numero, **resultado}
+    if instrumentado:
+        resultado["instrumentacion"] = instrumentacion.a_dict()
+    salida.write(resultado_a_json(resultado) + "\n")
+    return fallo
+
+def resolver_flujo(lineas, salida, numero_inicial=0, exacto=False, instrumentado=False, cache=None,
+                   precision_mixta=False):
+    """
+    Resuelve cada sistema de `lineas` y escribe su resultado como una línea JSON en `salida`.
+
+    Returns:
+        tuple: (sistemas, ecuaciones, errores) procesados.
+    """
+    sistemas = ecuaciones = errores = 0
+    for bloque in leer_sistemas(lineas):
+        errores += _escribir_resultado(salida, numero_inicial + sistemas,
+                                       lambda: resolver_ecuaciones(bloque, exacto, cache, precision_mixta),
+                                       instrumentado)
+        sistemas += 1
+        ecuaciones += len(bloque)
+    return sistemas, ecuaciones, errores
+
+def resolver_archivo_binario(ruta, salida, numero=0, exacto=False, instrumentado=False, precision_mixta=False):
+    """
+    Resuelve el sistema de un archivo .npz o .mtx y escribe su línea JSON en `salida`.
+
+    Returns:
+        tuple: (sistemas, ecuaciones, errores) procesados, como `resolver_flujo`.
+    """
+    ecuaciones = 0
+    def resolver():
+        nonlocal ecuaciones
+        if ruta.lower().endswith(".npz"):
+            coeficientes, lados_derechos, nombres = cargar_sistema_npz(ruta)
+            ecuaciones = coeficientes.shape[0]
+            return resolver_matriz(coeficientes, lados_derechos, nombres, exacto, precision_mixta)
+        sistema, nombres = cargar_matrix_market(ruta)
+        ecuaciones = len(sistema.filas)
+        return resolver_sistema(sistema, nombres, exacto, precision_mixta)
+    errores = _escribir_resultado(salida, numero, resolver, instrumentado)
+    return 1, ecuaciones, int(errores)
+
+def main(argv=None):
+    inicio = time.perf_counter()
+    parser = argparse.ArgumentParser(prog="python -m gauss_jordan",
+                                     description="Resuelve sistemas de ecuaciones por lotes y escribe JSON por línea.")
+    parser.add_argument("archivos", nargs="*", default=["-"], help="Archivos de entrada ('-' es la entrada estándar).")
+    parser.add_argument("-o", "--salida", default="-", help="Archivo de salida JSONL ('-' es la salida estándar).")
+    parser.add_argument("--exacto", action="store_true",
+                        help="Aritmética racional exacta (eliminación sin fracciones de Bareiss).")
+    parser.add_argument("--estadisticas", action="store_true",
+                        help="Informa en stderr el tiempo de arranque y el rendimiento.")
+    parser.add_argument("--instrumentar", action="store_true",
+                        help="Agrega a cada resultado los contadores y tiempos del solucionador.")
+    parser.add_argument("--cache", type=int, default=10000, metavar="ENTRADAS",
+                        help="Ecuaciones analizadas que se recuerdan entre sistemas (0 = sin caché).")
+    parser.add_argument("--archivo-cache", default=None,
+                        help="Archivo JSON de la caché de ecuaciones, persistente entre ejecuciones.")
+    parser.add_argument("--precision-mixta", action="store_true",
+                        help="Factoriza los sistemas densos en float32 y refina en float64.")
+    args = parser.parse_args(argv)
+
+    cache = CacheEcuaciones(args.cache, args.archivo_cache) if args.cache > 0 else None
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    arranque = TIEMPO_IMPORTACION + (time.perf_counter() - inicio)
+    total_sistemas = total_ecuaciones = total_errores = 0
+    inicio_proceso = time.perf_counter()
+    try:
+        for nombre in args.archivos:
+            if os.path.splitext(nombre)[1].lower() in (".npz", ".mtx"):
+                sistemas, ecuaciones, errores = resolver_archivo_binario(nombre, salida, total_sistemas, args.exacto,
+                                                                         args.instrumentar, args.precision_mixta)
+            else:
+                entrada = sys.stdin if nombre == "-" else open(nombre, encoding="utf-8")
+                try:
+                    sistemas, ecuaciones, errores = resolver_flujo(entrada, salida, total_sistemas, args.exacto,
+                                                                      args.instrumentar, cache, args.precision_mixta)
+                finally:
+                    if entrada is not sys.stdin:
+                        entrada.close()
+            total_sistemas += sistemas
+            total_ecuaciones += ecuaciones
+            total_errores += errores
+    finally:
+        if cache is not None and args.archivo_cache:
+            cache.guardar()
+        if salida is not sys.stdout:
+            salida.close()
+        else:
+            salida.flush()
+
+    if args.estadisticas:
+        duracion = time.perf_counter() - inicio_proceso
+        estadisticas = {
+            "arranque_s": round(arranque, 6),
+            "proceso_s": round(duracion, 6),
+            "sistemas": total_sistemas,
+            "ecuaciones": total_ecuaciones,
+            "errores": total_errores,
+            "sistemas_por_s": round(total_sistemas / duracion, 2) if duracion > 0 else None,
+            "ecuaciones_por_s": round(total_ecuaciones / duracion, 2) if duracion > 0 else None,
+            "cache": cache.estadisticas() if cache is not None else None,
+        }
+        print(json.dumps(estadisticas), file=sys.stderr)
+    return 0
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Motor disperso de Gauss-Jordan con orden de pivotes de Markowitz."""
+import heapq
+
+import numpy as np
+
+from .analizador import coeficientes_ecuacion
+from .instrumentacion import fase, instrumentacion_activa
+from .interpretacion import SOLUCION_UNICA, SOLUCIONES_INFINITAS, SISTEMA_INCONSISTENTE
+
+#--------------------------------------------------------------------------
+# Motor disperso de Gauss-Jordan
+#--------------------------------------------------------------------------
+UMBRAL_DENSIDAD_DISPERSA = 0.05 # Por debajo de esta densidad se usa el motor disperso
+MIN_VARIABLES_DISPERSO = 100    # En sistemas pequeños la matriz densa siempre es más rápida
+
+class SistemaDisperso:
+    """
+    Sistema lineal almacenado por filas: cada fila es un diccionario
+    {índice de variable: coeficiente} con sólo las entradas no nulas.
+    """
+    def __init__(self, filas, lados_derechos, num_variables):
+        self.filas = filas
+        self.lados_derechos = list(lados_derechos)
+        self.num_variables = num_variables
+
+    @classmethod
+    def desde_ecuaciones(cls, ecuaciones, variables_dict, cache=None):
+        """
+        Construye el sistema directamente a partir de los diccionarios de
+        coeficientes del analizador, sin pasar por filas densas. Con `cache`
+        (una CacheEcuaciones) las ecuaciones ya vistas no se vuelven a analizar.
+
+        Raises:
+            ValueError: Si alguna ecuación no tiene un formato válido.
+        """
+        filas = []
+        lados_derechos = []
+        analizar = coeficientes_ecuacion if cache is None else cache.coeficientes_ecuacion
+        for ec in ecuaciones:
+            coeficientes, lado_derecho = analizar(ec, variables_dict)
+            filas.append({c: v for c, v in coeficientes.items() if v != 0.0})
+            lados_derechos.append(lado_derecho)
+        return cls(filas, lados_derechos, len(variables_dict))
+
+    def no_nulos(self):
+        return sum(len(fila) for fila in self.filas)
+
+    def densidad(self):
+        celdas = len(self.filas) * self.num_variables
+        return self.no_nulos() / celdas if celdas else 1.0
+
+    def a_densa(self):
+        """Devuelve la matriz aumentada densa equivalente."""
+        matriz = np.zeros((len(self.filas), self.num_variables + 1))
+        for i, fila in enumerate(self.filas):
+            for c, v in fila.items():
+                matriz[i, c] = v
+        matriz[:, -1] = self.lados_derechos
+        return matriz
+
+def usar_motor_disperso(num_variables, densidad):
+    """Decide si conviene el motor disperso para un sistema de este tamaño y densidad."""
+    return num_variables >= MIN_VARIABLES_DISPERSO and densidad < UMBRAL_DENSIDAD_DISPERSA
+
+def eliminacion_gauss_jordan_dispersa(sistema, umbral_estabilidad=0.1, progreso=None):
+    """
+    Gauss-Jordan sobre un SistemaDisperso con orden de pivotes de Markowitz.
+
+    La eliminación hacia adelante elige en cada paso la columna con menos
+    entradas activas y, dentro de ella, entre las filas cuyo coeficiente es al
+    menos `umbral_estabilidad` veces el máximo (pivoteo por umbral), la de menos
+    entradas; así se minimiza el costo de Markowitz y el relleno. Después una
+    sustitución hacia atrás dispersa deja cada fila pivote sólo con su pivote y
+    las variables libres. Las entradas por debajo de 1e-9 se descartan.
+
+    Si el sistema resulta consistente pero con variables libres, se repite la
+    eliminación recorriendo las columnas en orden natural, como el camino denso,
+    para que las variables libres y su parametrización coincidan con las de
+    `eliminacion_gauss_jordan`.
+
+    `progreso`, si se da, se llama como progreso(pivotes_elegidos, num_variables)
+    tras cada pivote (la segunda pasada vuelve a empezar desde cero) y puede
+    lanzar OperacionCancelada para interrumpir. Con una instrumentación activa
+    los contadores incluyen las dos pasadas cuando hay segunda pasada.
+
+    Returns:
+        tuple: (reducido, columnas_pivote). `reducido` es un SistemaDisperso con
+        las filas pivote primero, en el orden de sus columnas, y luego el resto.
+    """
+    with fase("eliminacion"):
+        reducido, columnas_pivote = _eliminar_disperso(sistema, umbral_estabilidad, orden_natural=False, progreso=progreso)
+        rango = len(columnas_pivote)
+        consistente = not any(abs(ld) > 1e-9 for ld in reducido.lados_derechos[rango:])
+        if consistente and rango < sistema.num_variables:
+            reducido, columnas_pivote = _eliminar_disperso(sistema, umbral_estabilidad, orden_natural=True, progreso=progreso)
+        return reducido, columnas_pivote
+
+def _restar_fila_dispersa(fila, fuente, factor, omitir=None):
+    """fila -= factor * fuente sobre diccionarios; devuelve las columnas que aparecieron o desaparecieron."""
+    cambios = []
+    for c, v in fuente.items():
+        if c == omitir:
+            continue
+        nuevo = fila.get(c, 0.0) - factor * v
+        if abs(nuevo) < 1e-9:
+            if c in fila:
+                del fila[c]
+                cambios.append((c, False))
+        else:
+            if c not in fila:
+                cambios.append((c, True))
+            fila[c] = nuevo
+    return cambios
+
+def _eliminar_disperso(sistema, umbral_estabilidad, orden_natural, progreso=None):
+    """Eliminación hacia adelante con pivotes de Markowitz y sustitución hacia atrás dispersa."""
+    filas = [dict(fila) for fila in sistema.filas]
+    lados_derechos = list(sistema.lados_derechos)
+    # Índice por columna restringido a las filas que todavía no son pivote
+    filas_por_columna = [set() for _ in range(sistema.num_variables)]
+    for i, fila in enumerate(filas):
+        for c in fila:
+            filas_por_columna[c].add(i)
+
+    disponible = [True] * len(filas)
+    columna_resuelta = [False] * sistema.num_variables
+    pivotes = [] # (columna, fila) en el orden en que se eligieron
+    orden_columnas = iter(range(sistema.num_variables))
+    monticulo = [] if orden_natural else [(len(f), c) for c, f in enumerate(filas_por_columna)]
+    heapq.heapify(monticulo)
+    instrumentacion = instrumentacion_activa()
+
+    while True:
+        # Columna siguiente: orden natural o la de menos filas activas (entradas obsoletas se descartan)
+        if orden_natural:
+            columna_actual = next(orden_columnas, None)
+        else:
+            columna_actual = None
+            while monticulo:
+                cuenta, c = heapq.heappop(monticulo)
+                if not columna_resuelta[c] and cuenta == len(filas_por_columna[c]):
+                    columna_actual = c
+                    break
+        if columna_actual is None:
+            break
+
+        # Sin pivote: en orden natural la columna queda libre, como en el camino denso;
+        # en orden de Markowitz vuelve al montículo si el relleno le agrega entradas
+        candidatas = filas_por_columna[columna_actual]
+        if not candidatas or max(abs(filas[i][columna_actual]) for i in candidatas) < 1e-9:
+            continue
+        columna_resuelta[columna_actual] = True
+        maximo = max(abs(filas[i][columna_actual]) for i in candidatas)
+
+        aceptables = [i for i in candidatas if abs(filas[i][columna_actual]) >= umbral_estabilidad * maximo]
+        fila_pivote = min(aceptables, key=lambda i: (len(filas[i]), -abs(filas[i][columna_actual]), i))
+        disponible[fila_pivote] = False
+        pivote_fila = filas[fila_pivote]
+        columnas_modificadas = set(pivote_fila)
+        for c in pivote_fila:
+            filas_por_columna[c].discard(fila_pivote)
+
+        # Normalización
+        pivote = pivote_fila[columna_actual]
+        for c in pivote_fila:
+            pivote_fila[c] /= pivote
+        lados_derechos[fila_pivote] /= pivote
+
+        # Eliminación hacia adelante sólo en las filas activas que tienen la columna
+        eliminadas = list(filas_por_columna[columna_actual])
+        if instrumentacion is not None:
+            instrumentacion.registrar_pivote(columna_actual, fila_pivote, pivote,
+                                             (2 * len(eliminadas) + 1) * (len(pivote_fila) + 1))
+        for i in eliminadas:
+            factor = filas[i][columna_actual]
+            for c, aparece in _restar_fila_dispersa(filas[i], pivote_fila, factor):
+                if aparece:
+                    filas_por_columna[c].add(i)
+                else:
+                    filas_por_columna[c].discard(i)
+                columnas_modificadas.add(c)
+            lados_derechos[i] -= factor * lados_derechos[fila_pivote]
+        for c in columnas_modificadas:
+            if not orden_natural and not columna_resuelta[c]:
+                heapq.heappush(monticulo, (len(filas_por_columna[c]), c))
+        pivotes.append((columna_actual, fila_pivote))
+        if progreso is not None:
+            progreso(len(pivotes), sistema.num_variables)
+
+    # Sustitución hacia atrás: cada fila pivote queda sólo con su pivote y las variables libres
+    fila_de_columna = dict(pivotes)
+    for columna_actual, i in reversed(pivotes):
+        fila = filas[i]
+        for c in [c for c in fila if c != columna_actual and c in fila_de_columna]:
+            factor = fila.pop(c)
+            fuente = fila_de_columna[c]
+            _restar_fila_dispersa(fila, filas[fuente], factor, omitir=c)
+            lados_derechos[i] -= factor * lados_derechos[fuente]
+            if instrumentacion is not None:
+                instrumentacion.registrar_flops(2 * len(filas[fuente]))
+
+    if instrumentacion is not None:
+        # Columnas que terminaron sin pivote (en orden de Markowitz pueden visitarse varias veces)
+        for c in range(sistema.num_variables):
+            if not columna_resuelta[c]:
+                maximo = max((abs(filas[i][c]) for i in filas_por_columna[c]), default=0.0)
+                instrumentacion.registrar_pivote_omitido(c, maximo)
+
+    # Misma limpieza de tolerancia que la RREF densa
+    pivotes.sort()
+    orden = [i for _, i in pivotes] + [i for i in range(len(filas)) if disponible[i]]
+    filas_reducidas = []
+    lados_reducidos = []
+    for i in orden:
+        filas_reducidas.append({c: round(v, 9) for c, v in filas[i].items() if abs(v) >= 1e-9})
+        valor = round(lados_derechos[i], 9)
+        lados_reducidos.append(0.0 if abs(valor) < 1e-9 else valor)
+
+    reducido = SistemaDisperso(filas_reducidas, lados_reducidos, sistema.num_variables)
+    return reducido, [c for c, _ in pivotes]
+
+def interpretar_sistema_disperso(reducido, columnas_pivote):
+    """
+    Clasifica un sistema reducido por `eliminacion_gauss_jordan_dispersa` y
+    expresa cada variable básica en función de las libres.
+
+    Returns:
+        tuple: (clasificacion, variables_libres, expresiones). `expresiones` asocia
+        a cada columna pivote (valor, {columna libre: coeficiente}), es decir
+        x_pivote = valor - suma(coeficiente * x_libre).
+    """
+    rango = len(columnas_pivote)
+    for i in range(rango, len(reducido.filas)):
+        if not reducido.filas[i] and abs(reducido.lados_derechos[i]) > 1e-9:
+            return SISTEMA_INCONSISTENTE, [], {}
+
+    pivotes = set(columnas_pivote)
+    variables_libres = [c for c in range(reducido.num_variables) if c not in pivotes]
+    expresiones = {}
+    for k, columna in enumerate(columnas_pivote):
+        coeficientes = {c: v for c, v in reducido.filas[k].items() if c != columna}
+        expresiones[columna] = (reducido.lados_derechos[k], coeficientes)
+
+    clasificacion = SOLUCIONES_INFINITAS if rango < reducido.num_variables else SOLUCION_UNICA
+    return clasificacion, variables_libres, expresiones
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Eliminación de Gauss-Jordan densa (vectorizada y por paneles)."""
+import numpy as np
+
+from .instrumentacion import fase, instrumentacion_activa
+
+ELEMENTOS_POR_TRAMO = 1 << 16 # Tamaño (en elementos) del tramo de filas de la actualización de rango 1
+
+class OperacionCancelada(Exception):
+    """Se lanza desde un callback de progreso para interrumpir la eliminación."""
+
+#--------------------------------------------------------------------------
+# Función para realizar la Eliminación de Gauss-Jordan
+#--------------------------------------------------------------------------
+def eliminacion_gauss_jordan(matriz, tam_bloque=None, progreso=None, salida=None, sobrescribir=False):
+    """
+    Convierte la matriz aumentada a su forma escalonada reducida por filas (RREF)
+    utilizando el método de eliminación de Gauss-Jordan.
+
+    La búsqueda del pivote se hace con una sola reducción de NumPy y la columna
+    del pivote se anula con una actualización de rango 1 por tramos de filas
+    sobre un búfer de trabajo reservado una vez, sin temporales del tamaño de
+    la matriz. Con `tam_bloque` se activa el modo por paneles: las operaciones de cada
+    panel de columnas se acumulan y se aplican al resto de la matriz con un
+    único producto matricial, lo que aprovecha BLAS en matrices grandes. El
+    redondeo de ese modo puede diferir en el último bit, por lo que en sistemas
+    inconsistentes puede cambiar qué fila queda como [0 ... 0 | k].
+
+    Por defecto se trabaja sobre una copia. Con `salida` la matriz se copia en
+    ese búfer y se reduce ahí; con `sobrescribir=True` se reduce `matriz` misma.
+    En ambos casos el modo sin bloques no reserva más memoria que sus búferes de
+    trabajo (O(filas + columnas) más un tramo de como mucho 1/8 de las filas),
+    y si se cancela el búfer queda a medio reducir. El modo por paneles sigue
+    reservando temporales O(filas × columnas) para sus productos, aun in situ.
+
+    Args:
+        matriz (list or np.array): La matriz aumentada del sistema de ecuaciones.
+        tam_bloque (int, optional): Ancho del panel de columnas. None usa el modo sin bloques.
+        progreso (callable, optional): Se llama como progreso(columnas_procesadas, total)
+            tras cada columna (o panel); puede lanzar OperacionCancelada para interrumpir.
+        salida (np.array, optional): Búfer float64 contiguo en orden C con la forma de `matriz`.
+        sobrescribir (bool): Reduce `matriz` in situ; debe ser un np.array float64
+            bidimensional, contiguo en orden C y escribible.
+
+    Returns:
+        np.array: La matriz en forma escalonada reducida (RREF); es `salida` o
+        `matriz` si se pidió trabajar sobre ellas.
+
+    Raises:
+        ValueError: Si el búfer de `salida` o `sobrescribir` no es adecuado.
+    """
+    with fase("eliminacion"):
+        matriz = _matriz_de_trabajo(matriz, salida, sobrescribir)
+
+        if tam_bloque is not None and tam_bloque > 0:
+            _eliminar_por_paneles(matriz, int(tam_bloque), progreso)
+        else:
+            _eliminar_sin_bloques(matriz, progreso)
+
+        _limpiar_tolerancia(matriz)
+        return matriz
+
+def _validar_bufer(bufer, nombre):
+    if not (isinstance(bufer, np.ndarray) and bufer.ndim == 2 and bufer.dtype == np.float64
+            and bufer.flags.c_contiguous and bufer.flags.writeable):
+        raise ValueError(f"{nombre} debe ser un np.array float64 bidimensional, contiguo en orden C y escribible.")
+
+def _matriz_de_trabajo(matriz, salida, sobrescribir):
+    """Matriz sobre la que se elimina: `matriz` (sobrescribir), `salida` con una copia, o una copia nueva."""
+    if sobrescribir:
+        if salida is not None and salida is not matriz:
+            raise ValueError("No se puede usar `salida` junto con sobrescribir=True.")
+        _validar_bufer(matriz, "Con sobrescribir=True la matriz")
+        return matriz
+    if salida is not None:
+        _validar_bufer(salida, "`salida`")
+        if salida.shape != np.shape(matriz):
+            raise ValueError(f"`salida` tiene forma {salida.shape} y la matriz {np.shape(matriz)}.")
+        np.copyto(salida, matriz)
+        return salida
+    return np.array(matriz, dtype=float)
+
+def _filas_por_tramo(num_filas, num_cols):
+    """Filas de cada tramo: como mucho 1/8 de la matriz, para que el búfer nunca se acerque al tamaño de una copia."""
+    return max(1, min(num_filas // 8, ELEMENTOS_POR_TRAMO // max(num_cols, 1)))
+
+def _limpiar_tolerancia(matriz):
+    """Redondea a 9 decimales y anula las entradas menores que 1e-9, in situ y por tramos de filas."""
+    np.round(matriz, 9, out=matriz)
+    num_filas, num_cols = matriz.shape
+    filas_tramo = _filas_por_tramo(num_filas, num_cols)
+    magnitudes = np.empty((filas_tramo, num_cols))
+    mascara = np.empty((filas_tramo, num_cols), dtype=bool)
+    for inicio in range(0, num_filas, filas_tramo):
+        tramo = matriz[inicio:inicio + filas_tramo]
+        filas = tramo.shape[0]
+        np.abs(tramo, out=magnitudes[:filas])
+        np.less(magnitudes[:filas], 1e-9, out=mascara[:filas])
+        np.copyto(tramo, 0.0, where=mascara[:filas])
+
+def _restar_rango_uno(bloque, factores, fila, trabajo):
+    """bloque -= outer(factores, fila) por tramos de filas, usando `trabajo` como único temporal."""
+    filas_tramo, ancho = trabajo.shape[0], bloque.shape[1]
+    for inicio in range(0, bloque.shape[0], filas_tramo):
+        tramo = bloque[inicio:inicio + filas_tramo]
+        producto = trabajo[:tramo.shape[0], :ancho]
+        np.multiply(factores[inicio:inicio + filas_tramo, None], fila, out=producto)
+        np.subtract(tramo, producto, out=tramo)
+
+def _eliminar_sin_bloques(matriz, progreso=None):
+    """
+    Núcleo de Gauss-Jordan in situ: pivoteo por reducción y actualización de rango 1.
+
+    Todas las operaciones escriben en `matriz` o en búferes reservados al
+    empezar (magnitudes y factores de una columna, una fila para los
+    intercambios y un tramo de filas para el producto exterior).
+    """
+    num_filas, num_cols = matriz.shape
+    fila_actual = 0
+    columna_actual = 0
+    columnas_saltadas = [] # Columnas sin pivote: la fila pivote puede tener restos < 1e-9 en ellas
+    instrumentacion = instrumentacion_activa()
+    magnitudes = np.empty(num_filas)
+    factores = np.empty(num_filas)
+    fila_temporal = np.empty(num_cols)
+    trabajo = np.empty((_filas_por_tramo(num_filas, num_cols), num_cols))
+
+    while fila_actual < num_filas and columna_actual < num_cols - 1:
+        # Pivoteo Parcial (argmax devuelve el primer máximo, igual que el recorrido fila a fila)
+        columna = np.abs(matriz[fila_actual:, columna_actual], out=magnitudes[fila_actual:])
+        fila_pivote = fila_actual + int(np.argmax(columna))
+
+        if abs(matriz[fila_pivote, columna_actual]) < 1e-9:
+            if instrumentacion is not None:
+                instrumentacion.registrar_pivote_omitido(columna_actual, abs(matriz[fila_pivote, columna_actual]))
+            columnas_saltadas.append(columna_actual)
+            columna_actual += 1
+            if progreso is not None:
+                progreso(columna_actual, num_cols - 1)
+            continue
+
+        if fila_pivote != fila_actual:
+            np.copyto(fila_temporal, matriz[fila_actual])
+            np.copyto(matriz[fila_actual], matriz[fila_pivote])
+            np.copyto(matriz[fila_pivote], fila_temporal)
+            if instrumentacion is not None:
+                instrumentacion.registrar_intercambio(fila_actual, fila_pivote)
+        if instrumentacion is not None:
+            # Normalización más la actualización de rango 1 sobre las columnas que se tocan
+            ancho = num_cols - columna_actual + len(columnas_saltadas)
+            instrumentacion.registrar_pivote(columna_actual, fila_actual, matriz[fila_actual, columna_actual],
+                                             (2 * num_filas + 1) * ancho)
+
+        # Normalización
+        matriz[fila_actual] /= matriz[fila_actual, columna_actual]
+
+        # Eliminación Gauss-Jordan (Ceros arriba y abajo) con un producto exterior por tramos.
+        # A la izquierda de la columna actual la fila pivote sólo es distinta de cero
+        # en las columnas saltadas (en las columnas pivote vale exactamente 0), así que
+        # basta con actualizar desde la primera columna saltada.
+        np.copyto(factores, matriz[:, columna_actual])
+        factores[fila_actual] = 0.0
+        inicio = columnas_saltadas[0] if columnas_saltadas else columna_actual
+        _restar_rango_uno(matriz[:, inicio:], factores, matriz[fila_actual, inicio:], trabajo)
+
+        fila_actual += 1
+        columna_actual += 1
+        if progreso is not None:
+            progreso(columna_actual, num_cols - 1)
+
+def _eliminar_por_paneles(matriz, tam_bloque, progreso=None):
+    """
+    Núcleo de Gauss-Jordan por paneles de `tam_bloque` columnas.
+
+    Dentro del panel se aplica el mismo pivoteo que en el modo sin bloques, pero
+    sólo sobre las columnas del panel. La transformación acumulada tiene la forma
+    T = I + Y·S, donde S selecciona las filas que pueden ser pivote en el panel,
+    así que el resto de columnas se actualiza al final con `Y @ matriz[filas]`.
+    """
+    num_filas, num_cols = matriz.shape
+    fila_actual = 0
+    columna_inicio = 0
+    instrumentacion = instrumentacion_activa()
+
+    while fila_actual < num_filas and columna_inicio < num_cols - 1:
+        columna_fin = min(columna_inicio + tam_bloque, num_cols - 1)
+        fila_inicio = fila_actual
+        filas_panel = min(tam_bloque, num_filas - fila_inicio)
+        panel = matriz[:, columna_inicio:columna_fin]
+        acumulado = np.zeros((num_filas, filas_panel))
+
+        fila_actual = _factorizar_panel(panel, acumulado, fila_inicio, fila_actual, columna_inicio,
+                                        lambda a, b: _intercambiar_filas(matriz, a, b), instrumentacion)
+
+        # Aplicar la transformación del panel al resto de columnas (izquierda y derecha)
+        filas_fuente = slice(fila_inicio, fila_inicio + filas_panel)
+        if instrumentacion is not None:
+            instrumentacion.registrar_flops(2 * num_filas * filas_panel * (num_cols - (columna_fin - columna_inicio)))
+        for resto in (slice(0, columna_inicio), slice(columna_fin, num_cols)):
+            bloque = matriz[:, resto]
+            if bloque.shape[1]:
+                bloque += acumulado @ bloque[filas_fuente]
+
+        columna_inicio = columna_fin
+        if progreso is not None:
+            progreso(columna_inicio, num_cols - 1)
+
+def _intercambiar_filas(matriz, fila_a, fila_b):
+    matriz[[fila_a, fila_b]] = matriz[[fila_b, fila_a]]
+
+def _factorizar_panel(panel, acumulado, fila_inicio, fila_actual, columna_inicio, intercambiar, instrumentacion=None):
+    """
+    Gauss-Jordan sobre las columnas de un panel, acumulando la transformación.
+
+    `intercambiar(fila_a, fila_b)` debe intercambiar las filas completas de la
+    matriz, incluido `panel` (que puede ser una vista o una copia); aquí sólo
+    se intercambian las filas de `acumulado`.
+
+    Returns:
+        int: La siguiente fila sin pivote.
+    """
+    num_filas = panel.shape[0]
+    filas_panel = acumulado.shape[1]
+    for j in range(panel.shape[1]):
+        if fila_actual >= num_filas:
+            break
+        fila_pivote = fila_actual + int(np.argmax(np.abs(panel[fila_actual:, j])))
+        if abs(panel[fila_pivote, j]) < 1e-9:
+            if instrumentacion is not None:
+                instrumentacion.registrar_pivote_omitido(columna_inicio + j, abs(panel[fila_pivote, j]))
+            continue
+
+        if fila_pivote != fila_actual:
+            # El intercambio se aplica a la fila completa y a las filas de la transformación
+            intercambiar(fila_actual, fila_pivote)
+            acumulado[[fila_actual, fila_pivote]] = acumulado[[fila_pivote, fila_actual]]
+            if instrumentacion is not None:
+                instrumentacion.registrar_intercambio(fila_actual, fila_pivote)
+        if instrumentacion is not None:
+            # Actualización del panel y de la transformación acumulada
+            instrumentacion.registrar_pivote(columna_inicio + j, fila_actual, panel[fila_actual, j],
+                                             (2 * num_filas + 1) * panel.shape[1] + 2 * num_filas * filas_panel)
+
+        local = fila_actual - fila_inicio
+        escala = 1.0 / panel[fila_actual, j]
+        panel[fila_actual] = panel[fila_actual] / panel[fila_actual, j]
+        acumulado[fila_actual] *= escala
+        acumulado[fila_actual, local] += escala - 1.0
+
+        factores = panel[:, j].copy()
+        factores[fila_actual] = 0.0
+        panel -= np.outer(factores, panel[fila_actual])
+        acumulado -= np.outer(factores, acumulado[fila_actual])
+        acumulado[:, local] -= factores
+
+        fila_actual += 1
+    return fila_actual
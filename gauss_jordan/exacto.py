@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Modo exacto: eliminación de Gauss-Jordan sin fracciones (Bareiss) sobre enteros."""
+from fractions import Fraction
+from math import lcm
+
+import numpy as np
+
+from .instrumentacion import fase
+from .interpretacion import SIN_VARIABLES, SISTEMA_INCONSISTENTE, SOLUCION_UNICA, SOLUCIONES_INFINITAS
+
+#--------------------------------------------------------------------------
+# Conversión a racionales y a enteros por fila
+#--------------------------------------------------------------------------
+def a_racional(valor):
+    """
+    Convierte un coeficiente a `Fraction`.
+
+    Los float se toman por su representación decimal más corta (0.1 -> 1/10),
+    que es la que escribió el usuario, y no por su valor binario exacto.
+    """
+    if isinstance(valor, (int, Fraction)):
+        return Fraction(valor)
+    if isinstance(valor, np.integer):
+        return Fraction(int(valor))
+    valor = float(valor)
+    if not np.isfinite(valor):
+        raise ValueError(f"Coeficiente no finito: {valor}")
+    return Fraction(repr(valor))
+
+def escalar_a_enteros(matriz):
+    """
+    Multiplica cada fila por el mínimo común múltiplo de sus denominadores.
+
+    Escalar una fila no cambia la RREF, así que la eliminación puede trabajar
+    sólo con enteros de Python.
+
+    Returns:
+        tuple: (matriz de dtype object con enteros de Python, lista con el factor de cada fila).
+    """
+    racionales = [[a_racional(v) for v in fila] for fila in np.asarray(matriz, dtype=object)]
+    enteros = np.empty((len(racionales), len(racionales[0]) if racionales else 0), dtype=object)
+    factores = []
+    for i, fila in enumerate(racionales):
+        factor = lcm(*(v.denominator for v in fila))
+        enteros[i] = [v.numerator * (factor // v.denominator) for v in fila]
+        factores.append(factor)
+    return enteros, factores
+
+#--------------------------------------------------------------------------
+# Eliminación de Gauss-Jordan exacta (Bareiss)
+#--------------------------------------------------------------------------
+def eliminacion_gauss_jordan_exacta(matriz):
+    """
+    RREF exacta de la matriz aumentada mediante eliminación sin fracciones.
+
+    Cada paso reemplaza a_ij por (p·a_ij - a_ic·a_rj) / p_anterior, donde p es
+    el pivote actual y p_anterior el del paso previo; la división es siempre
+    exacta porque cada entrada es un menor de la matriz original. Así los
+    números crecen sólo como determinantes y no hace falta calcular un máximo
+    común divisor por operación, como ocurre con `Fraction`. Al terminar todos
+    los pivotes valen lo mismo (el último p) y las fracciones se forman una sola
+    vez dividiendo por él. Las filas sin pivote se dividen además por el factor
+    con que se escalaron, para que su lado derecho coincida con el del modo flotante.
+
+    Como no hay redondeo, el rango y la clasificación son exactos para los
+    coeficientes dados (los float se interpretan como su decimal más corto).
+
+    Args:
+        matriz (list or np.array): La matriz aumentada (enteros, Fraction o float).
+
+    Returns:
+        tuple: (matriz RREF de dtype object con `Fraction`, lista de columnas pivote).
+    """
+    with fase("eliminacion"):
+        matriz, factores = escalar_a_enteros(matriz)
+        columnas_pivote = _eliminar_bareiss(matriz, factores)
+        rango = len(columnas_pivote)
+        divisor = matriz[0, columnas_pivote[0]] if columnas_pivote else 1
+
+        rref = np.empty(matriz.shape, dtype=object)
+        for i in range(matriz.shape[0]):
+            divisor_fila = divisor if i < rango else divisor * factores[i]
+            rref[i] = [Fraction(v, divisor_fila) for v in matriz[i]]
+        return rref, columnas_pivote
+
+def _eliminar_bareiss(matriz, factores):
+    """
+    Núcleo de Gauss-Jordan sin fracciones in situ sobre enteros de Python.
+
+    Intercambia `factores` junto con las filas y devuelve las columnas pivote.
+    """
+    num_filas, num_cols = matriz.shape
+    fila_actual = 0
+    pivote_anterior = 1
+    columnas_pivote = []
+    columnas_saltadas = [] # Columnas sin pivote: las filas pivote tienen entradas no nulas en ellas
+
+    for columna_actual in range(num_cols - 1):
+        if fila_actual >= num_filas:
+            break
+        # Cualquier entrada no nula sirve de pivote: no hay error de redondeo que controlar
+        candidatas = np.flatnonzero(matriz[fila_actual:, columna_actual] != 0)
+        if candidatas.size == 0:
+            columnas_saltadas.append(columna_actual)
+            continue
+        fila_pivote = fila_actual + int(candidatas[0])
+        if fila_pivote != fila_actual:
+            matriz[[fila_actual, fila_pivote]] = matriz[[fila_pivote, fila_actual]]
+            factores[fila_actual], factores[fila_pivote] = factores[fila_pivote], factores[fila_actual]
+
+        pivote = matriz[fila_actual, columna_actual]
+        otras = np.arange(num_filas) != fila_actual
+        multiplicadores = matriz[otras, columna_actual]
+
+        # Igual que en el modo flotante, a la izquierda sólo cambian las columnas saltadas;
+        # en las columnas pivote previas la única entrada no nula pasa de p_anterior a p.
+        columnas = columnas_saltadas + list(range(columna_actual + 1, num_cols))
+        bloque = matriz[np.ix_(otras, columnas)]
+        matriz[np.ix_(otras, columnas)] = (pivote * bloque - np.outer(multiplicadores, matriz[fila_actual, columnas])) // pivote_anterior
+        matriz[otras, columna_actual] = 0
+        for fila, columna in enumerate(columnas_pivote):
+            matriz[fila, columna] = pivote
+
+        columnas_pivote.append(columna_actual)
+        pivote_anterior = pivote
+        fila_actual += 1
+
+    return columnas_pivote
+
+#--------------------------------------------------------------------------
+# Interpretación exacta
+#--------------------------------------------------------------------------
+def interpretar_rref_exacta(matriz_rref, columnas_pivote, nombres_variables):
+    """
+    Interpreta la salida de `eliminacion_gauss_jordan_exacta`.
+
+    Devuelve el mismo diccionario que `interpretar_rref`, pero con valores
+    `Fraction` y comparaciones exactas con cero en lugar de tolerancias.
+
+    Raises:
+        ValueError: Si la matriz está vacía o no concuerda con el número de variables.
+    """
+    if matriz_rref is None or matriz_rref.size == 0:
+        raise ValueError("No se puede determinar la solución (matriz RREF inválida).")
+    num_variables = len(nombres_variables)
+    if matriz_rref.shape[1] != num_variables + 1:
+        raise ValueError(f"Dimensiones inconsistentes en RREF (Variables: {num_variables}, Columnas: {matriz_rref.shape[1]}).")
+
+    rango = len(columnas_pivote)
+    for valor in matriz_rref[rango:, -1]:
+        if valor != 0:
+            return {"clasificacion": SISTEMA_INCONSISTENTE, "rango": None, "valor_inconsistente": valor}
+    if num_variables == 0:
+        return {"clasificacion": SIN_VARIABLES, "rango": 0}
+
+    if rango < num_variables:
+        pivote = set(columnas_pivote)
+        libres = [c for c in range(num_variables) if c not in pivote]
+        expresiones = {}
+        for r, c in enumerate(columnas_pivote):
+            coeficientes = {nombres_variables[l]: -matriz_rref[r, l] for l in libres if matriz_rref[r, l] != 0}
+            expresiones[nombres_variables[c]] = {"constante": matriz_rref[r, -1], "coeficientes": coeficientes}
+        return {"clasificacion": SOLUCIONES_INFINITAS, "rango": rango,
+                "variables_libres": [nombres_variables[c] for c in libres], "expresiones": expresiones}
+
+    solucion = {nombres_variables[c]: matriz_rref[r, -1] for r, c in enumerate(columnas_pivote)}
+    return {"clasificacion": SOLUCION_UNICA, "rango": rango, "solucion": solucion}
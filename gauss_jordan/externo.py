@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Eliminación de Gauss-Jordan fuera de memoria sobre matrices en disco.
+
+La matriz aumentada vive en un archivo de float64 en orden C (el formato de
+`np.memmap`) y nunca se carga completa: cada paso factoriza un panel de
+columnas en memoria y después recorre el archivo por tramos de filas,
+aplicando la transformación del panel, como `eliminacion_gauss_jordan` con
+`tam_bloque`. Los tramos se leen y escriben con ventanas `np.memmap` que se
+cierran al terminar cada tramo, así que ni la memoria residente ni el espacio
+de direcciones crecen con el tamaño del archivo.
+"""
+import mmap
+import os
+
+import numpy as np
+
+from .eliminacion import _factorizar_panel
+from .instrumentacion import fase, instrumentacion_activa
+
+MEMORIA_TRABAJO_PREDETERMINADA = 256 * 2**20 # Bytes de trabajo en memoria por defecto
+TAM_BLOQUE_EXTERNO = 64 # Ancho de panel inicial; se reduce si no cabe en la memoria de trabajo
+
+#--------------------------------------------------------------------------
+# Acceso al archivo por tramos de filas
+#--------------------------------------------------------------------------
+def _rss_actual():
+    """Memoria residente actual del proceso en bytes (None si el sistema no la informa)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 # Pico, no actual: cota superior
+
+class _ArchivoMatriz:
+    """Lee y escribe filas de una matriz float64 en disco y contabiliza el volumen de E/S."""
+    def __init__(self, archivo, forma, desplazamiento):
+        self.archivo = archivo
+        self.num_filas, self.num_cols = forma
+        self.desplazamiento = desplazamiento
+        self.bytes_leidos = 0
+        self.bytes_escritos = 0
+        self.pico_rss = _rss_actual()
+
+    def _ventana(self, fila_inicio, fila_fin, modo):
+        return np.memmap(self.archivo, dtype=np.float64, mode=modo, shape=(fila_fin - fila_inicio, self.num_cols),
+                         offset=self.desplazamiento + fila_inicio * self.num_cols * 8)
+
+    def leer(self, fila_inicio, fila_fin):
+        ventana = self._ventana(fila_inicio, fila_fin, "r")
+        filas = np.array(ventana)
+        del ventana
+        self.bytes_leidos += filas.nbytes
+        return filas
+
+    def escribir(self, fila_inicio, filas):
+        ventana = self._ventana(fila_inicio, fila_inicio + filas.shape[0], "r+")
+        ventana[:] = filas
+        ventana.flush()
+        del ventana
+        self.bytes_escritos += filas.nbytes
+        self.medir_rss()
+
+    def medir_rss(self):
+        rss = _rss_actual()
+        if rss is not None and (self.pico_rss is None or rss > self.pico_rss):
+            self.pico_rss = rss
+
+#--------------------------------------------------------------------------
+# Eliminación fuera de memoria
+#--------------------------------------------------------------------------
+def crear_matriz_externa(ruta, forma):
+    """Crea (o sobrescribe) un archivo para una matriz float64 en orden C y lo devuelve como `np.memmap`."""
+    return np.memmap(ruta, dtype=np.float64, mode="w+", shape=tuple(forma))
+
+def dimensionar_trabajo(num_filas, num_cols, memoria_max, tam_bloque=None):
+    """
+    Elige el ancho de panel y las filas por tramo que caben en `memoria_max` bytes.
+
+    El conjunto de trabajo es el panel actual y el siguiente (m×b cada uno), la
+    transformación acumulada (m×b), las filas fuente del panel (b×N) y un tramo
+    de h filas con su producto temporal y la ventana mapeada del archivo (3·h×N).
+
+    Returns:
+        tuple: (tam_bloque, filas_por_tramo).
+
+    Raises:
+        ValueError: Si ni siquiera un panel de una columna con una fila por tramo cabe.
+    """
+    disponibles = memoria_max // 8
+    ancho = max(1, min(tam_bloque or TAM_BLOQUE_EXTERNO, num_cols - 1, num_filas))
+    while ancho > 1 and 3 * num_filas * ancho + ancho * num_cols + 3 * num_cols > disponibles:
+        ancho //= 2
+    restante = disponibles - 3 * num_filas * ancho - ancho * num_cols
+    if restante < 3 * num_cols:
+        minimo = 8 * (3 * num_filas + 4 * num_cols)
+        raise ValueError(f"memoria_max={memoria_max} bytes no alcanza para una matriz de {num_filas}×{num_cols} "
+                         f"(se necesitan al menos {minimo} bytes).")
+    return ancho, max(1, min(num_filas, restante // (3 * num_cols)))
+
+def eliminacion_gauss_jordan_externa(matriz, forma=None, memoria_max=MEMORIA_TRABAJO_PREDETERMINADA,
+                                     tam_bloque=None, progreso=None):
+    """
+    Reduce in situ a RREF una matriz aumentada guardada en disco.
+
+    Sigue el mismo algoritmo por paneles que `eliminacion_gauss_jordan` con
+    `tam_bloque`, y al final aplica la misma limpieza (redondeo a 9 decimales y
+    ceros por debajo de 1e-9). Cada panel cuesta una lectura y una escritura del
+    archivo completo; la lectura del panel siguiente se hace en el mismo recorrido.
+
+    Args:
+        matriz (np.memmap or str): Un `np.memmap` float64 en orden C abierto
+            directamente sobre el archivo (modo "r+" o "w+", no una vista), o
+            la ruta de un archivo con ese formato.
+        forma (tuple, optional): (filas, columnas); obligatoria si `matriz` es una ruta.
+        memoria_max (int): Bytes de trabajo en memoria, sin contar el intérprete ni NumPy.
+        tam_bloque (int, optional): Ancho de panel máximo; se reduce si no cabe.
+        progreso (callable, optional): Se llama como progreso(columnas_procesadas, total)
+            tras cada panel; puede lanzar OperacionCancelada (el archivo queda a medio reducir).
+
+    Returns:
+        dict: "bytes_leidos", "bytes_escritos", "pico_rss_bytes" (memoria residente
+        máxima observada durante la llamada, None si el sistema no la informa),
+        "memoria_trabajo_bytes", "tam_bloque", "filas_por_tramo" y "paneles".
+
+    Raises:
+        ValueError: Si la matriz no es un memmap float64 en orden C escribible o
+            `memoria_max` es demasiado pequeña.
+    """
+    if isinstance(matriz, np.memmap):
+        if not isinstance(matriz.base, mmap.mmap) or matriz.dtype != np.float64 or not matriz.flags.c_contiguous:
+            raise ValueError("Se necesita un np.memmap float64 en orden C abierto directamente sobre el archivo.")
+        if matriz.mode not in ("r+", "w+"):
+            raise ValueError(f"El memmap debe abrirse en modo 'r+' o 'w+' (modo actual: '{matriz.mode}').")
+        matriz.flush()
+        ruta, forma, desplazamiento = matriz.filename, matriz.shape, matriz.offset
+    else:
+        if forma is None:
+            raise ValueError("Falta `forma` para abrir la matriz desde una ruta.")
+        ruta, desplazamiento = os.fspath(matriz), 0
+    if len(forma) != 2:
+        raise ValueError(f"La matriz aumentada debe ser bidimensional (forma: {tuple(forma)}).")
+    num_filas, num_cols = forma
+    tam_bloque, filas_por_tramo = dimensionar_trabajo(num_filas, num_cols, memoria_max, tam_bloque)
+
+    with fase("eliminacion"), open(ruta, "r+b") as archivo:
+        datos = _ArchivoMatriz(archivo, forma, desplazamiento)
+        paneles = _eliminar_externo(datos, tam_bloque, filas_por_tramo, progreso)
+        datos.medir_rss()
+
+    return {
+        "bytes_leidos": datos.bytes_leidos,
+        "bytes_escritos": datos.bytes_escritos,
+        "pico_rss_bytes": datos.pico_rss,
+        "memoria_trabajo_bytes": 8 * (3 * num_filas * tam_bloque + tam_bloque * num_cols + 3 * filas_por_tramo * num_cols),
+        "tam_bloque": tam_bloque,
+        "filas_por_tramo": filas_por_tramo,
+        "paneles": paneles,
+    }
+
+def _eliminar_externo(datos, tam_bloque, filas_por_tramo, progreso=None):
+    """Bucle de paneles de `_eliminar_por_paneles` con la actualización hecha por tramos de filas."""
+    num_filas, num_cols = datos.num_filas, datos.num_cols
+    instrumentacion = instrumentacion_activa()
+    paneles = 0
+    fila_actual = 0
+    columna_inicio = 0
+    ancho = min(tam_bloque, num_cols - 1)
+
+    def intercambiar(fila_a, fila_b):
+        # El panel está en memoria; en el archivo se intercambian las filas completas
+        panel[[fila_a, fila_b]] = panel[[fila_b, fila_a]]
+        fila_a_datos = datos.leer(fila_a, fila_a + 1)
+        datos.escribir(fila_a, datos.leer(fila_b, fila_b + 1))
+        datos.escribir(fila_b, fila_a_datos)
+
+    # Primer recorrido: sólo lee las columnas del primer panel
+    if num_filas and ancho > 0:
+        panel = np.empty((num_filas, ancho))
+        for inicio in range(0, num_filas, filas_por_tramo):
+            fin = min(inicio + filas_por_tramo, num_filas)
+            panel[inicio:fin] = datos.leer(inicio, fin)[:, :ancho]
+            datos.medir_rss()
+    else:
+        _recorrer_tramos(datos, filas_por_tramo, limpiar=True)
+        return paneles
+
+    while True:
+        columna_fin = columna_inicio + ancho
+        fila_inicio = fila_actual
+        filas_panel = min(tam_bloque, num_filas - fila_inicio)
+        acumulado = np.zeros((num_filas, filas_panel))
+        fila_actual = _factorizar_panel(panel, acumulado, fila_inicio, fila_actual, columna_inicio,
+                                        intercambiar, instrumentacion)
+        paneles += 1
+
+        # El recorrido que aplica este panel también lee las columnas del siguiente
+        ancho_siguiente = min(tam_bloque, num_cols - 1 - columna_fin) if fila_actual < num_filas else 0
+        fuente = datos.leer(fila_inicio, fila_inicio + filas_panel)
+        if instrumentacion is not None:
+            instrumentacion.registrar_flops(2 * num_filas * filas_panel * (num_cols - ancho))
+        siguiente = _recorrer_tramos(datos, filas_por_tramo, limpiar=ancho_siguiente <= 0,
+                                     panel=panel, acumulado=acumulado, fuente=fuente,
+                                     columnas=(columna_inicio, columna_fin), ancho_siguiente=ancho_siguiente)
+        del fuente, acumulado
+
+        columna_inicio = columna_fin
+        if progreso is not None:
+            progreso(columna_inicio, num_cols - 1)
+        if ancho_siguiente <= 0:
+            return paneles
+        panel, ancho = siguiente, ancho_siguiente
+
+def _recorrer_tramos(datos, filas_por_tramo, limpiar, panel=None, acumulado=None, fuente=None,
+                     columnas=None, ancho_siguiente=0):
+    """
+    Recorre el archivo por tramos de filas: aplica la transformación del panel
+    (si se da), escribe de vuelta las columnas del panel, limpia la tolerancia
+    en el último recorrido y devuelve las columnas del panel siguiente.
+    """
+    num_filas = datos.num_filas
+    siguiente = np.empty((num_filas, ancho_siguiente)) if ancho_siguiente > 0 else None
+    for inicio in range(0, num_filas, filas_por_tramo):
+        fin = min(inicio + filas_por_tramo, num_filas)
+        tramo = datos.leer(inicio, fin)
+        if panel is not None:
+            columna_inicio, columna_fin = columnas
+            transformacion = acumulado[inicio:fin]
+            for resto in (slice(0, columna_inicio), slice(columna_fin, datos.num_cols)):
+                if tramo[:, resto].shape[1]:
+                    tramo[:, resto] += transformacion @ fuente[:, resto]
+            tramo[:, columna_inicio:columna_fin] = panel[inicio:fin]
+        if limpiar:
+            np.round(tramo, 9, out=tramo)
+            tramo[np.abs(tramo) < 1e-9] = 0.0
+        if siguiente is not None:
+            siguiente[inicio:fin] = tramo[:, columnas[1]:columnas[1] + ancho_siguiente]
+        datos.escribir(inicio, tramo)
+    return siguiente
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Caché de factorizaciones LU para muchos lados derechos."""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+#--------------------------------------------------------------------------
+# Caché de factorizaciones LU para muchos lados derechos
+#--------------------------------------------------------------------------
+class FactorizacionLU:
+    """
+    Factorización P·A = L·U de una matriz de coeficientes cuadrada, con el mismo
+    pivoteo parcial que `eliminacion_gauss_jordan` (primer máximo en valor
+    absoluto, pivotes menores que 1e-9 se consideran nulos).
+    """
+    def __init__(self, coeficientes):
+        lu = np.array(coeficientes, dtype=float)
+        if lu.ndim != 2 or lu.shape[0] != lu.shape[1]:
+            raise ValueError(f"La factorización LU requiere una matriz cuadrada; se recibió {lu.shape}.")
+        n = lu.shape[0]
+        permutacion = np.arange(n)
+
+        for k in range(n):
+            fila_pivote = k + int(np.argmax(np.abs(lu[k:, k])))
+            if abs(lu[fila_pivote, k]) < 1e-9:
+                raise ValueError("La matriz de coeficientes es singular: el sistema no tiene solución única.")
+            if fila_pivote != k:
+                lu[[k, fila_pivote]] = lu[[fila_pivote, k]]
+                permutacion[[k, fila_pivote]] = permutacion[[fila_pivote, k]]
+            lu[k + 1:, k] /= lu[k, k]
+            lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+        self.lu = lu
+        self.permutacion = permutacion
+
+    @property
+    def nbytes(self):
+        return self.lu.nbytes + self.permutacion.nbytes
+
+    def resolver(self, lados_derechos):
+        """
+        Resuelve A·X = B por sustitución hacia adelante y hacia atrás, O(n²) por columna de B.
+
+        Args:
+            lados_derechos (array-like): Vector de n elementos o bloque n×k.
+
+        Returns:
+            np.array: La solución, con la misma forma que `lados_derechos`.
+        """
+        b = np.asarray(lados_derechos, dtype=float)
+        n = self.lu.shape[0]
+        if b.shape[0] != n:
+            raise ValueError(f"El lado derecho tiene {b.shape[0]} filas y la matriz {n}.")
+        x = b[self.permutacion].reshape(n, -1).copy()
+
+        for j in range(n - 1): # L tiene diagonal unitaria
+            x[j + 1:] -= np.outer(self.lu[j + 1:, j], x[j])
+        for j in range(n - 1, -1, -1):
+            x[j] /= self.lu[j, j]
+            x[:j] -= np.outer(self.lu[:j, j], x[j])
+
+        # Misma limpieza de tolerancia que la RREF de eliminacion_gauss_jordan
+        x = np.round(x, 9)
+        x[np.abs(x) < 1e-9] = 0.0
+        return x.reshape(b.shape)
+
+class CacheFactorizaciones:
+    """
+    Caché LRU de factorizaciones LU indexada por un hash del contenido de la matriz.
+
+    Permite resolver la misma matriz de coeficientes contra muchos lados
+    derechos factorizando una sola vez. El tamaño está acotado por número de
+    entradas y por memoria (`limite_bytes`); las entradas menos usadas se
+    desalojan primero.
+    """
+    def __init__(self, max_entradas=128, limite_bytes=256 * 1024 * 1024):
+        self.max_entradas = max_entradas
+        self.limite_bytes = limite_bytes
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    @staticmethod
+    def clave(coeficientes):
+        """Hash del contenido (forma + datos float64) de la matriz de coeficientes."""
+        matriz = np.ascontiguousarray(coeficientes, dtype=float)
+        resumen = hashlib.blake2b(matriz.tobytes(), digest_size=16)
+        resumen.update(repr(matriz.shape).encode())
+        return resumen.hexdigest()
+
+    def obtener(self, coeficientes):
+        """Devuelve la FactorizacionLU de `coeficientes`, factorizando sólo si no está en caché."""
+        clave = self.clave(coeficientes)
+        factorizacion = self._entradas.get(clave)
+        if factorizacion is not None:
+            self.aciertos += 1
+            self._entradas.move_to_end(clave)
+            return factorizacion
+
+        self.fallos += 1
+        factorizacion = FactorizacionLU(coeficientes)
+        if factorizacion.nbytes <= self.limite_bytes: # Una entrada mayor que el límite no se guarda
+            self._entradas[clave] = factorizacion
+            self._bytes += factorizacion.nbytes
+            while len(self._entradas) > self.max_entradas or self._bytes > self.limite_bytes:
+                _, desalojada = self._entradas.popitem(last=False)
+                self._bytes -= desalojada.nbytes
+                self.desalojos += 1
+        return factorizacion
+
+    def resolver(self, coeficientes, lados_derechos):
+        """Resuelve A·X = B para un vector o bloque n×k de lados derechos."""
+        return self.obtener(coeficientes).resolver(lados_derechos)
+
+    def estadisticas(self):
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "entradas": len(self._entradas),
+            "bytes": self._bytes,
+            "limite_bytes": self.limite_bytes,
+        }
+
+    def limpiar(self):
+        self._entradas.clear()
+        self._bytes = 0
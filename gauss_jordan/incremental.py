@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""Mantenimiento incremental de la RREF al agregar o quitar ecuaciones."""
+import numpy as np
+
+from .analizador import coeficientes_ecuacion
+from .interpretacion import (SIN_VARIABLES, SISTEMA_INCONSISTENTE, SOLUCION_UNICA, SOLUCIONES_INFINITAS,
+                             interpretar_rref)
+
+CAPACIDAD_INICIAL = 8         # Filas reservadas al principio; luego la capacidad se duplica
+UMBRAL_ESTABILIDAD = 1e-3     # Pivote mínimo y crecimiento máximo, relativos a la ecuación original
+TOLERANCIA_DEPENDENCIA = 1e-12 # Aportes menores a una fila, relativos al mayor, son error de redondeo
+
+#--------------------------------------------------------------------------
+# Sistema con RREF incremental
+#--------------------------------------------------------------------------
+class SistemaIncremental:
+    """
+    Sistema de ecuaciones cuya RREF se actualiza con cada cambio.
+
+    Se guarda la matriz reducida R (una fila por ecuación, en orden de llegada)
+    junto con la transformación T tal que R = T·A, donde A es la matriz
+    aumentada original. R y T viven en búferes cuya capacidad de filas se
+    duplica al llenarse. Agregar una ecuación reduce sólo esa fila contra los
+    pivotes existentes y, si aporta un pivote nuevo, anula su columna en las
+    filas que la tienen: O(m·(m + n)) (la parte m² es la de T) en lugar de la
+    eliminación completa O(m²·n). Con T, quitar una ecuación normalmente
+    tampoco requiere recalcular: se usa una fila que dependa de ella para
+    borrarla de las demás y se descarta esa fila.
+
+    Para que R siga en forma escalonada reducida, el pivote nuevo es siempre la
+    primera columna no nula de la fila, así que no se elige por magnitud. Si
+    queda menor que UMBRAL_ESTABILIDAD veces el mayor coeficiente de la
+    ecuación, o la reducción hace crecer la fila más de 1/UMBRAL_ESTABILIDAD
+    veces, R y T se recalculan desde las ecuaciones con pivoteo parcial por
+    filas, igual que `eliminacion_gauss_jordan`.
+
+    Las variables conservan el orden en que aparecieron por primera vez; las
+    que dejan de aparecer al quitar ecuaciones se eliminan. Con `cache` (una
+    CacheEcuaciones) las ecuaciones se analizan a través de ella.
+    """
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.variables = {}
+        self.ecuaciones = []
+        self._coeficientes = []     # {índice: coeficiente} de cada ecuación, para contar usos de variables
+        self._lados_derechos = []   # Lado derecho de cada ecuación, para recalcular
+        self._normas = []           # Mayor valor absoluto de cada ecuación (coeficientes y lado derecho)
+        self._usos = []             # Número de ecuaciones en que aparece cada variable (aunque sea con coeficiente 0)
+        self._num_filas = 0
+        self._bufer_rref = np.zeros((CAPACIDAD_INICIAL, 1))
+        self._bufer_transformacion = np.zeros((CAPACIDAD_INICIAL, CAPACIDAD_INICIAL))
+        self._pivote_de_fila = []   # Columna pivote de cada fila de R, o -1 si su parte de coeficientes es nula
+
+    @property
+    def num_variables(self):
+        return len(self.variables)
+
+    @property
+    def _rref(self):
+        return self._bufer_rref[:self._num_filas]
+
+    @property
+    def _transformacion(self):
+        return self._bufer_transformacion[:self._num_filas, :self._num_filas]
+
+    @property
+    def rango(self):
+        return sum(1 for c in self._pivote_de_fila if c >= 0)
+
+    def nombres_variables(self):
+        return sorted(self.variables, key=self.variables.get)
+
+    def agregar_ecuacion(self, ec):
+        """
+        Agrega una ecuación y actualiza la RREF.
+
+        Raises:
+            ErrorEcuacion: Si la ecuación no tiene un formato válido (el sistema no cambia).
+        """
+        variables = dict(self.variables)
+        analizar = coeficientes_ecuacion if self.cache is None else self.cache.coeficientes_ecuacion
+        coeficientes, lado_derecho = analizar(ec, variables)
+
+        nuevas = len(variables) - len(self.variables)
+        if nuevas:
+            # Las columnas nuevas son nulas en todas las filas existentes
+            capacidad = self._bufer_rref.shape[0]
+            self._bufer_rref = np.concatenate([self._bufer_rref[:, :-1], np.zeros((capacidad, nuevas)),
+                                               self._bufer_rref[:, -1:]], axis=1)
+            self._usos.extend([0] * nuevas)
+        self.variables = variables
+        for c in coeficientes:
+            self._usos[c] += 1
+
+        i = self._num_filas
+        if i == self._bufer_rref.shape[0]:
+            self._ampliar(2 * i)
+        fila = self._bufer_rref[i]
+        fila[:] = 0.0
+        fila[list(coeficientes)] = list(coeficientes.values())
+        fila[-1] = lado_derecho
+        T = self._bufer_transformacion
+        T[i, :i] = 0.0
+        T[:i, i] = 0.0
+        T[i, i] = 1.0
+        self._num_filas = i + 1
+        self._pivote_de_fila.append(-1)
+        self.ecuaciones.append(ec)
+        self._coeficientes.append(coeficientes)
+        self._lados_derechos.append(lado_derecho)
+        self._normas.append(max([abs(lado_derecho), *map(abs, coeficientes.values())]))
+
+        self._reducir_fila(i)
+
+    def _ampliar(self, capacidad):
+        """Copia R y T a búferes de `capacidad` filas."""
+        m = self._num_filas
+        rref = np.zeros((capacidad, self._bufer_rref.shape[1]))
+        rref[:m] = self._rref
+        transformacion = np.zeros((capacidad, capacidad))
+        transformacion[:m, :m] = self._transformacion
+        self._bufer_rref, self._bufer_transformacion = rref, transformacion
+
+    def _reducir_fila(self, i):
+        """Reduce la fila i contra los pivotes existentes y, si queda un pivote nuevo, lo incorpora."""
+        R = self._rref
+        T = self._transformacion
+        escala = float(np.abs(R[i, :-1]).max(initial=0.0))
+        filas_pivote = [r for r, c in enumerate(self._pivote_de_fila) if c >= 0]
+        if filas_pivote:
+            columnas = [self._pivote_de_fila[r] for r in filas_pivote]
+            factores = R[i, columnas].copy()
+            R[i] -= factores @ R[filas_pivote]
+            T[i] -= factores @ T[filas_pivote]
+            R[i, columnas] = 0.0
+
+        coeficientes = R[i, :-1]
+        coeficientes[np.abs(coeficientes) < 1e-9] = 0.0
+        no_nulos = np.flatnonzero(coeficientes)
+        if no_nulos.size == 0:
+            return # Ecuación dependiente (o inconsistente si su lado derecho no es nulo)
+
+        # Nuevo pivote en la primera columna no nula: normalizar y anular la columna en las filas que la tienen
+        c = int(no_nulos[0])
+        pivote = R[i, c]
+        if (abs(pivote) < UMBRAL_ESTABILIDAD * escala
+                or np.abs(coeficientes).max() * UMBRAL_ESTABILIDAD > escala):
+            self._recalcular() # Pivote pequeño o filas existentes con multiplicadores grandes
+            return
+        R[i] /= pivote
+        T[i] /= pivote
+        afectadas = np.flatnonzero(R[:, c])
+        afectadas = afectadas[afectadas != i]
+        if afectadas.size:
+            factores = R[afectadas, c].copy()
+            R[afectadas] -= np.outer(factores, R[i])
+            T[afectadas] -= np.outer(factores, T[i])
+            R[afectadas, c] = 0.0
+        self._pivote_de_fila[i] = c
+
+    def _recalcular(self):
+        """
+        Rehace R y T desde las ecuaciones con Gauss-Jordan y pivoteo parcial por
+        filas: en cada columna, la fila sin pivote de mayor magnitud.
+        """
+        m = self._num_filas
+        R = self._rref
+        T = self._transformacion
+        R[:] = 0.0
+        for r, (coeficientes, lado_derecho) in enumerate(zip(self._coeficientes, self._lados_derechos)):
+            R[r, list(coeficientes)] = list(coeficientes.values())
+            R[r, -1] = lado_derecho
+        T[:] = np.eye(m)
+        self._pivote_de_fila = [-1] * m
+
+        sin_pivote = np.arange(m)
+        for c in range(self.num_variables):
+            if sin_pivote.size == 0:
+                break
+            magnitudes = np.abs(R[sin_pivote, c])
+            k = int(np.argmax(magnitudes))
+            if magnitudes[k] < 1e-9:
+                R[sin_pivote, c] = 0.0
+                continue
+            i = int(sin_pivote[k])
+            pivote = R[i, c]
+            R[i] /= pivote
+            T[i] /= pivote
+            afectadas = np.flatnonzero(R[:, c])
+            afectadas = afectadas[afectadas != i]
+            if afectadas.size:
+                factores = R[afectadas, c].copy()
+                R[afectadas] -= np.outer(factores, R[i])
+                T[afectadas] -= np.outer(factores, T[i])
+                R[afectadas, c] = 0.0
+            self._pivote_de_fila[i] = c
+            sin_pivote = np.delete(sin_pivote, k)
+
+    def eliminar_ecuacion(self, indice):
+        """
+        Quita la ecuación `indice` (en orden de llegada), normalmente sin recalcular la RREF.
+
+        Las filas que dependen de la ecuación son aquellas en las que su aporte
+        (la entrada de T por la norma de la ecuación) no es despreciable frente
+        al mayor aporte de la fila. Si alguna fila
+        nula depende de ella, se usa la de mayor peso para borrar su aporte de las
+        demás: la parte de coeficientes no cambia y sólo se ajustan los lados
+        derechos. Si no, se usa la fila pivote de mayor peso, siempre que las
+        demás filas dependientes tengan su pivote más a la izquierda (siguen en
+        forma escalonada reducida y esa columna pasa a ser libre). Si eso no se
+        cumple, los factores superan 1/UMBRAL_ESTABILIDAD o quedaría un pivote en
+        una variable que sólo usaba esta ecuación, R y T se recalculan.
+
+        Raises:
+            IndexError: Si no existe la ecuación `indice` (el sistema no cambia).
+        """
+        if not 0 <= indice < len(self.ecuaciones):
+            raise IndexError(f"No existe la ecuación {indice} (el sistema tiene {len(self.ecuaciones)}).")
+        m = self._num_filas
+        eleccion = self._fila_a_descartar(indice)
+        del self.ecuaciones[indice]
+        del self._lados_derechos[indice]
+        del self._normas[indice]
+        for c in self._coeficientes.pop(indice):
+            self._usos[c] -= 1
+        if eleccion is None:
+            self._num_filas = m - 1
+            self._pivote_de_fila = [-1] * (m - 1)
+            self._quitar_variables_sin_uso()
+            self._recalcular()
+            return
+
+        fila, otras, factores = eleccion
+        if otras.size:
+            R = self._rref
+            T = self._transformacion
+            R[otras] -= np.outer(factores, R[fila])
+            T[otras] -= np.outer(factores, T[fila])
+        # Se corren las filas (y las columnas de T) siguientes sobre las descartadas, en los mismos búferes;
+        # la columna de T de la ecuación, con sus entradas despreciables, desaparece
+        R_bufer, T_bufer = self._bufer_rref, self._bufer_transformacion
+        R_bufer[fila:m - 1] = R_bufer[fila + 1:m]
+        T_bufer[:fila, indice:m - 1] = T_bufer[:fila, indice + 1:m] # Cada elemento de T se mueve una sola vez
+        T_bufer[fila:m - 1, :indice] = T_bufer[fila + 1:m, :indice]
+        T_bufer[fila:m - 1, indice:m - 1] = T_bufer[fila + 1:m, indice + 1:m]
+        self._num_filas = m - 1
+        del self._pivote_de_fila[fila]
+        self._quitar_variables_sin_uso()
+
+    def _fila_a_descartar(self, indice):
+        """
+        Elige la fila que se descarta al quitar la ecuación `indice`.
+
+        Returns:
+            tuple: (fila, otras filas dependientes, factores para borrar de ellas
+            el aporte de la ecuación), o None si hay que recalcular.
+        """
+        T = self._transformacion
+        columna_t = T[:, indice]
+        no_nulas = np.flatnonzero(columna_t)
+        # Peso de la ecuación en cada fila: su aporte |T[r, indice]|·‖A[indice]‖ frente al mayor aporte de la fila
+        normas = np.array(self._normas)
+        pesos = np.zeros(self._num_filas)
+        aportes_filas = np.abs(T[no_nulas])
+        aportes_filas *= normas
+        maximos = aportes_filas.max(axis=1)
+        aportes = np.abs(columna_t[no_nulas]) * normas[indice]
+        pesos[no_nulas] = np.divide(aportes, maximos, out=np.zeros_like(aportes), where=maximos > 0)
+        dependientes = np.flatnonzero(pesos > TOLERANCIA_DEPENDENCIA)
+        if dependientes.size == 0:
+            return None
+
+        nulas = np.array([r for r in dependientes if self._pivote_de_fila[r] < 0], dtype=np.intp)
+        candidatas = nulas if nulas.size else dependientes
+        fila = int(candidatas[np.argmax(pesos[candidatas])])
+        otras = dependientes[dependientes != fila]
+        factores = columna_t[otras] / columna_t[fila]
+        if np.abs(factores).max(initial=0.0) * UMBRAL_ESTABILIDAD > 1.0:
+            return None
+        columna = self._pivote_de_fila[fila]
+        if columna >= 0 and any(self._pivote_de_fila[r] > columna for r in otras):
+            return None # Otra fila dependiente perdería su forma escalonada
+        sin_uso = {c for c in self._coeficientes[indice] if self._usos[c] == 1}
+        if sin_uso and any(c in sin_uso for r, c in enumerate(self._pivote_de_fila) if r != fila):
+            return None # Quedaría un pivote en una variable que desaparece
+        return fila, otras, factores
+
+    def _quitar_variables_sin_uso(self):
+        """Elimina las columnas de variables que ya no aparecen en ninguna ecuación."""
+        sin_uso = [c for c, usos in enumerate(self._usos) if usos == 0]
+        if not sin_uso:
+            return
+        nuevo_indice = {}
+        for c in range(self.num_variables):
+            if self._usos[c]:
+                nuevo_indice[c] = len(nuevo_indice)
+        # Las columnas sin uso son nulas en A y por lo tanto en R = T·A
+        self._bufer_rref = np.delete(self._bufer_rref, sin_uso, axis=1)
+        self.variables = {nombre: nuevo_indice[c] for nombre, c in self.variables.items() if c in nuevo_indice}
+        self._usos = [u for u in self._usos if u]
+        self._coeficientes = [{nuevo_indice[c]: v for c, v in coefs.items()} for coefs in self._coeficientes]
+        self._pivote_de_fila = [nuevo_indice[c] if c >= 0 else -1 for c in self._pivote_de_fila]
+
+    def rref(self):
+        """
+        Devuelve la RREF con las filas pivote ordenadas por columna seguidas de las
+        filas nulas, con la misma limpieza de tolerancia que `eliminacion_gauss_jordan`.
+        """
+        pivotes = sorted((c, r) for r, c in enumerate(self._pivote_de_fila) if c >= 0)
+        orden = [r for _, r in pivotes] + [r for r, c in enumerate(self._pivote_de_fila) if c < 0]
+        matriz = np.round(self._rref[orden], 9)
+        matriz[np.abs(matriz) < 1e-9] = 0.0
+        return matriz
+
+    def clasificacion(self):
+        nulas = [r for r, c in enumerate(self._pivote_de_fila) if c < 0]
+        if np.any(np.abs(self._rref[nulas, -1]) > 1e-9):
+            return SISTEMA_INCONSISTENTE
+        if self.num_variables == 0:
+            return SIN_VARIABLES
+        return SOLUCIONES_INFINITAS if self.rango < self.num_variables else SOLUCION_UNICA
+
+    def resultado(self):
+        """Interpretación completa de la RREF actual (mismo formato que `interpretar_rref`)."""
+        return interpretar_rref(self.rref(), self.nombres_variables())
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentación opcional del solucionador.
+
+Los núcleos consultan `instrumentacion_activa()` una vez por llamada; si no hay
+ninguna activa (el caso normal) el único costo es esa consulta y una
+comparación con None por columna. La instrumentación se activa por contexto
+(y por hilo) con `instrumentar()`.
+"""
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+_ACTIVA = ContextVar("instrumentacion_gauss_jordan", default=None)
+_SIN_FASE = nullcontext()
+
+#--------------------------------------------------------------------------
+# Contadores, temporizadores y observadores
+#--------------------------------------------------------------------------
+class Instrumentacion:
+    """
+    Acumula métricas de las eliminaciones ejecutadas mientras está activa.
+
+    Contadores: pivotes aceptados, pivotes omitidos (columnas cuyo mayor valor
+    quedó bajo la tolerancia 1e-9), intercambios de filas y flops estimados.
+    También guarda el menor y el mayor pivote aceptado (en valor absoluto,
+    antes de normalizar) y el tiempo acumulado de cada fase.
+
+    Los observadores son funciones observador(evento, datos) que reciben
+    "pivote", "pivote_omitido", "intercambio" y "fase"; los diccionarios de
+    datos sólo se construyen si hay algún observador.
+    """
+    def __init__(self, observador=None):
+        self.observadores = [observador] if observador is not None else []
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.pivotes = 0
+        self.pivotes_omitidos = 0
+        self.intercambios = 0
+        self.flops = 0
+        self.pivote_minimo = None
+        self.pivote_maximo = None
+        self.tiempos = {}
+
+    def agregar_observador(self, observador):
+        self.observadores.append(observador)
+
+    def _notificar(self, evento, datos):
+        for observador in self.observadores:
+            observador(evento, datos)
+
+    def registrar_pivote(self, columna, fila, valor, flops):
+        """Pivote aceptado en (fila, columna) con `valor` antes de normalizar y el costo estimado del paso."""
+        magnitud = abs(float(valor))
+        self.pivotes += 1
+        self.flops += flops
+        if self.pivote_minimo is None or magnitud < self.pivote_minimo:
+            self.pivote_minimo = magnitud
+        if self.pivote_maximo is None or magnitud > self.pivote_maximo:
+            self.pivote_maximo = magnitud
+        if self.observadores:
+            self._notificar("pivote", {"columna": columna, "fila": fila, "valor": float(valor)})
+
+    def registrar_pivote_omitido(self, columna, maximo):
+        """Columna sin pivote: su mayor valor disponible (`maximo`) quedó bajo la tolerancia."""
+        self.pivotes_omitidos += 1
+        if self.observadores:
+            self._notificar("pivote_omitido", {"columna": columna, "maximo": float(maximo)})
+
+    def registrar_intercambio(self, fila_a, fila_b):
+        self.intercambios += 1
+        if self.observadores:
+            self._notificar("intercambio", {"filas": (fila_a, fila_b)})
+
+    def registrar_flops(self, flops):
+        """Suma operaciones que no corresponden a un pivote concreto (p. ej. el producto de un panel)."""
+        self.flops += flops
+
+    @contextmanager
+    def fase(self, nombre):
+        """Mide el tiempo de una fase; los tiempos de fases repetidas se acumulan."""
+        inicio = time.perf_counter()
+        try:
+            yield self
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + segundos
+            if self.observadores:
+                self._notificar("fase", {"fase": nombre, "segundos": segundos})
+
+    def condicion_estimada(self):
+        """
+        Cociente entre el mayor y el menor pivote aceptado.
+
+        Con pivoteo parcial los pivotes son la diagonal de U en PA = LU, así que
+        el cociente es una cota inferior barata del número de condición de U:
+        valores grandes (p. ej. > 1e8) anticipan pérdida de dígitos y rangos
+        dudosos. None si no hubo pivotes; inf si un pivote fue exactamente 0.
+        """
+        if not self.pivote_minimo:
+            return None if self.pivote_minimo is None else float("inf")
+        return self.pivote_maximo / self.pivote_minimo
+
+    def a_dict(self):
+        """Métricas como diccionario plano, listo para serializar."""
+        return {
+            "pivotes": self.pivotes,
+            "pivotes_omitidos": self.pivotes_omitidos,
+            "intercambios": self.intercambios,
+            "flops_estimados": self.flops,
+            "pivote_minimo": self.pivote_minimo,
+            "pivote_maximo": self.pivote_maximo,
+            "condicion_estimada": self.condicion_estimada(),
+            "tiempos_s": dict(self.tiempos),
+        }
+
+#--------------------------------------------------------------------------
+# Activación por contexto
+#--------------------------------------------------------------------------
+def instrumentacion_activa():
+    """Instrumentación activa en el contexto actual, o None."""
+    return _ACTIVA.get()
+
+@contextmanager
+def instrumentar(observador=None, instrumentacion=None):
+    """
+    Activa la instrumentación dentro del bloque `with`.
+
+    Uso:
+        with instrumentar() as inst:
+            resolver_ecuaciones(ecuaciones)
+        metricas = inst.a_dict()
+
+    Args:
+        observador (callable, optional): Se agrega como observador(evento, datos).
+        instrumentacion (Instrumentacion, optional): Instancia a reutilizar (acumula entre bloques).
+    """
+    if instrumentacion is None:
+        instrumentacion = Instrumentacion()
+    if observador is not None:
+        instrumentacion.agregar_observador(observador)
+    token = _ACTIVA.set(instrumentacion)
+    try:
+        yield instrumentacion
+    finally:
+        _ACTIVA.reset(token)
+
+def fase(nombre):
+    """Temporizador de fase de la instrumentación activa; sin instrumentación no hace nada."""
+    instrumentacion = _ACTIVA.get()
+    return _SIN_FASE if instrumentacion is None else instrumentacion.fase(nombre)
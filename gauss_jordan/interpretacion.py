@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Interpretación de la RREF: clasificación del sistema y soluciones."""
+import json
+from fractions import Fraction
+
+import numpy as np
+
+SOLUCION_UNICA = "unica"
+SOLUCIONES_INFINITAS = "infinitas"
+SISTEMA_INCONSISTENTE = "inconsistente"
+SIN_VARIABLES = "sin_variables" # Sistema consistente sin incógnitas (sólo identidades como 5 = 5)
+
+#--------------------------------------------------------------------------
+# Resultado estructurado
+#--------------------------------------------------------------------------
+class ResultadoSistema:
+    """
+    Solución de un sistema a partir de su RREF.
+
+    Toda solución se escribe como x = solucion + base_nula · t, con un
+    parámetro t por variable libre: para solución única `base_nula` no tiene
+    columnas y `solucion` es el vector solución; para infinitas soluciones
+    `solucion` es la solución particular con las variables libres en 0.
+
+    Atributos:
+        clasificacion (str): SOLUCION_UNICA, SOLUCIONES_INFINITAS, SISTEMA_INCONSISTENTE o SIN_VARIABLES.
+        nombres_variables (list): Nombres de las variables en el orden de las columnas.
+        rango (int): Número de pivotes (None si el sistema es inconsistente).
+        columnas_pivote (np.array): Columnas con pivote, en orden de fila.
+        columnas_libres (np.array): Columnas sin pivote (variables libres), en orden.
+        solucion (np.array): Vector de longitud n (None si el sistema es inconsistente).
+        base_nula (np.array): Matriz n×k cuyas columnas generan el espacio nulo.
+        valor_inconsistente (float): El k de la primera fila [0 ... 0 | k], o None.
+    """
+    def __init__(self, clasificacion, nombres_variables, rango=None, columnas_pivote=None,
+                 columnas_libres=None, solucion=None, base_nula=None, valor_inconsistente=None):
+        vacio = np.zeros(0, dtype=np.intp)
+        self.clasificacion = clasificacion
+        self.nombres_variables = list(nombres_variables)
+        self.rango = rango
+        self.columnas_pivote = vacio if columnas_pivote is None else columnas_pivote
+        self.columnas_libres = vacio if columnas_libres is None else columnas_libres
+        self.solucion = solucion
+        self.base_nula = base_nula
+        self.valor_inconsistente = valor_inconsistente
+
+    def a_dict(self):
+        """Devuelve el diccionario de `interpretar_rref` (valores float de Python)."""
+        nombres = self.nombres_variables
+        if self.clasificacion == SISTEMA_INCONSISTENTE:
+            return {"clasificacion": SISTEMA_INCONSISTENTE, "rango": None,
+                    "valor_inconsistente": float(self.valor_inconsistente)}
+        if self.clasificacion == SIN_VARIABLES:
+            return {"clasificacion": SIN_VARIABLES, "rango": 0}
+        if self.clasificacion == SOLUCIONES_INFINITAS:
+            libres = [nombres[l] for l in self.columnas_libres]
+            expresiones = {}
+            for c in self.columnas_pivote:
+                fila_base = self.base_nula[c]
+                coeficientes = {libres[j]: float(fila_base[j]) for j in np.flatnonzero(fila_base)}
+                expresiones[nombres[c]] = {"constante": float(self.solucion[c]), "coeficientes": coeficientes}
+            return {"clasificacion": SOLUCIONES_INFINITAS, "rango": self.rango,
+                    "variables_libres": libres, "expresiones": expresiones}
+        solucion = dict(zip(nombres, self.solucion.tolist()))
+        return {"clasificacion": SOLUCION_UNICA, "rango": self.rango, "solucion": solucion}
+
+    def texto(self):
+        """Texto de la interpretación tal como lo muestra la GUI, en una sola cadena."""
+        nombres = self.nombres_variables
+        if self.clasificacion == SISTEMA_INCONSISTENTE:
+            return ("El sistema es INCONSISTENTE (no tiene solución).\n"
+                    f"(Se encontró una fila tipo [ 0 ... 0 | {self.valor_inconsistente:.3f} ≠ 0 ])\n")
+        if self.clasificacion == SIN_VARIABLES:
+            return "El sistema es consistente (ej: 0 = 0) y no tiene variables."
+        if self.clasificacion == SOLUCION_UNICA:
+            lineas = ["El sistema tiene SOLUCIÓN ÚNICA:"]
+            lineas += [f"{nombre} = {valor:.3f}" for nombre, valor in zip(nombres, self.solucion.tolist())]
+            return "\n".join(lineas) + "\n"
+
+        libres = [nombres[l] for l in self.columnas_libres]
+        lineas = ["El sistema tiene INFINITAS SOLUCIONES.", f"Variables libres: {', '.join(libres)}", ""]
+        for c in self.columnas_pivote:
+            fila_base = self.base_nula[c]
+            terminos = "".join(f" {fila_base[j]:+.3f}{libres[j]}" for j in np.flatnonzero(fila_base))
+            lineas.append(f"{nombres[c]} = {self.solucion[c]:.3f}{terminos}")
+        return "\n".join(lineas) + "\n"
+
+#--------------------------------------------------------------------------
+# Interpretación de la matriz RREF independiente de la GUI
+#--------------------------------------------------------------------------
+def analizar_rref(matriz_rref, nombres_variables):
+    """
+    Interpreta la matriz en RREF con operaciones vectorizadas en O(m·n).
+
+    Un pivote es la primera entrada no nula de una fila cuando vale 1 y es la
+    única no nula de su columna (tolerancia 1e-9), el mismo criterio que usaba
+    la GUI; las sumas por columna se calculan una sola vez para toda la matriz.
+
+    Args:
+        matriz_rref (np.array): Matriz aumentada en forma escalonada reducida.
+        nombres_variables (list): Nombres de las variables en el orden de las columnas.
+
+    Returns:
+        ResultadoSistema: Clasificación, rango, solución y base del espacio nulo.
+
+    Raises:
+        ValueError: Si la matriz está vacía o no concuerda con el número de variables.
+    """
+    if matriz_rref is None or matriz_rref.size == 0:
+        raise ValueError("No se puede determinar la solución (matriz RREF inválida).")
+    num_filas, num_cols = matriz_rref.shape
+    num_variables = len(nombres_variables)
+    if num_cols != num_variables + 1:
+        raise ValueError(f"Dimensiones inconsistentes en RREF (Variables: {num_variables}, Columnas: {num_cols}).")
+
+    coeficientes = matriz_rref[:, :num_variables]
+    lado_derecho = matriz_rref[:, -1]
+    no_nulos = np.abs(coeficientes) > 1e-9
+    fila_con_coeficientes = no_nulos.any(axis=1)
+
+    # --- Chequeo de Inconsistencia (Fila [0 0 ... 0 | k] con k != 0) ---
+    inconsistentes = np.flatnonzero(~fila_con_coeficientes & (np.abs(lado_derecho) > 1e-9))
+    if inconsistentes.size:
+        return ResultadoSistema(SISTEMA_INCONSISTENTE, nombres_variables,
+                                valor_inconsistente=float(lado_derecho[inconsistentes[0]]))
+
+    # --- Identificación de Pivotes y Rango ---
+    filas = np.flatnonzero(fila_con_coeficientes)
+    columnas = no_nulos[filas].argmax(axis=1) if filas.size else filas # Primera entrada no nula de cada fila
+    suma_columnas = np.abs(coeficientes).sum(axis=0)
+    es_pivote = (np.abs(coeficientes[filas, columnas] - 1.0) < 1e-9) & (np.abs(suma_columnas[columnas] - 1.0) < 1e-9)
+    filas, columnas = filas[es_pivote], columnas[es_pivote]
+    _, primeras = np.unique(columnas, return_index=True) # Si una columna se repite vale la primera fila
+    primeras.sort()
+    filas_pivote, columnas_pivote = filas[primeras], columnas[primeras]
+    rango = len(columnas_pivote)
+
+    libres = np.ones(num_variables, dtype=bool)
+    libres[columnas_pivote] = False
+    columnas_libres = np.flatnonzero(libres)
+
+    solucion = np.zeros(num_variables)
+    solucion[columnas_pivote] = lado_derecho[filas_pivote]
+    base_nula = np.zeros((num_variables, columnas_libres.size))
+    if columnas_libres.size:
+        # básica = constante - suma(R[fila, libre] * libre); cada libre es su propio parámetro
+        bloque = coeficientes[np.ix_(filas_pivote, columnas_libres)]
+        base_nula[columnas_pivote] = np.where(np.abs(bloque) > 1e-9, -bloque, 0.0)
+        base_nula[columnas_libres, np.arange(columnas_libres.size)] = 1.0
+
+    if num_variables == 0:
+        clasificacion = SIN_VARIABLES
+    else:
+        clasificacion = SOLUCIONES_INFINITAS if rango < num_variables else SOLUCION_UNICA
+    return ResultadoSistema(clasificacion, nombres_variables, rango, columnas_pivote, columnas_libres,
+                            solucion, base_nula)
+
+def resultado_a_json(resultado):
+    """
+    Serializa un diccionario de resultado (el de `interpretar_rref` o el de
+    `resolver_ecuaciones`) en JSON, como lo escriben la CLI y el servicio.
+
+    Los `Fraction` del modo exacto se escriben como "p/q" (o "p" si son enteros).
+
+    Returns:
+        str: El JSON en una sola línea, sin escapar los caracteres no ASCII.
+    """
+    return json.dumps(resultado, ensure_ascii=False, default=_valor_json)
+
+def _valor_json(valor):
+    if isinstance(valor, Fraction):
+        return str(valor)
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+def interpretar_rref(matriz_rref, nombres_variables):
+    """
+    Interpreta la matriz en RREF con el mismo criterio que la GUI.
+
+    Args:
+        matriz_rref (np.array): Matriz aumentada en forma escalonada reducida.
+        nombres_variables (list): Nombres de las variables en el orden de las columnas.
+
+    Returns:
+        dict: Siempre con "clasificacion" y "rango". Sin variables y sin filas
+        inconsistentes la clasificación es SIN_VARIABLES y no hay más claves. Según el caso agrega
+        "solucion" ({variable: valor}), "variables_libres" y "expresiones"
+        ({básica: {"constante": c, "coeficientes": {libre: k}}}, es decir
+        básica = c + suma(k * libre)) o "valor_inconsistente" (el k de la fila [0 ... 0 | k]).
+
+    Raises:
+        ValueError: Si la matriz está vacía o no concuerda con el número de variables.
+    """
+    return analizar_rref(matriz_rref, nombres_variables).a_dict()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Resolución en lote de sistemas con la misma forma."""
+import numpy as np
+
+from .interpretacion import SIN_VARIABLES, SOLUCION_UNICA, SOLUCIONES_INFINITAS, SISTEMA_INCONSISTENTE
+
+#--------------------------------------------------------------------------
+# Resolución en lote de sistemas con la misma forma
+#--------------------------------------------------------------------------
+def eliminacion_gauss_jordan_lote(matrices):
+    """
+    Aplica Gauss-Jordan a una pila de matrices aumentadas de igual forma.
+
+    Cada paso de columna se ejecuta vectorizado sobre el eje del lote: cada
+    sistema lleva su propia fila actual, y los que no tienen pivote en la
+    columna (o ya agotaron sus filas) reciben operaciones neutras, así que los
+    sistemas singulares no obligan al resto a un camino lento. El resultado de
+    cada sistema coincide con el de `eliminacion_gauss_jordan`.
+
+    Args:
+        matrices (array-like): Arreglo de forma (lote, filas, columnas).
+
+    Returns:
+        tuple: (rref, rangos) con las RREF de forma (lote, filas, columnas) y el
+        número de pivotes de cada sistema.
+    """
+    matrices = np.array(matrices, dtype=float)
+    if matrices.ndim != 3:
+        raise ValueError(f"Se esperaba un arreglo de forma (lote, filas, columnas); se recibió {matrices.shape}.")
+    lote, num_filas, num_cols = matrices.shape
+    indices_lote = np.arange(lote)
+    indices_filas = np.arange(num_filas)
+    fila_actual = np.zeros(lote, dtype=np.intp)
+
+    for columna_actual in range(num_cols - 1):
+        # Pivoteo Parcial por sistema: se ignoran las filas ya usadas como pivote
+        abs_columna = np.abs(matrices[:, :, columna_actual])
+        abs_columna[indices_filas[None, :] < fila_actual[:, None]] = -1.0
+        fila_pivote = np.argmax(abs_columna, axis=1)
+        con_pivote = abs_columna[indices_lote, fila_pivote] >= 1e-9
+        if not con_pivote.any():
+            continue
+
+        # Los sistemas sin pivote se procesan con operaciones neutras (sin intercambio,
+        # división por 1 y factores nulos) para no tener que separar el lote
+        filas = np.minimum(fila_actual, num_filas - 1)
+        fila_pivote = np.where(con_pivote, fila_pivote, filas)
+
+        # Intercambio de filas
+        fila_tmp = matrices[indices_lote, filas]
+        matrices[indices_lote, filas] = matrices[indices_lote, fila_pivote]
+        matrices[indices_lote, fila_pivote] = fila_tmp
+
+        # Normalización
+        pivotes = np.where(con_pivote, matrices[indices_lote, filas, columna_actual], 1.0)
+        matrices[indices_lote, filas] = matrices[indices_lote, filas] / pivotes[:, None]
+
+        # Eliminación Gauss-Jordan con un producto exterior por sistema
+        filas_pivote = matrices[indices_lote, filas]
+        factores = matrices[:, :, columna_actual].copy()
+        factores[~con_pivote] = 0.0
+        factores[indices_lote, filas] = 0.0
+        matrices -= factores[:, :, None] * filas_pivote[:, None, :]
+
+        fila_actual[con_pivote] += 1
+
+    matrices = np.round(matrices, 9)
+    matrices[np.abs(matrices) < 1e-9] = 0.0
+    return matrices, fila_actual
+
+def clasificar_sistemas_lote(matrices_rref, rangos):
+    """
+    Clasifica cada sistema de una pila de RREF con el mismo criterio que
+    `interpretar_y_mostrar_soluciones`: inconsistente si hay una fila
+    [0 ... 0 | k] con k != 0, infinitas soluciones si el rango es menor que el
+    número de variables, SIN_VARIABLES si no hay variables y solución única en otro caso.
+
+    Returns:
+        np.array: Arreglo de cadenas SOLUCION_UNICA, SOLUCIONES_INFINITAS,
+        SISTEMA_INCONSISTENTE o SIN_VARIABLES.
+    """
+    num_variables = matrices_rref.shape[2] - 1
+    coeficientes_nulos = np.all(np.abs(matrices_rref[:, :, :num_variables]) < 1e-9, axis=2)
+    inconsistentes = np.any(coeficientes_nulos & (np.abs(matrices_rref[:, :, -1]) > 1e-9), axis=1)
+    consistente = (SIN_VARIABLES if num_variables == 0 else
+                   np.where(np.asarray(rangos) < num_variables, SOLUCIONES_INFINITAS, SOLUCION_UNICA))
+    return np.where(inconsistentes, SISTEMA_INCONSISTENTE, consistente)
+
+def resolver_sistemas_lote(matrices):
+    """
+    Resuelve una pila de sistemas de igual forma (lote, filas, columnas).
+
+    Returns:
+        tuple: (rref, rangos, clasificaciones) para cada sistema del lote.
+    """
+    matrices_rref, rangos = eliminacion_gauss_jordan_lote(matrices)
+    return matrices_rref, rangos, clasificar_sistemas_lote(matrices_rref, rangos)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Resolución de muchos sistemas independientes en varios procesos."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .eliminacion import eliminacion_gauss_jordan
+from .interpretacion import interpretar_rref
+
+#--------------------------------------------------------------------------
+# Trabajo de cada proceso
+#--------------------------------------------------------------------------
+def _resolver_tramo(nombres_memoria, inicio, fin, tam_indice, nombres_variables):
+    """
+    Resuelve los sistemas [inicio, fin) leyendo y escribiendo en memoria compartida.
+
+    El índice tiene una fila (desplazamiento, filas, columnas) por sistema; las
+    matrices están contiguas en el segmento de entrada y cada RREF se escribe en
+    la misma posición del segmento de salida. Sólo vuelven por pickle las
+    interpretaciones, que son pequeñas.
+    """
+    memorias = [shared_memory.SharedMemory(name=nombre) for nombre in nombres_memoria]
+    try:
+        return _resolver_vistas(memorias, inicio, fin, tam_indice, nombres_variables)
+    finally:
+        for memoria in memorias:
+            memoria.close()
+
+def _resolver_vistas(memorias, inicio, fin, tam_indice, nombres_variables):
+    """Cuerpo de `_resolver_tramo`; las vistas sobre los segmentos se liberan al volver, antes de cerrarlos."""
+    indice = np.ndarray((tam_indice, 3), dtype=np.int64, buffer=memorias[0].buf)
+    total = memorias[1].size // 8
+    entrada = np.ndarray((total,), dtype=np.float64, buffer=memorias[1].buf)
+    salida = np.ndarray((total,), dtype=np.float64, buffer=memorias[2].buf)
+
+    resultados = []
+    for k in range(inicio, fin):
+        desplazamiento, num_filas, num_cols = (int(v) for v in indice[k])
+        tam = num_filas * num_cols
+        matriz = entrada[desplazamiento:desplazamiento + tam].reshape(num_filas, num_cols)
+        try:
+            # La RREF se escribe directamente en el segmento de salida
+            rref = eliminacion_gauss_jordan(matriz, salida=salida[desplazamiento:desplazamiento + tam].reshape(num_filas, num_cols))
+            nombres = nombres_variables or [f"x{i + 1}" for i in range(num_cols - 1)]
+            resultados.append(interpretar_rref(rref, nombres))
+        except ValueError as e:
+            resultados.append({"error": str(e)})
+    return resultados
+
+#--------------------------------------------------------------------------
+# Ejecutor paralelo
+#--------------------------------------------------------------------------
+class EjecutorParalelo:
+    """
+    Reparte sistemas independientes entre procesos con `ProcessPoolExecutor`.
+
+    Las matrices se copian una sola vez a un segmento de memoria compartida y
+    cada tarea sólo recibe el rango de sistemas que le toca, así que no se
+    serializan matrices en ninguna dirección. Los resultados se devuelven en
+    el orden de entrada. El grupo de procesos se crea en el primer uso y se
+    reutiliza hasta `cerrar()` (o el final del bloque `with`).
+
+    Args:
+        trabajadores (int, optional): Número de procesos. None usa todos los núcleos.
+        tam_tramo (int, optional): Sistemas por tarea. None reparte unas 4 tareas por proceso.
+    """
+    def __init__(self, trabajadores=None, tam_tramo=None):
+        self.trabajadores = max(1, int(trabajadores or os.cpu_count() or 1))
+        self.tam_tramo = tam_tramo
+        self._grupo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        if self._grupo is not None:
+            self._grupo.shutdown()
+            self._grupo = None
+
+    def resolver(self, matrices, nombres_variables=None):
+        """
+        Elimina e interpreta cada matriz aumentada de `matrices`.
+
+        Args:
+            matrices (iterable): Matrices aumentadas (pueden tener formas distintas).
+            nombres_variables (list, optional): Nombres comunes de las variables;
+                None usa x1, x2, ... según el número de columnas de cada sistema.
+
+        Returns:
+            tuple: (lista de RREF, lista de interpretaciones como las de `interpretar_rref`;
+            un sistema que no se pudo interpretar tiene {"error": mensaje}).
+        """
+        matrices = [np.asarray(m, dtype=float) for m in matrices]
+        num_sistemas = len(matrices)
+        if num_sistemas == 0:
+            return [], []
+        for k, matriz in enumerate(matrices):
+            if matriz.ndim != 2:
+                raise ValueError(f"El sistema {k} no es una matriz (forma {matriz.shape}).")
+
+        indice = np.empty((num_sistemas, 3), dtype=np.int64)
+        indice[:, 1:] = [m.shape for m in matrices]
+        tamanos = indice[:, 1] * indice[:, 2]
+        indice[:, 0] = np.cumsum(tamanos) - tamanos
+        total = int(tamanos.sum())
+
+        # Los segmentos de tamaño cero no se pueden crear: se reserva al menos un elemento
+        memorias = [shared_memory.SharedMemory(create=True, size=max(indice.nbytes, 8)),
+                    shared_memory.SharedMemory(create=True, size=max(total, 1) * 8),
+                    shared_memory.SharedMemory(create=True, size=max(total, 1) * 8)]
+        try:
+            np.ndarray(indice.shape, dtype=np.int64, buffer=memorias[0].buf)[:] = indice
+            _copiar_matrices(memorias[1], matrices, indice[:, 0])
+
+            nombres_memoria = tuple(memoria.name for memoria in memorias)
+            tam_tramo = self.tam_tramo or max(1, -(-num_sistemas // (4 * self.trabajadores)))
+            tramos = [(inicio, min(inicio + tam_tramo, num_sistemas)) for inicio in range(0, num_sistemas, tam_tramo)]
+
+            if self.trabajadores == 1:
+                # Sin procesos extra: mismo camino de datos, útil como línea base
+                partes = [_resolver_tramo(nombres_memoria, inicio, fin, num_sistemas, nombres_variables)
+                          for inicio, fin in tramos]
+            else:
+                if self._grupo is None:
+                    self._grupo = ProcessPoolExecutor(max_workers=self.trabajadores)
+                futuros = [self._grupo.submit(_resolver_tramo, nombres_memoria, inicio, fin, num_sistemas, nombres_variables)
+                           for inicio, fin in tramos]
+                partes = [futuro.result() for futuro in futuros] # En el orden de envío, no de llegada
+
+            salida = np.ndarray((max(total, 1),), dtype=np.float64, buffer=memorias[2].buf)[:total].copy()
+        finally:
+            for memoria in memorias:
+                memoria.close()
+                memoria.unlink()
+
+        rrefs = [salida[d:d + f * c].reshape(f, c) for d, f, c in indice]
+        resultados = [resultado for parte in partes for resultado in parte]
+        return rrefs, resultados
+
+def _copiar_matrices(memoria, matrices, desplazamientos):
+    """Copia las matrices, una tras otra, al segmento de entrada."""
+    entrada = np.ndarray((memoria.size // 8,), dtype=np.float64, buffer=memoria.buf)
+    for matriz, desplazamiento in zip(matrices, desplazamientos):
+        entrada[desplazamiento:desplazamiento + matriz.size] = matriz.ravel()
+
+def resolver_en_paralelo(matrices, nombres_variables=None, trabajadores=None, tam_tramo=None):
+    """Atajo de `EjecutorParalelo(trabajadores, tam_tramo).resolver(...)` que cierra los procesos al terminar."""
+    with EjecutorParalelo(trabajadores, tam_tramo) as ejecutor:
+        return ejecutor.resolver(matrices, nombres_variables)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Resolución en precisión mixta: factorización LU en float32 y refinamiento
+iterativo del residuo en float64.
+
+La factorización (O(n³)) lee y escribe la mitad de bytes que en float64 y sus
+productos de paneles usan sgemm; cada paso de refinamiento cuesta O(n²). Si
+el sistema está bien condicionado, unos pocos pasos llevan la solución a la
+precisión de float64. Si no converge (mal condicionamiento, rango
+incompleto), algún pivote float32 no se distingue del umbral 1e-9 de la
+eliminación float64 o la matriz no es cuadrada, se usa `eliminacion_gauss_jordan`.
+"""
+import numpy as np
+
+from .eliminacion import _limpiar_tolerancia, eliminacion_gauss_jordan
+from .instrumentacion import fase, instrumentacion_activa
+
+RUTA_MIXTA = "mixta"
+RUTA_FLOAT64 = "float64"
+
+TAM_BLOQUE_MIXTO = 128  # Ancho de los paneles de la factorización float32
+MAX_REFINAMIENTOS = 10  # Con CONTRACCION_MINIMA, 10 pasos reducen el residuo al menos 1000 veces
+CONTRACCION_MINIMA = 0.5 # Cada paso debe al menos reducir el residuo a la mitad; si no, no va a converger
+
+#--------------------------------------------------------------------------
+# Factorización LU en float32
+#--------------------------------------------------------------------------
+class _FactorizacionLU32:
+    """
+    P·A = L·U en float32 por paneles, con el mismo pivoteo parcial que
+    `eliminacion_gauss_jordan` (primer máximo en valor absoluto).
+
+    Un pivote float32 arrastra un error de redondeo del orden de
+    n·ε(float32)·max|A|, así que solo se acepta si supera 1e-9 (el umbral de la
+    eliminación float64) más ese margen; si no, el pivote float64 podría quedar
+    por debajo de 1e-9 y el sistema se clasificaría de otra forma.
+
+    Para resolver, las inversas de los bloques diagonales de L y U se calculan
+    una vez, así que cada sustitución son productos matriz-vector por bloques
+    en lugar de n pasos de Python.
+    """
+    def __init__(self, coeficientes, tam_bloque=TAM_BLOQUE_MIXTO):
+        with np.errstate(over="ignore"): # Los valores fuera de rango se detectan abajo
+            lu = np.array(coeficientes, dtype=np.float32)
+        n = lu.shape[0]
+        self.permutacion = np.arange(n)
+        self.pivote_minimo = np.inf
+        self.umbral_pivote = 1e-9
+        self.bloques = [(k0, min(k0 + tam_bloque, n)) for k0 in range(0, n, tam_bloque)]
+        self.lu = lu
+        self.singular = not np.isfinite(lu).all() # Fuera del rango de float32
+        if not self.singular:
+            self.umbral_pivote += n * float(np.finfo(np.float32).eps) * float(np.abs(lu).max())
+            self._factorizar()
+        if not self.singular:
+            identidad = np.eye(tam_bloque, dtype=np.float32)
+            self.inversas_l = [np.linalg.inv(np.tril(lu[k0:k1, k0:k1], -1) + identidad[:k1 - k0, :k1 - k0])
+                               for k0, k1 in self.bloques]
+            self.inversas_u = [np.linalg.inv(np.triu(lu[k0:k1, k0:k1])) for k0, k1 in self.bloques]
+
+    def _factorizar(self):
+        lu, permutacion = self.lu, self.permutacion
+        n = lu.shape[0]
+        for k0, k1 in self.bloques:
+            # Factorización del panel de columnas [k0, k1) sobre todas las filas restantes
+            for k in range(k0, k1):
+                fila_pivote = k + int(np.argmax(np.abs(lu[k:, k])))
+                pivote = abs(float(lu[fila_pivote, k]))
+                self.pivote_minimo = min(self.pivote_minimo, pivote)
+                if pivote < self.umbral_pivote: # Rango incompleto, o no se distingue del umbral float64
+                    self.singular = True
+                    return
+                if fila_pivote != k:
+                    lu[[k, fila_pivote]] = lu[[fila_pivote, k]]
+                    permutacion[[k, fila_pivote]] = permutacion[[fila_pivote, k]]
+                lu[k + 1:, k] /= lu[k, k]
+                lu[k + 1:, k + 1:k1] -= np.outer(lu[k + 1:, k], lu[k, k + 1:k1])
+            if k1 < n:
+                # U12 = L11⁻¹·A12 y actualización del complemento de Schur con un único producto
+                for k in range(k0, k1 - 1):
+                    lu[k + 1:k1, k1:] -= np.outer(lu[k + 1:k1, k], lu[k, k1:])
+                lu[k1:, k1:] -= lu[k1:, k0:k1] @ lu[k0:k1, k1:]
+
+    def resolver(self, lados_derechos):
+        """Resuelve A·x = b en float32 (devuelve float32)."""
+        lu = self.lu
+        x = lados_derechos[self.permutacion].astype(np.float32)
+        for (k0, k1), inversa in zip(self.bloques, self.inversas_l):
+            if k0:
+                x[k0:k1] -= lu[k0:k1, :k0] @ x[:k0]
+            x[k0:k1] = inversa @ x[k0:k1]
+        for (k0, k1), inversa in zip(reversed(self.bloques), reversed(self.inversas_u)):
+            x[k0:k1] = inversa @ (x[k0:k1] - lu[k0:k1, k1:] @ x[k1:])
+        return x
+
+#--------------------------------------------------------------------------
+# Resolución con refinamiento iterativo
+#--------------------------------------------------------------------------
+def eliminacion_gauss_jordan_mixta(matriz, max_refinamientos=MAX_REFINAMIENTOS, tam_bloque=TAM_BLOQUE_MIXTO,
+                                   sobrescribir=False):
+    """
+    RREF de un sistema cuadrado con solución única, factorizando en float32 y
+    refinando en float64.
+
+    Se factoriza A en float32 y se repite x ← x + A⁻¹·(b − A·x), con el
+    residuo calculado en float64, hasta que el error hacia atrás
+    ‖b − A·x‖∞ / (‖A‖∞·‖x‖∞ + ‖b‖∞) baja de √n·ε(float64), el mismo criterio que
+    dsgesv de LAPACK. Si algún paso no reduce el residuo al menos a la mitad,
+    se agotan los pasos, algún pivote float32 no supera 1e-9 más su error de
+    redondeo o la matriz no es n×(n+1), se devuelve el resultado de `eliminacion_gauss_jordan`, que
+    además clasifica los sistemas sin solución única.
+
+    Args:
+        matriz (list or np.array): La matriz aumentada del sistema.
+        max_refinamientos (int): Pasos de refinamiento antes de recurrir a float64.
+        tam_bloque (int): Ancho de los paneles de la factorización float32.
+        sobrescribir (bool): Escribe la RREF en `matriz` en lugar de en una
+            matriz nueva, con los mismos requisitos que en `eliminacion_gauss_jordan`.
+
+    Returns:
+        tuple: (rref, informe). `rref` es la misma matriz que devolvería
+        `eliminacion_gauss_jordan` ([I | x] si la solución es única).
+        `informe` es un diccionario con "ruta" (RUTA_MIXTA o RUTA_FLOAT64),
+        "refinamientos" (pasos ejecutados), "error_relativo" (el último error
+        hacia atrás medido, o None) y "motivo" (por qué se recurrió a float64, o None).
+    """
+    if not sobrescribir:
+        matriz = np.asarray(matriz, dtype=float)
+    informe = {"ruta": RUTA_MIXTA, "refinamientos": 0, "error_relativo": None, "motivo": None}
+    if matriz.ndim != 2 or matriz.shape[1] != matriz.shape[0] + 1 or matriz.shape[0] == 0:
+        informe.update(ruta=RUTA_FLOAT64, motivo="el sistema no es cuadrado")
+        return eliminacion_gauss_jordan(matriz, sobrescribir=sobrescribir), informe
+
+    with fase("eliminacion"):
+        solucion, motivo = _refinar(matriz, max_refinamientos, tam_bloque, informe)
+    if motivo is not None:
+        informe.update(ruta=RUTA_FLOAT64, motivo=motivo)
+        return eliminacion_gauss_jordan(matriz, sobrescribir=sobrescribir), informe
+
+    n = matriz.shape[0]
+    rref = matriz if sobrescribir else np.empty_like(matriz)
+    rref[:, :-1] = 0.0
+    rref[np.arange(n), np.arange(n)] = 1.0
+    rref[:, -1] = solucion
+    _limpiar_tolerancia(rref)
+    return rref, informe
+
+def _refinar(matriz, max_refinamientos, tam_bloque, informe):
+    """Devuelve (solución, None) si el refinamiento converge, o (None, motivo) si no."""
+    n = matriz.shape[0]
+    coeficientes = matriz[:, :-1]
+    lado_derecho = np.ascontiguousarray(matriz[:, -1])
+    instrumentacion = instrumentacion_activa()
+
+    factorizacion = _FactorizacionLU32(coeficientes, tam_bloque)
+    if instrumentacion is not None:
+        instrumentacion.registrar_flops(2 * n ** 3 // 3)
+    if factorizacion.singular:
+        if np.isfinite(factorizacion.pivote_minimo):
+            return None, (f"pivote float32 {factorizacion.pivote_minimo:.3e} menor que "
+                          f"{factorizacion.umbral_pivote:.3e} (1e-9 más el error de redondeo)")
+        return None, "coeficientes fuera del rango de float32"
+
+    norma_a = float(np.abs(coeficientes).sum(axis=1).max())
+    norma_b = float(np.abs(lado_derecho).max())
+    umbral = np.sqrt(n) * np.finfo(np.float64).eps
+    solucion = factorizacion.resolver(lado_derecho).astype(np.float64)
+    norma_anterior = np.inf
+    for paso in range(max_refinamientos + 1):
+        residuo = lado_derecho - coeficientes @ solucion
+        norma_residuo = float(np.abs(residuo).max())
+        escala = norma_a * float(np.abs(solucion).max()) + norma_b
+        if not np.isfinite(norma_residuo) or not np.isfinite(escala):
+            return None, "la solución float32 no es finita"
+        informe["error_relativo"] = norma_residuo / escala if escala else 0.0
+        if informe["error_relativo"] <= umbral:
+            return solucion, None
+        if paso == max_refinamientos:
+            return None, f"sin convergencia tras {max_refinamientos} refinamientos"
+        if norma_residuo > CONTRACCION_MINIMA * norma_anterior:
+            return None, f"el residuo dejó de decrecer en el refinamiento {paso}"
+        norma_anterior = norma_residuo
+        solucion += factorizacion.resolver(residuo)
+        informe["refinamientos"] = paso + 1
+        if instrumentacion is not None:
+            instrumentacion.registrar_flops(4 * n * n)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Resolución de un sistema dado como lista de ecuaciones de texto, como SistemaDisperso o como matriz densa."""
+from .archivos import matriz_aumentada
+from .disperso import (SistemaDisperso, eliminacion_gauss_jordan_dispersa, interpretar_sistema_disperso,
+                       usar_motor_disperso)
+from .eliminacion import eliminacion_gauss_jordan
+from .exacto import eliminacion_gauss_jordan_exacta, interpretar_rref_exacta
+from .instrumentacion import fase
+from .interpretacion import SISTEMA_INCONSISTENTE, SOLUCIONES_INFINITAS, interpretar_rref
+from .precision_mixta import eliminacion_gauss_jordan_mixta
+
+def resolver_ecuaciones(ecuaciones, exacto=False, cache=None, precision_mixta=False):
+    """
+    Analiza, elimina e interpreta un sistema de ecuaciones de texto.
+
+    Elige el motor disperso o el denso según `usar_motor_disperso` y devuelve el
+    mismo diccionario que `interpretar_rref`, más la lista "variables". Con
+    `exacto=True` usa la eliminación sin fracciones y los valores son `Fraction`.
+    Con `instrumentar()` activo se miden las fases "analisis", "eliminacion" e
+    "interpretacion". `cache` es una CacheEcuaciones opcional para el análisis.
+    Con `precision_mixta=True` el motor denso usa `eliminacion_gauss_jordan_mixta`
+    y el resultado agrega "precision" con su informe (ruta y refinamientos).
+
+    Raises:
+        ValueError: Si no hay ecuaciones o alguna no tiene un formato válido.
+    """
+    if not ecuaciones:
+        raise ValueError("No se han ingresado ecuaciones para resolver.")
+    variables = {}
+    with fase("analisis"):
+        sistema = SistemaDisperso.desde_ecuaciones(ecuaciones, variables, cache)
+        nombres = sorted(variables, key=variables.get)
+
+    return resolver_sistema(sistema, nombres, exacto, precision_mixta)
+
+def resolver_sistema(sistema, nombres, exacto=False, precision_mixta=False):
+    """
+    Elimina e interpreta un SistemaDisperso ya construido (por ejemplo, cargado de Matrix Market).
+
+    Devuelve el mismo diccionario que `resolver_ecuaciones`.
+    """
+    # Cada motor mide su propia fase "eliminacion"
+    if exacto:
+        rref, columnas_pivote = eliminacion_gauss_jordan_exacta(sistema.a_densa())
+        with fase("interpretacion"):
+            resultado = interpretar_rref_exacta(rref, columnas_pivote, nombres)
+    elif usar_motor_disperso(sistema.num_variables, sistema.densidad()):
+        reducido, columnas_pivote = eliminacion_gauss_jordan_dispersa(sistema)
+        with fase("interpretacion"):
+            resultado = _resultado_disperso(reducido, columnas_pivote, nombres)
+    else:
+        return _resolver_denso(sistema.a_densa(), nombres, precision_mixta)
+    resultado["variables"] = list(nombres)
+    return resultado
+
+def resolver_matriz(coeficientes, lados_derechos, nombres, exacto=False, precision_mixta=False):
+    """
+    Elimina e interpreta un sistema denso A·x = b (por ejemplo, cargado de NPZ), sin analizar texto.
+
+    La matriz aumentada se arma con una sola copia, que se reduce in situ, así
+    que `coeficientes` puede ser un arreglo de sólo lectura mapeado en memoria.
+    Devuelve el mismo diccionario que `resolver_ecuaciones`.
+    """
+    matriz = matriz_aumentada(coeficientes, lados_derechos)
+    if not exacto:
+        return _resolver_denso(matriz, nombres, precision_mixta)
+    rref, columnas_pivote = eliminacion_gauss_jordan_exacta(matriz)
+    with fase("interpretacion"):
+        resultado = interpretar_rref_exacta(rref, columnas_pivote, nombres)
+    resultado["variables"] = list(nombres)
+    return resultado
+
+def _resolver_denso(matriz, nombres, precision_mixta):
+    """Motor denso sobre una matriz aumentada propia, que se reduce in situ."""
+    informe = None
+    if precision_mixta:
+        rref, informe = eliminacion_gauss_jordan_mixta(matriz, sobrescribir=True)
+    else:
+        rref = eliminacion_gauss_jordan(matriz, sobrescribir=True)
+    with fase("interpretacion"):
+        resultado = interpretar_rref(rref, nombres)
+    resultado["variables"] = list(nombres)
+    if informe is not None:
+        resultado["precision"] = informe
+    return resultado
+
+def _resultado_disperso(reducido, columnas_pivote, nombres):
+    """Traduce la salida de `interpretar_sistema_disperso` al formato de `interpretar_rref`."""
+    clasificacion, libres, expresiones = interpretar_sistema_disperso(reducido, columnas_pivote)
+    if clasificacion == SISTEMA_INCONSISTENTE:
+        valor = next(ld for fila, ld in zip(reducido.filas, reducido.lados_derechos) if not fila and abs(ld) > 1e-9)
+        return {"clasificacion": clasificacion, "rango": None, "valor_inconsistente": float(valor)}
+    if clasificacion == SOLUCIONES_INFINITAS:
+        return {
+            "clasificacion": clasificacion,
+            "rango": len(columnas_pivote),
+            "variables_libres": [nombres[c] for c in libres],
+            "expresiones": {
+                nombres[c]: {"constante": float(valor), "coeficientes": {nombres[l]: float(-k) for l, k in coefs.items()}}
+                for c, (valor, coefs) in sorted(expresiones.items())
+            },
+        }
+    solucion = {nombres[c]: float(valor) for c, (valor, _) in sorted(expresiones.items())}
+    return {"clasificacion": clasificacion, "rango": len(columnas_pivote), "solucion": solucion}
@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+"""
+Servicio local de resolución sobre HTTP/JSON (TCP o socket Unix) con asyncio.
+
+Otros procesos del mismo equipo resuelven sistemas sin importar NumPy ni pagar
+el arranque del paquete:
+
+    POST /resolver      {"ecuaciones": ["2x + 3y = 5", "x - y = 0"]}
+                        {"coeficientes": [[2, 3], [1, -1]], "lados_derechos": [5, 0],
+                         "variables": ["x", "y"]}          ("variables" es opcional)
+                        Cualquiera de los dos admite "exacto": true.
+    GET  /estadisticas  Contadores, lotes y percentiles de latencia.
+    GET  /salud         {"estado": "ok"}
+
+La respuesta es el diccionario de `resolver_ecuaciones`: la clasificación y la
+solución que muestra la GUI, más "variables". Los errores responden
+{"error": mensaje} con código 400 (solicitud inválida), 404, 405, 411, 413
+(cuerpo mayor que el límite), 500 o 503 (servicio saturado, con Retry-After).
+
+Los sistemas pequeños se agrupan por forma en microlotes: el primero de una
+forma abre una ventana de `ventana_lote` segundos y todos los de igual forma
+que lleguen en ella se eliminan juntos con `resolver_sistemas_lote` en un hilo
+de trabajo. Los grandes, los dispersos y los exactos se resuelven de a uno.
+La contrapresión se aplica con un límite de solicitudes en curso: al superarlo
+se responde 503 de inmediato en lugar de encolar sin límite.
+
+Uso:
+    python -m gauss_jordan.servicio [--host 127.0.0.1] [--puerto 8765] [--unix RUTA]
+                                    [--ventana-ms 2] [--max-lote 256] [--max-pendientes 1024]
+                                    [--max-bytes 1048576] [--hilos 0]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .archivos import matriz_aumentada, nombres_predeterminados
+from .cache_ecuaciones import CacheEcuaciones
+from .disperso import SistemaDisperso
+from .interpretacion import analizar_rref, resultado_a_json
+from .lote import resolver_sistemas_lote
+from .resolucion import resolver_ecuaciones, resolver_matriz, resolver_sistema
+
+MAX_CELDAS_LOTE = 64 * 65     # Sistemas hasta este tamaño se agrupan; los mayores ya aprovechan BLAS solos
+MUESTRAS_LATENCIA = 10000     # Latencias recientes sobre las que se calculan los percentiles
+MAX_CABECERAS = 100
+UMBRAL_ANALISIS_EN_HILO = 16384 # Cuerpos mayores (bytes) se analizan fuera del bucle de eventos
+
+_MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+            413: "Payload Too Large", 431: "Request Header Fields Too Large", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+
+class ErrorSolicitud(Exception):
+    """Solicitud HTTP que se responde con un código de error y {"error": mensaje}."""
+    def __init__(self, codigo, mensaje):
+        super().__init__(mensaje)
+        self.codigo = codigo
+        self.mensaje = mensaje
+
+#--------------------------------------------------------------------------
+# Preparación y resolución de sistemas
+#--------------------------------------------------------------------------
+def _preparar_sistema(datos, cache):
+    """
+    Valida el JSON de /resolver y lo convierte en el sistema a resolver.
+
+    Returns:
+        tuple: ("lote", matriz_aumentada, nombres) si se puede agrupar, o
+        ("directo", función sin argumentos que devuelve el resultado).
+
+    Raises:
+        ValueError: Si la solicitud no describe un sistema válido.
+    """
+    if not isinstance(datos, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON.")
+    exacto = bool(datos.get("exacto", False))
+
+    if "ecuaciones" in datos:
+        ecuaciones = datos["ecuaciones"]
+        if not isinstance(ecuaciones, list) or not all(isinstance(ec, str) for ec in ecuaciones):
+            raise ValueError("\"ecuaciones\" debe ser una lista de cadenas.")
+        if exacto:
+            return "directo", lambda: resolver_ecuaciones(ecuaciones, exacto=True, cache=cache)
+        if not ecuaciones:
+            raise ValueError("No se han ingresado ecuaciones para resolver.")
+        variables = {}
+        sistema = SistemaDisperso.desde_ecuaciones(ecuaciones, variables, cache)
+        nombres = sorted(variables, key=variables.get)
+        if len(ecuaciones) * (len(nombres) + 1) <= MAX_CELDAS_LOTE:
+            return "lote", sistema.a_densa(), nombres
+        return "directo", lambda: resolver_sistema(sistema, nombres)
+
+    if "coeficientes" in datos:
+        try:
+            coeficientes = np.asarray(datos["coeficientes"], dtype=float)
+            lados_derechos = np.asarray(datos.get("lados_derechos"), dtype=float)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"\"coeficientes\" y \"lados_derechos\" deben ser numéricos: {e}") from e
+        if coeficientes.ndim != 2 or lados_derechos.shape != (coeficientes.shape[0],):
+            raise ValueError(f"Dimensiones inconsistentes (coeficientes: {coeficientes.shape}, "
+                             f"lados derechos: {lados_derechos.shape}).")
+        if coeficientes.shape[0] == 0:
+            raise ValueError("No se han ingresado ecuaciones para resolver.")
+        nombres = datos.get("variables") or nombres_predeterminados(coeficientes.shape[1])
+        if (not isinstance(nombres, list) or len(nombres) != coeficientes.shape[1]
+                or not all(isinstance(nombre, str) for nombre in nombres)):
+            raise ValueError(f"\"variables\" debe tener {coeficientes.shape[1]} nombres.")
+        if not exacto and coeficientes.size + coeficientes.shape[0] <= MAX_CELDAS_LOTE:
+            return "lote", matriz_aumentada(coeficientes, lados_derechos), list(nombres)
+        return "directo", lambda: resolver_matriz(coeficientes, lados_derechos, nombres, exacto)
+
+    raise ValueError("La solicitud debe tener \"ecuaciones\" o \"coeficientes\" y \"lados_derechos\".")
+
+def _resolver_lote(matrices, nombres_por_sistema):
+    """Elimina juntos sistemas de igual forma y devuelve el resultado de cada uno."""
+    if len(matrices) == 1:
+        return [resolver_matriz(matrices[0][:, :-1], matrices[0][:, -1], nombres_por_sistema[0])]
+    matrices_rref, _, _ = resolver_sistemas_lote(np.stack(matrices))
+    resultados = []
+    for matriz_rref, nombres in zip(matrices_rref, nombres_por_sistema):
+        resultado = analizar_rref(matriz_rref, nombres).a_dict()
+        resultado["variables"] = nombres
+        resultados.append(resultado)
+    return resultados
+
+#--------------------------------------------------------------------------
+# Servicio
+#--------------------------------------------------------------------------
+class ServicioResolucion:
+    """
+    Servidor HTTP/1.1 mínimo (con conexiones persistentes) sobre asyncio.
+
+    La eliminación corre en un grupo de hilos (NumPy libera el GIL), así que
+    el bucle de eventos sólo lee solicitudes, arma los lotes y escribe
+    respuestas.
+
+    Args:
+        ventana_lote (float): Segundos que espera un lote a que lleguen más sistemas de su forma.
+        max_lote (int): Sistemas por lote; al completarse se despacha sin esperar la ventana.
+        max_pendientes (int): Solicitudes en curso antes de responder 503.
+        max_bytes (int): Tamaño máximo del cuerpo de una solicitud.
+        hilos (int, optional): Hilos de trabajo (por defecto, según los núcleos).
+        cache (CacheEcuaciones, optional): Caché de ecuaciones compartida entre solicitudes.
+    """
+    def __init__(self, ventana_lote=0.002, max_lote=256, max_pendientes=1024, max_bytes=1 << 20, hilos=None,
+                 cache=None):
+        self.ventana_lote = ventana_lote
+        self.max_lote = max_lote
+        self.max_pendientes = max_pendientes
+        self.max_bytes = max_bytes
+        self.hilos = hilos or min(4, os.cpu_count() or 1)
+        self.cache = CacheEcuaciones() if cache is None else cache
+        self._ejecutor = None
+        self._servidores = []
+        self._ruta_unix = None
+        self._conexiones = {} # escritor -> tarea que atiende la conexión
+        self._lotes_abiertos = {} # forma -> lista de (matriz, nombres, futuro)
+        self._pendientes = 0
+        self._latencias = deque(maxlen=MUESTRAS_LATENCIA)
+        self._inicio = time.perf_counter()
+        self._contadores = {"solicitudes": 0, "resueltas": 0, "errores": 0, "rechazadas_saturacion": 0,
+                            "rechazadas_tamano": 0, "lotes": 0, "sistemas_en_lotes": 0, "lote_maximo": 0,
+                            "resueltas_directo": 0}
+
+    async def iniciar(self, host="127.0.0.1", puerto=8765, ruta_unix=None):
+        """
+        Empieza a aceptar conexiones en `ruta_unix` (si se indica) o en host:puerto.
+
+        Returns:
+            str: Dirección en la que escucha ("http://host:puerto" o la ruta del socket).
+        """
+        self._ejecutor = ThreadPoolExecutor(self.hilos, thread_name_prefix="gauss_jordan")
+        if ruta_unix is not None:
+            if os.path.exists(ruta_unix):
+                os.unlink(ruta_unix) # Socket de una ejecución anterior
+            servidor = await asyncio.start_unix_server(self._atender, path=ruta_unix)
+            direccion = self._ruta_unix = ruta_unix
+        else:
+            servidor = await asyncio.start_server(self._atender, host, puerto)
+            host, puerto = servidor.sockets[0].getsockname()[:2]
+            direccion = f"http://{host}:{puerto}"
+        self._servidores.append(servidor)
+        return direccion
+
+    async def cerrar(self):
+        """Deja de aceptar conexiones, cierra las abiertas y libera los hilos."""
+        for servidor in self._servidores:
+            servidor.close()
+        tareas = list(self._conexiones.values())
+        for escritor in list(self._conexiones):
+            escritor.close() # Las lecturas pendientes reciben fin de archivo y las tareas terminan
+        await asyncio.gather(*tareas, return_exceptions=True)
+        for servidor in self._servidores:
+            await servidor.wait_closed()
+        self._servidores.clear()
+        if self._ruta_unix is not None and os.path.exists(self._ruta_unix):
+            os.unlink(self._ruta_unix)
+            self._ruta_unix = None
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=True)
+            self._ejecutor = None
+
+    def estadisticas(self):
+        """Contadores, tamaño medio de lote, caché y percentiles de latencia (ms) de las resoluciones recientes."""
+        latencias = np.array(self._latencias) * 1e3
+        percentiles = {}
+        if latencias.size:
+            for nombre, valor in zip(("p50", "p90", "p99", "p999"), np.percentile(latencias, [50, 90, 99, 99.9])):
+                percentiles[nombre] = round(float(valor), 4)
+            percentiles["media"] = round(float(latencias.mean()), 4)
+            percentiles["maxima"] = round(float(latencias.max()), 4)
+        lotes = self._contadores["lotes"]
+        return {
+            **self._contadores,
+            "pendientes": self._pendientes,
+            "max_pendientes": self.max_pendientes,
+            "lote_medio": round(self._contadores["sistemas_en_lotes"] / lotes, 3) if lotes else None,
+            "latencia_ms": percentiles,
+            "muestras_latencia": int(latencias.size),
+            "activo_s": round(time.perf_counter() - self._inicio, 3),
+            "cache": self.cache.estadisticas(),
+        }
+
+    #----------------------------------------------------------------------
+    # Microlotes
+    #----------------------------------------------------------------------
+    def _encolar(self, matriz, nombres):
+        """Agrega el sistema al lote abierto de su forma y devuelve el futuro de su resultado."""
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        forma = matriz.shape
+        lote = self._lotes_abiertos.get(forma)
+        if lote is None:
+            lote = self._lotes_abiertos[forma] = []
+            if self.ventana_lote > 0:
+                loop.call_later(self.ventana_lote, self._despachar, forma, lote)
+            else:
+                loop.call_soon(self._despachar, forma, lote) # Agrupa sólo lo que llegó en la misma vuelta
+        lote.append((matriz, nombres, futuro))
+        if len(lote) >= self.max_lote:
+            self._despachar(forma, lote)
+        return futuro
+
+    def _despachar(self, forma, lote):
+        if self._lotes_abiertos.get(forma) is not lote:
+            return # Ya se despachó por llenarse
+        del self._lotes_abiertos[forma]
+        self._contadores["lotes"] += 1
+        self._contadores["sistemas_en_lotes"] += len(lote)
+        self._contadores["lote_maximo"] = max(self._contadores["lote_maximo"], len(lote))
+        asyncio.ensure_future(self._resolver_lote(lote))
+
+    async def _resolver_lote(self, lote):
+        matrices, nombres, futuros = zip(*lote)
+        try:
+            resultados = await asyncio.get_running_loop().run_in_executor(self._ejecutor, _resolver_lote,
+                                                                          matrices, nombres)
+        except Exception as e: # Un lote que falla responde el error a cada solicitud
+            for futuro in futuros:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        for futuro, resultado in zip(futuros, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+    async def _resolver(self, cuerpo):
+        """Analiza el cuerpo de /resolver y espera el resultado (en un lote o de forma directa)."""
+        loop = asyncio.get_running_loop()
+        try:
+            datos = json.loads(cuerpo)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ErrorSolicitud(400, f"JSON inválido: {e}")
+        try:
+            if len(cuerpo) > UMBRAL_ANALISIS_EN_HILO:
+                preparado = await loop.run_in_executor(self._ejecutor, _preparar_sistema, datos, self.cache)
+            else:
+                preparado = _preparar_sistema(datos, self.cache)
+            if preparado[0] == "lote":
+                return await self._encolar(preparado[1], preparado[2])
+            self._contadores["resueltas_directo"] += 1
+            return await loop.run_in_executor(self._ejecutor, preparado[1])
+        except ValueError as e:
+            raise ErrorSolicitud(400, str(e))
+
+    #----------------------------------------------------------------------
+    # HTTP
+    #----------------------------------------------------------------------
+    async def _leer_solicitud(self, lector):
+        """
+        Lee una solicitud HTTP/1.x.
+
+        Returns:
+            tuple: (método, ruta, cabeceras, cuerpo, mantener_conexion), o None si el cliente cerró.
+        """
+        linea = await lector.readline()
+        if not linea:
+            return None
+        partes = linea.decode("latin-1").split()
+        if len(partes) != 3 or not partes[2].startswith("HTTP/1."):
+            raise ErrorSolicitud(400, "Línea de solicitud inválida.")
+        metodo, ruta, version = partes
+        cabeceras = {}
+        while True:
+            linea = await lector.readline()
+            if linea in (b"\r\n", b"\n", b""):
+                break
+            if len(cabeceras) >= MAX_CABECERAS:
+                raise ErrorSolicitud(431, "Demasiadas cabeceras.")
+            nombre, _, valor = linea.decode("latin-1").partition(":")
+            cabeceras[nombre.strip().lower()] = valor.strip()
+
+        conexion = cabeceras.get("connection", "").lower()
+        mantener = conexion != "close" if version == "HTTP/1.1" else conexion == "keep-alive"
+        if "transfer-encoding" in cabeceras:
+            raise ErrorSolicitud(411, "Se requiere Content-Length (no se admite Transfer-Encoding).")
+        try:
+            longitud = int(cabeceras.get("content-length", "0"))
+        except ValueError:
+            raise ErrorSolicitud(400, "Content-Length inválido.")
+        if longitud < 0:
+            raise ErrorSolicitud(400, "Content-Length inválido.")
+        if longitud > self.max_bytes:
+            self._contadores["rechazadas_tamano"] += 1
+            raise ErrorSolicitud(413, f"El cuerpo ({longitud} bytes) supera el límite de {self.max_bytes} bytes.")
+        cuerpo = await lector.readexactly(longitud) if longitud else b""
+        return metodo, ruta.split("?", 1)[0], cabeceras, cuerpo, mantener
+
+    async def _responder(self, escritor, codigo, datos, mantener=True, extra=""):
+        cuerpo = resultado_a_json(datos).encode("utf-8")
+        cabecera = (f"HTTP/1.1 {codigo} {_MOTIVOS.get(codigo, '')}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(cuerpo)}\r\n"
+                    f"Connection: {'keep-alive' if mantener else 'close'}\r\n{extra}\r\n")
+        escritor.write(cabecera.encode("latin-1") + cuerpo)
+        await escritor.drain() # Contrapresión de escritura: no se acumulan respuestas para un cliente lento
+
+    async def _atender(self, lector, escritor):
+        """Atiende las solicitudes de una conexión, una tras otra, hasta que el cliente la cierre."""
+        self._conexiones[escritor] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    solicitud = await self._leer_solicitud(lector)
+                except ErrorSolicitud as e: # El resto de la conexión ya no se puede interpretar
+                    await self._responder(escritor, e.codigo, {"error": e.mensaje}, mantener=False)
+                    return
+                if solicitud is None:
+                    return
+                inicio = time.perf_counter()
+                metodo, ruta, _, cuerpo, mantener = solicitud
+                codigo, datos, extra = await self._despachar_ruta(metodo, ruta, cuerpo)
+                await self._responder(escritor, codigo, datos, mantener, extra)
+                if ruta == "/resolver" and codigo == 200: # Los rechazos inmediatos no cuentan como latencia de resolución
+                    self._latencias.append(time.perf_counter() - inicio)
+                if not mantener:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            pass # Cliente desconectado a mitad de una solicitud o línea demasiado larga
+        finally:
+            self._conexiones.pop(escritor, None)
+            escritor.close()
+
+    async def _despachar_ruta(self, metodo, ruta, cuerpo):
+        """Devuelve (código, datos JSON, cabeceras extra) de una solicitud ya leída."""
+        if ruta == "/salud":
+            return (200, {"estado": "ok"}, "") if metodo == "GET" else (405, {"error": "Use GET."}, "Allow: GET\r\n")
+        if ruta == "/estadisticas":
+            if metodo != "GET":
+                return 405, {"error": "Use GET."}, "Allow: GET\r\n"
+            return 200, self.estadisticas(), ""
+        if ruta != "/resolver":
+            return 404, {"error": f"Ruta desconocida: {ruta}"}, ""
+        if metodo != "POST":
+            return 405, {"error": "Use POST."}, "Allow: POST\r\n"
+
+        self._contadores["solicitudes"] += 1
+        if self._pendientes >= self.max_pendientes:
+            self._contadores["rechazadas_saturacion"] += 1
+            return 503, {"error": "Servicio saturado; reintente más tarde."}, "Retry-After: 1\r\n"
+        self._pendientes += 1
+        try:
+            resultado = await self._resolver(cuerpo)
+        except ErrorSolicitud as e:
+            self._contadores["errores"] += 1
+            return e.codigo, {"error": e.mensaje}, ""
+        except Exception as e: # El servicio sigue atendiendo aunque falle un sistema
+            self._contadores["errores"] += 1
+            return 500, {"error": f"Error interno: {e}"}, ""
+        finally:
+            self._pendientes -= 1
+        self._contadores["resueltas"] += 1
+        return 200, resultado, ""
+
+#--------------------------------------------------------------------------
+# Ejecución como programa
+#--------------------------------------------------------------------------
+async def servir(servicio, host="127.0.0.1", puerto=8765, ruta_unix=None, listo=None):
+    """Ejecuta el servicio hasta que se cancele; llama a `listo(direccion)` cuando ya acepta conexiones."""
+    direccion = await servicio.iniciar(host, puerto, ruta_unix)
+    if listo is not None:
+        listo(direccion)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await servicio.cerrar()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m gauss_jordan.servicio",
+                                     description="Servicio local de resolución de sistemas sobre HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765, help="Puerto TCP (0 = uno libre cualquiera).")
+    parser.add_argument("--unix", default=None, metavar="RUTA", help="Escucha en un socket Unix en lugar de TCP.")
+    parser.add_argument("--ventana-ms", type=float, default=2.0,
+                        help="Espera de un microlote por más sistemas de su forma (0 = sin espera).")
+    parser.add_argument("--max-lote", type=int, default=256)
+    parser.add_argument("--max-pendientes", type=int, default=1024, help="Solicitudes en curso antes de responder 503.")
+    parser.add_argument("--max-bytes", type=int, default=1 << 20, help="Tamaño máximo del cuerpo de una solicitud.")
+    parser.add_argument("--hilos", type=int, default=0, help="Hilos de trabajo (0 = según los núcleos).")
+    args = parser.parse_args(argv)
+
+    servicio = ServicioResolucion(args.ventana_ms / 1000, args.max_lote, args.max_pendientes, args.max_bytes,
+                                  args.hilos or None)
+    def listo(direccion):
+        print(f"Escuchando en {direccion}", flush=True)
+    try:
+        asyncio.run(servir(servicio, args.host, args.puerto, args.unix, listo))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Pruebas del modo por lotes: los errores de cada sistema se escriben como una línea y el lote sigue."""
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+from gauss_jordan.cli import resolver_archivo_binario, resolver_flujo
+
+class PruebasErroresPorSistema(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def resolver_binario(self, ruta):
+        salida = io.StringIO()
+        sistemas, _, errores = resolver_archivo_binario(ruta, salida)
+        return sistemas, errores, json.loads(salida.getvalue())
+
+    def test_archivos_inexistentes(self):
+        for nombre in ("no_existe.npz", "no_existe.mtx"):
+            sistemas, errores, linea = self.resolver_binario(self.ruta(nombre))
+            self.assertEqual((sistemas, errores), (1, 1))
+            self.assertIn(nombre, linea["error"])
+
+    def test_npz_truncado_o_danado(self):
+        for comprimir in (True, False):
+            ruta = self.ruta(f"sistema_{comprimir}.npz")
+            gj.guardar_sistema_npz(ruta, np.random.default_rng(0).random((60, 60)), np.ones(60), comprimir=comprimir)
+            with open(ruta, "rb") as archivo:
+                datos = bytearray(archivo.read())
+            truncado, danado = self.ruta("truncado.npz"), self.ruta("danado.npz")
+            with open(truncado, "wb") as archivo:
+                archivo.write(datos[:len(datos) // 2])
+            datos[100:2100] = bytes(2000)
+            with open(danado, "wb") as archivo:
+                archivo.write(datos)
+            for ruta in (truncado, danado):
+                sistemas, errores, linea = self.resolver_binario(ruta)
+                self.assertEqual((sistemas, errores), (1, 1))
+                self.assertIn("error", linea)
+
+    def test_matrix_market_truncado(self):
+        ruta = self.ruta("truncado.mtx")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("%%MatrixMarket matrix coordinate real general\n2 3 4\n1 1 1\n")
+        _, errores, linea = self.resolver_binario(ruta)
+        self.assertEqual(errores, 1)
+        self.assertIn("error", linea)
+
+    def test_error_de_analisis_no_detiene_el_flujo(self):
+        salida = io.StringIO()
+        sistemas, _, errores = resolver_flujo(["x + y = 2", "x - y = 0", "", "x + = 1", "", "2x = 4"], salida)
+        lineas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual((sistemas, errores), (3, 1))
+        self.assertEqual([linea["sistema"] for linea in lineas], [0, 1, 2])
+        self.assertIn("error", lineas[1])
+        self.assertEqual(lineas[2]["solucion"], {"x": 2.0})
+
+if __name__ == "__main__":
+    unittest.main()
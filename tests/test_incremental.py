@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de SistemaIncremental: tras cada ecuación agregada o quitada, la RREF
+mantenida debe coincidir con la de `eliminacion_gauss_jordan` sobre las
+ecuaciones que quedan.
+
+Uso:
+    python -m pytest tests        (o python -m unittest discover tests)
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import gauss_jordan as gj
+from gauss_jordan.analizador import coeficientes_ecuacion
+
+# Quitar una ecuación dejaba un pivote en x1 (usada sólo por ella) y lanzaba KeyError
+SECUENCIA_PIVOTE_HUERFANO = [
+    "-0.56661x1 = -2", 0, "640.0373x1 = -1", 0, "82.66227x0 + 2.09848x1 = -2", "0.00703x0 + 316.47301x1 = 2",
+    1, 0, "-201.79012x1 = -3", 0, "-0.00161x0 + -0.02472x1 = -4", "0.1097x0 + -0.3484x1 = -3",
+    "0.53939x1 + -289.06964x0 = -4", "-1193.46967x0 + -0.0389x1 = 3", "-7e-05x1 = 0", 2, 3, "1e-05x1 = 1",
+    "0.19631x0 = 1", 0, 0, "-8.73483x0 + 739.0808x1 = -3", 0, 1, 1,
+]
+
+def matriz_de(sistema):
+    """Matriz aumentada de las ecuaciones que quedan, con las columnas en el orden del sistema."""
+    variables = {nombre: c for c, nombre in enumerate(sistema.nombres_variables())}
+    matriz = np.zeros((len(sistema.ecuaciones), len(variables) + 1))
+    for fila, ec in enumerate(sistema.ecuaciones):
+        coeficientes, lado_derecho = coeficientes_ecuacion(ec, dict(variables))
+        matriz[fila, list(coeficientes)] = list(coeficientes.values())
+        matriz[fila, -1] = lado_derecho
+    return matriz
+
+def aplicar(sistema, operacion):
+    """Un entero quita esa ecuación; una cadena se agrega."""
+    if isinstance(operacion, str):
+        sistema.agregar_ecuacion(operacion)
+    else:
+        sistema.eliminar_ecuacion(operacion)
+
+class PruebasSistemaIncremental(unittest.TestCase):
+
+    def comprobar_recalculo(self, sistema):
+        """Compara la clasificación y, si es consistente, la RREF con un recálculo completo."""
+        if not sistema.ecuaciones:
+            return
+        nombres = sistema.nombres_variables()
+        referencia = gj.eliminacion_gauss_jordan(matriz_de(sistema))
+        clasificacion = gj.interpretar_rref(referencia, nombres)["clasificacion"]
+        self.assertEqual(sistema.clasificacion(), clasificacion, sistema.ecuaciones)
+        if clasificacion != gj.SISTEMA_INCONSISTENTE: # Con filas [0 ... 0 | k] el valor de k no es único
+            np.testing.assert_allclose(sistema.rref(), referencia, rtol=0,
+                                       atol=1e-6 * max(1.0, np.abs(referencia).max()), err_msg=str(sistema.ecuaciones))
+
+    def test_agregar_y_quitar_coincide_con_recalculo(self):
+        rng = np.random.default_rng(0)
+        for caso in range(300):
+            sistema = gj.SistemaIncremental()
+            num_variables = int(rng.integers(1, 7))
+            for _ in range(int(rng.integers(1, 30))):
+                if sistema.ecuaciones and rng.random() < 0.4:
+                    aplicar(sistema, int(rng.integers(len(sistema.ecuaciones))))
+                else:
+                    k = int(rng.integers(1, num_variables + 1))
+                    columnas = rng.choice(num_variables, k, replace=False)
+                    valores = rng.integers(-4, 5, k) if caso % 2 else np.round(rng.normal(size=k), 3)
+                    terminos = " + ".join(f"{v}x{c}" for v, c in zip(valores, columnas))
+                    aplicar(sistema, f"{terminos} = {rng.integers(-5, 6)}")
+                self.comprobar_recalculo(sistema)
+
+    def test_quitar_variable_exclusiva_con_redondeo(self):
+        sistema = gj.SistemaIncremental()
+        for operacion in SECUENCIA_PIVOTE_HUERFANO:
+            aplicar(sistema, operacion)
+            self.comprobar_recalculo(sistema)
+
+    def test_indice_invalido_no_modifica_el_sistema(self):
+        sistema = gj.SistemaIncremental()
+        for ec in ("x + y = 3", "x - y = 1", "2x + 2y = 6"):
+            sistema.agregar_ecuacion(ec)
+        rref = sistema.rref()
+        for indice in (-1, 3, 10):
+            with self.assertRaises(IndexError):
+                sistema.eliminar_ecuacion(indice)
+        self.assertEqual(len(sistema.ecuaciones), 3)
+        np.testing.assert_array_equal(sistema.rref(), rref)
+        sistema.eliminar_ecuacion(2)
+        self.comprobar_recalculo(sistema)
+
+    def test_muchas_ecuaciones_amplian_los_buferes(self):
+        sistema = gj.SistemaIncremental()
+        for k in range(40):
+            sistema.agregar_ecuacion(f"x{k} + 2x{k + 1} = {k}")
+        while len(sistema.ecuaciones) > 5:
+            sistema.eliminar_ecuacion(len(sistema.ecuaciones) // 2)
+            self.comprobar_recalculo(sistema)
+
+if __name__ == "__main__":
+    unittest.main()